@@ -1,142 +1,309 @@
-from flask import request, redirect, render_template_string
+from flask import request, redirect, current_app
+import hashlib
 import json
 import os
+import re
 import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from utils.compression import MIN_SIZE, compress_variants, encoded_response
+from utils.page_cache import CachedPage
+from utils.not_found import miss_counter
 
-# 配置日志
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, 'static', 'game-config', 'games.json')
+TEMPLATE_PATHS = [
+    os.path.join(BASE_DIR, 'static', 'game-templates', 'game-template.html'),
+    # 旧部署中的模板位置
+    os.path.join(BASE_DIR, 'bearclicker-vercel', 'public', 'game-template.html'),
+]
+
+DEFAULT_CONFIG = {"games": [], "brandName": "Bear Clicker", "brandUrl": "https://bearclicker.net"}
+ERROR_TEMPLATE = '<!DOCTYPE html><html><body><h1>Error loading template</h1></body></html>'
+# 未知 id 的 404 正文：预先编码，不拼接请求中的 id（也避免把用户输入原样写回页面）
+NOT_FOUND_BODY = b'Game not found'
+
+# 模板中的占位符，例如 {{GAME_TITLE}}
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([A-Z_]+)\}\}')
+PLACEHOLDERS = ('GAME_TITLE', 'GAME_URL', 'DOMAIN_DISPLAY', 'DOMAIN_LINK')
+
+# 播放页只取决于游戏配置和品牌设置，可以交给 CDN 缓存；文件变化后靠 stale-while-revalidate 在后台更新
+CACHE_CONTROL = os.getenv('GAME_CACHE_CONTROL', 'public, max-age=300, s-maxage=86400, stale-while-revalidate=604800')
+
+# GAME_API_DEBUG=1 时输出每个请求的详细日志，并在页面中插入调试注释
+DEBUG = os.getenv('GAME_API_DEBUG', '0') == '1'
+if DEBUG:
+    logging.basicConfig(level=logging.INFO)
+    logger.setLevel(logging.DEBUG)
+
+
 # 读取游戏配置文件
 def load_game_config():
     try:
-        # 直接从新路径加载配置文件
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'game-config', 'games.json')
-        logger.info(f"从新路径读取配置文件: {config_path}")
-        
-        # 检查文件是否存在
-        if not os.path.exists(config_path):
-            logger.error(f"配置文件不存在: {config_path}")
-            return {"games": [], "brandName": "Bear Clicker", "brandUrl": "https://bearclicker.net"}
-        
-        # 读取并解析配置文件
-        with open(config_path, 'r', encoding='utf-8') as f:
+        if not os.path.exists(CONFIG_PATH):
+            logger.error(f"配置文件不存在: {CONFIG_PATH}")
+            return DEFAULT_CONFIG
+
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
             config = json.load(f)
-        
-        # 记录游戏列表
-        game_ids = [game['id'] for game in config['games']]
-        logger.info(f"配置加载成功, 包含 {len(config['games'])} 个游戏: {', '.join(game_ids[:5])}...等")
+
+        logger.info(f"配置加载成功, 包含 {len(config['games'])} 个游戏")
         return config
     except Exception as e:
         logger.error(f"加载配置文件失败: {str(e)}")
-        return {"games": [], "brandName": "Bear Clicker", "brandUrl": "https://bearclicker.net"}
+        return DEFAULT_CONFIG
+
 
 # 读取游戏模板文件
 def load_template():
     try:
-        # 首先尝试从新路径加载
-        template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'game-templates', 'game-template.html')
-        logger.info(f"尝试从新路径读取模板文件: {template_path}")
-        
-        # 如果新路径不存在，尝试从原始路径加载
-        if not os.path.exists(template_path):
-            template_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'bearclicker-vercel', 'public', 'game-template.html')
-            logger.info(f"尝试从原始路径读取模板文件: {template_path}")
-        
+        # 新路径不存在时尝试旧路径
+        template_path = next((path for path in TEMPLATE_PATHS if os.path.exists(path)), TEMPLATE_PATHS[0])
         with open(template_path, 'r', encoding='utf-8') as f:
             template_content = f.read()
-        logger.info("模板加载成功")
+        logger.info(f"模板加载成功: {template_path}")
         return template_content
     except Exception as e:
         logger.error(f"加载模板文件失败: {str(e)}")
-        return '<!DOCTYPE html><html><body><h1>Error loading template</h1></body></html>'
+        return ERROR_TEMPLATE
 
-# 游戏API处理函数
-def game_api(game_id=None):
-    try:
-        # 记录请求信息
-        logger.info("\n--- 新请求 ---")
-        logger.info(f"请求URL: {request.url}")
-        logger.info(f"请求方法: {request.method}")
-        logger.info(f"请求域名: {request.host}")
-        
-        # 加载配置和模板
-        config = load_game_config()
-        template_content = load_template()
-        
-        logger.info(f"配置域名: {config.get('domain', 'game.bearclicker.net')}")
-        logger.info(f"Referer: {request.referrer or 'none'}")
-        logger.info(f"User-Agent: {request.user_agent.string}")
-        
-        # 如果没有传入game_id，则从查询参数中获取
-        if game_id is None:
-            game_id = request.args.get('gameId')
-        logger.info(f"原始游戏ID: {game_id}")
-        
-        # 清理游戏ID，移除.html后缀和非法字符
-        if game_id:
-            game_id_clean = game_id.replace('.html', '')
-            # 移除非字母、数字、连字符和下划线的字符
-            game_id_clean = ''.join(c for c in game_id_clean if c.isalnum() or c in '-_')
+
+def compile_template(template_content):
+    """
+    把模板按占位符切分成 UTF-8 字节片段
+
+    Returns:
+        list: 字节片段和占位符名交替出现，奇数位置是占位符名，例如 [b'<title>', 'GAME_TITLE', b'</title>']
+    """
+    segments = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(template_content):
+        if match.group(1) not in PLACEHOLDERS:
+            continue
+        segments.append(template_content[position:match.start()].encode('utf-8'))
+        segments.append(match.group(1))
+        position = match.end()
+    segments.append(template_content[position:].encode('utf-8'))
+    return segments
+
+
+class GameSnapshot:
+    """
+    某一版本的 games.json 和模板
+
+    重新加载时整体替换，读取方拿到的 config、games、segments 和页面缓存总是来自同一版本。
+    """
+    __slots__ = ('config', 'games', 'ids', 'segments', 'last_modified', 'pages')
+
+    def __init__(self, config, template_content, last_modified=None):
+        self.config = config
+        self.games = {game['id']: game for game in config.get('games', [])}
+        self.ids = frozenset(self.games)
+        self.segments = compile_template(template_content)
+        self.last_modified = last_modified
+        self.pages = {}
+
+
+class GameEngine:
+    """
+    预加载的游戏播放页引擎
+
+    games.json 和模板只在文件变化时重新加载（最多每 check_interval 秒 stat 一次）；
+    游戏按 id 建立字典索引，模板切分成片段后按 id 拼接出页面。
+    拼接好的页面连同 ETag 和压缩版本按 id 缓存在当前 GameSnapshot 中，重新加载时随快照一起替换。
+    """
+
+    def __init__(self, config_path=CONFIG_PATH, template_paths=TEMPLATE_PATHS, check_interval=1.0):
+        self.config_path = config_path
+        self.template_paths = list(template_paths)
+        self.check_interval = check_interval
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._snapshot = GameSnapshot(DEFAULT_CONFIG, ERROR_TEMPLATE)
+        self.reloads = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def config(self):
+        return self._snapshot.config
+
+    @property
+    def ids(self):
+        return self._snapshot.ids
+
+    def _file_signature(self):
+        signature = []
+        for path in [self.config_path] + self.template_paths:
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def _reload(self, signature):
+        newest = max((mtime for _, mtime, _ in signature if mtime), default=0)
+        # 先完整构建新快照，再用一次赋值替换，读取方不会看到新旧混合的状态
+        self._snapshot = GameSnapshot(load_game_config(), load_template(),
+                                      datetime.fromtimestamp(newest / 1e9, tz=timezone.utc))
+        self.reloads += 1
+
+    def snapshot(self):
+        """
+        文件有变化时重新加载配置和模板，返回当前快照
+
+        Returns:
+            GameSnapshot: 一次请求内应只使用这一个快照
+        """
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.check_interval:
+            return self._snapshot
+        with self._lock:
+            if self._signature is None or now - self._checked_at >= self.check_interval:
+                signature = self._file_signature()
+                if signature != self._signature:
+                    self._reload(signature)
+                    self._signature = signature
+                self._checked_at = now
+            return self._snapshot
+
+    def refresh(self):
+        """文件有变化时重新加载配置和模板"""
+        self.snapshot()
+
+    def contains(self, game_id):
+        """id 是否在当前 games.json 中"""
+        return game_id in self.snapshot().ids
+
+    def get_game(self, game_id):
+        return self.snapshot().games.get(game_id)
+
+    def render(self, game_config, snapshot=None):
+        """
+        按片段拼接游戏页面
+
+        Args:
+            game_config (dict): 游戏配置
+            snapshot (GameSnapshot): 模板和品牌设置所在的快照，默认当前快照
+
+        Returns:
+            bytes: UTF-8 编码的 HTML
+        """
+        snapshot = snapshot or self._snapshot
+        values = {
+            'GAME_TITLE': game_config['title'],
+            'GAME_URL': game_config['url'],
+            'DOMAIN_DISPLAY': snapshot.config.get('brandName', 'Bear Clicker'),
+            'DOMAIN_LINK': snapshot.config.get('brandUrl', 'https://bearclicker.net'),
+        }
+        segments = snapshot.segments
+        parts = list(segments)
+        for i in range(1, len(parts), 2):
+            parts[i] = values[segments[i]].encode('utf-8')
+        return b''.join(parts)
+
+    def page(self, game_id, snapshot=None):
+        """
+        返回缓存的播放页，同一数据版本内每个游戏只拼接和压缩一次
+
+        Args:
+            game_id (str): 游戏 id
+            snapshot (GameSnapshot): 已取得的快照，默认重新检查文件后取当前快照
+
+        Returns:
+            CachedPage | None: 游戏不存在时返回 None
+        """
+        snapshot = snapshot or self.snapshot()
+        page = snapshot.pages.get(game_id)
+        if page is None:
+            game_config = snapshot.games.get(game_id)
+            if game_config is None:
+                return None
+            body = self.render(game_config, snapshot)
+            variants = compress_variants(body, brotli_quality=6) if len(body) >= MIN_SIZE else None
+            page = CachedPage(body, 'text/html', hashlib.sha1(body).hexdigest(), snapshot.last_modified, variants)
+            snapshot.pages[game_id] = page
+            self.misses += 1
         else:
-            game_id_clean = ''
-        logger.info(f"清理后的游戏ID: {game_id_clean}")
-        
-        # 查找游戏配置
-        game_config = next((g for g in config['games'] if g['id'] == game_id_clean), None)
-        
-        # 如果找不到游戏配置，返回404
-        if not game_config:
-            logger.info(f"未找到游戏配置: {game_id_clean}")
-            return f"Game not found: {game_id_clean}", 404
-        
-        logger.info(f"找到游戏: {game_config['title']}")
-        logger.info(f"游戏URL: {game_config['url']}")
-        
-
-        
-        # 检查请求路径
-        logger.info(f"请求路径: {request.path}")
-        
-        # 检查是否是本地测试环境
-        is_local_testing = request.host in ['localhost:3007', '127.0.0.1:3007']
-        logger.info(f"是否本地测试: {is_local_testing}")
-        
-        # 如果是本地测试环境，使用游戏模板
-        # 如果是线上环境，则根据路径判断：/game/前缀的请求使用游戏模板
-        is_game_request = is_local_testing or request.path.startswith('/game/')
-        logger.info(f"是否游戏请求: {is_game_request}")
-        
-        # 如果不是游戏请求，重定向到主站对应的页面
-        if not is_game_request and not is_local_testing:
-            redirect_url = f"{config.get('brandUrl', 'https://bearclicker.net')}/{game_id_clean}"
-            logger.info(f"非游戏请求，重定向到主站: {redirect_url}")
-            return redirect(redirect_url, code=302)
-        
-        # 替换模板中的占位符
-        html = template_content
-        html = html.replace('{{GAME_TITLE}}', game_config['title'])
-        html = html.replace('{{GAME_URL}}', game_config['url'])
-        html = html.replace('{{DOMAIN_DISPLAY}}', config.get('brandName', 'Bear Clicker'))
-        html = html.replace('{{DOMAIN_LINK}}', config.get('brandUrl', 'https://bearclicker.net'))
-        
-        # 添加调试信息到HTML
-        debug_info = f"""
+            self.hits += 1
+        return page
+
+    def stats(self):
+        """返回播放页缓存统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._snapshot.pages),
+            'reloads': self.reloads,
+        }
+
+
+engine = GameEngine()
+
+
+def clean_game_id(game_id):
+    """移除 .html 后缀和非字母、数字、连字符、下划线的字符"""
+    if not game_id:
+        return ''
+    game_id = game_id.replace('.html', '')
+    return ''.join(c for c in game_id if c.isalnum() or c in '-_')
+
+
+def _debug_comment(game_id, game_config):
+    return f"""
           <!-- Debug Info:
           Request URL: {request.url}
-          Game ID: {game_id_clean}
+          Game ID: {game_id}
           Game Title: {game_config['title']}
           Game URL: {game_config['url']}
           Host: {request.host}
-          Timestamp: {__import__('datetime').datetime.now().isoformat()}
+          Timestamp: {datetime.now().isoformat()}
           -->
         """
-        html = html.replace('</head>', f"{debug_info}</head>")
-        
-        logger.info('响应准备完成，发送HTML')
-        
-        # 返回HTML响应
-        return html
+
+
+# 游戏API处理函数
+def game_api(game_id=None):
+    try:
+        # 如果没有传入game_id，则从查询参数中获取
+        if game_id is None:
+            game_id = request.args.get('gameId')
+        game_id_clean = clean_game_id(game_id)
+        logger.debug(f"游戏请求: {request.url} -> {game_id_clean}")
+
+        # 整个请求只使用同一个快照，games.json 在请求中途重新加载也不会出现新旧混合
+        snapshot = engine.snapshot()
+        # 未知 id 只做一次字典查找就返回 404
+        game_config = snapshot.games.get(game_id_clean)
+        miss_counter.record('game', game_config is not None)
+        if game_config is None:
+            logger.debug(f"未找到游戏配置: {game_id_clean}")
+            return current_app.response_class(NOT_FOUND_BODY, status=404, mimetype='text/plain')
+
+        # 本地测试环境和 /game/ 前缀的请求使用游戏模板，其余重定向到主站对应的页面
+        is_local_testing = request.host in ['localhost:3007', '127.0.0.1:3007']
+        if not is_local_testing and not request.path.startswith('/game/'):
+            redirect_url = f"{snapshot.config.get('brandUrl', 'https://bearclicker.net')}/{game_id_clean}"
+            logger.debug(f"非游戏请求，重定向到主站: {redirect_url}")
+            return redirect(redirect_url, code=302)
+
+        if DEBUG:
+            html = engine.render(game_config, snapshot).replace(
+                b'</head>', f"{_debug_comment(game_id_clean, game_config)}</head>".encode('utf-8'))
+            response = current_app.response_class(html, mimetype='text/html')
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+
+        page = engine.page(game_id_clean, snapshot)
+        response = encoded_response(page.body, page.mimetype, page.etag, page.variants, page.last_modified)
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
     except Exception as e:
         logger.error(f"处理请求时出错: {str(e)}")
         logger.exception(e)
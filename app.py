@@ -1,10 +1,9 @@
-from flask import Flask, render_template, request, flash, redirect, url_for, send_from_directory, session, g
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from flask import Flask, render_template, request, flash, redirect, url_for, session, g, jsonify, make_response
+import threading
 import os
 from dotenv import load_dotenv
 import json
+import hashlib
 import logging
 
 load_dotenv()
@@ -14,17 +13,52 @@ app.secret_key = os.getenv('SECRET_KEY', 'bearclicker-secret-key-2024')
 
 # 导入日志配置
 from config.logging_config import setup_logging
+from utils.game_registry import load_game_pages
+from utils.data_cache import data_cache
+from utils.faq_store import FaqStore
+from utils.page_cache import PageCache, WatchedFiles
+from utils.trending import CATALOG_FIELDS, TrendingGrid
+from utils.template_cache import install as install_template_cache
+from utils.not_found import NotFoundPage, miss_counter
+from utils.search import Autocomplete, SiteSearch, template_description
+from utils.metrics import (CONTENT_TYPE as METRICS_CONTENT_TYPE, UNMATCHED, Metrics, cache_collector, lookup_collector,
+                           set_route)
+from utils.compression import (MIN_SIZE, SUPPORTED_ENCODINGS, compress, compress_response,
+                               encoded_response, negotiate, send_compressed)
 
 # 设置日志系统
 setup_logging(app)
 
+# 从构建时预编译的目录加载模板字节码（python -m utils.template_cache）
+install_template_cache(app)
+
+# 静态文件优先发送构建时生成的 .br / .gz，其余动态响应按需 gzip
+def static_file(filename):
+    return send_compressed(app.static_folder, filename, max_age=app.get_send_file_max_age(filename))
+
+app.view_functions['static'] = static_file
+
+app.after_request(compress_response)
+
+# 按路由统计请求数、状态码和耗时，/metrics 以 Prometheus 文本格式导出，各阶段耗时同时写入 Server-Timing 头
+# 多 worker 部署时设置 METRICS_MULTIPROC_DIR（所有 worker 共用的目录）汇总各进程的数据
+metrics = Metrics(multiproc_dir=os.getenv('METRICS_MULTIPROC_DIR') or None,
+                  flush_interval=float(os.getenv('METRICS_FLUSH_INTERVAL', '5')),
+                  server_timing=os.getenv('SERVER_TIMING', '1') != '0')
+metrics.init_app(app)
+
+# 设置 PROFILE_SECRET 后，带签名的请求会被单独剖析（python -m utils.profiling sign <path>）
+if os.getenv('PROFILE_SECRET'):
+    from utils.profiling import profiler_from_env
+    app.wsgi_app = profiler_from_env(app.wsgi_app, app.instance_path)
+
+@metrics.timed('data_load')
 def get_translations():
     """Get translations dictionary."""
     try:
         translations_path = os.path.join(app.static_folder, 'data', 'translations.json')
-        with open(translations_path, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-            return translations.get('en', {})
+        # 进程内缓存，文件未变化时不会重复解析
+        return data_cache.get(translations_path).get('en', {})
     except Exception as e:
         app.logger.error(f"Error getting translations: {e}")
         return {
@@ -55,23 +89,28 @@ def get_translations():
             }
         }
 
-def load_faqs():
-    """
-    从JSON文件加载FAQ数据
-    
-    Returns:
-        dict: FAQ数据字典
-    """
-    try:
-        faqs_path = os.path.join(app.static_folder, 'data', 'faqs.json')
-        
-        with open(faqs_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        app.logger.error(f"Error loading FAQs: {e}")
-        # 返回空字典作为默认值
-        return {}
-
+# FAQ 存储：按 slug 偏移索引只解码当前页面的那一条记录
+faq_store = FaqStore(os.path.join(app.static_folder, 'data'))
+
+# 页面渲染缓存：模板目录、封面图目录（决定卡片图片是 .jpg 还是 .png）或数据文件变化后自动失效
+TEMPLATES_DIR = os.path.join(app.root_path, app.template_folder)
+GAMES_JSON_PATH = os.path.join(app.static_folder, 'game-config', 'games.json')
+GAME_IMAGES_DIR = os.path.join(app.static_folder, 'images', 'games')
+page_cache = PageCache(
+    WatchedFiles(
+        directories=[TEMPLATES_DIR, os.path.join(TEMPLATES_DIR, 'components'), GAME_IMAGES_DIR],
+        files=[
+            os.path.join(app.static_folder, 'data', 'translations.json'),
+            GAMES_JSON_PATH,
+            faq_store.records_path,
+            faq_store.index_path,
+        ]
+    ),
+    max_entries=int(os.getenv('PAGE_CACHE_MAX_ENTRIES', '1000')),
+    max_bytes=int(os.getenv('PAGE_CACHE_MAX_MB', '100')) * 1024 * 1024
+)
+
+@metrics.timed('data_load')
 def get_faqs_for_page(page_name):
     """
     获取特定页面的FAQ数据
@@ -82,18 +121,23 @@ def get_faqs_for_page(page_name):
     Returns:
         dict: 包含FAQ问答和结论的字典
     """
-    faqs_data = load_faqs()
+    try:
+        faq_data = faq_store.get(page_name)
+    except Exception as e:
+        app.logger.error(f"Error loading FAQs for {page_name}: {e}")
+        faq_data = None
     
     # 如果找不到对应页面的FAQ，返回默认值
-    if page_name not in faqs_data:
+    if faq_data is None:
         return {
             'faqs': [],
             'conclusion': ''
         }
     
-    return faqs_data[page_name]
+    return faq_data
 
 @app.route('/')
+@page_cache.cached
 def home():
     translations_data = get_translations()
     faq_data = get_faqs_for_page('index')  
@@ -188,6 +232,7 @@ def contact():
                          })
 
 @app.route('/faq')
+@page_cache.cached
 def faq():
     try:
         trans = get_translations()
@@ -216,3169 +261,425 @@ def faq():
 
 @app.route('/sitemap.xml')
 def sitemap():
-    return send_from_directory('static', 'sitemap.xml')
+    return send_compressed('static', 'sitemap.xml')
 @app.route('/79b10f40ab4848b5a84b4d154927ed13.txt')
 def indexnow():
-    return send_from_directory('static', '79b10f40ab4848b5a84b4d154927ed13.txt')
+    return send_compressed('static', '79b10f40ab4848b5a84b4d154927ed13.txt')
 
 @app.route('/robots.txt')
 def robots():
-    return send_from_directory('static', 'robots.txt')
+    return send_compressed('static', 'robots.txt')
 
 @app.route('/ads.txt')
 def ads_txt():
-    return send_from_directory('static', 'ads.txt')
-
-@app.route('/capybara-clicker')
-def capybara_clicker():
-    faq_data = get_faqs_for_page('capybara-clicker')
-    return render_template('capybara-clicker.html',
-                         page_title='Capybara Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/stimulation-clicker')
-def stimulation_clicker():
-    faq_data = get_faqs_for_page('stimulation-clicker')
-    return render_template('stimulation-clicker.html',
-                         page_title='Stimulation Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations()) 
-@app.route('/unchill-guy-clicker')
-def unchill_guy_clicker():
-    faq_data = get_faqs_for_page('unchill-guy-clicker')
-    return render_template('unchill-guy-clicker.html',
-                         page_title='Unchill Guy Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations()) 
-@app.route('/the-ultimate-clicker-squad')
-def the_ultimate_clicker_squad():
-    faq_data = get_faqs_for_page('the-ultimate-clicker-squad')
-    return render_template('the-ultimate-clicker-squad.html',
-                         page_title='The Ultimate Clicker Squad',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations()) 
-
-@app.route('/chill-girl-clicker')
-def chill_girl_clicker():
-    faq_data = get_faqs_for_page('chill-girl-clicker')
-    return render_template('chill-girl-clicker.html',
-                         page_title='Chill Girl Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations()) 
-
-@app.route('/bitcoin-clicker')
-def bitcoin_clicker():
-    faq_data = get_faqs_for_page('bitcoin-clicker')
-    return render_template('bitcoin-clicker.html',
-                         page_title='Bitcoin Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/business-clicker')
-def business_clicker():
-    faq_data = get_faqs_for_page('business-clicker')
-    return render_template('business-clicker.html',
-                         page_title='Business Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/bombardino-crocodilo-clicker')
-def bombardino_crocodilo_clicker():
-    faq_data = get_faqs_for_page('bombardino-crocodilo-clicker')
-    return render_template('bombardino-crocodilo-clicker.html',
-                         page_title='Bombardino Crocodilo Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/golf-hit')
-def golf_hit():
-    faq_data = get_faqs_for_page('golf-hit')
-    return render_template('golf-hit.html',
-                         page_title='Golf Hit',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/capybara-clicker-2')
-def capybara_clicker_2():
-    faq_data = get_faqs_for_page('capybara-clicker-2')
-    return render_template('capybara-clicker-2.html',
-                         page_title='Capybara Clicker 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/terradome')
-def terradome():
-    faq_data = get_faqs_for_page('terradome')
-    return render_template('terradome.html',
-                         page_title='Terradome',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/white-horizon')
-def white_horizon():
-    faq_data = get_faqs_for_page('white-horizon')
-    return render_template('white-horizon.html',
-                         page_title='White Horizon',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/chill-guy-clicker-3d')
-def chill_guy_clicker_3d():
-    faq_data = get_faqs_for_page('chill-guy-clicker-3d')
-    return render_template('chill-guy-clicker-3d.html',
-                         page_title='Chill Guy Clicker 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/dadish')
-def dadish():
-    faq_data = get_faqs_for_page('dadish')
-    return render_template('dadish.html',
-                         page_title='Dadish',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/flying-kong')
-def flying_kong():
-    faq_data = get_faqs_for_page('flying-kong')
-    return render_template('flying-kong.html',
-                         page_title='Flying Kong',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/block-blast-3d')
-def block_blast_3d():
-    faq_data = get_faqs_for_page('block-blast-3d')
-    return render_template('block-blast-3d.html',
-                         page_title='Block Blast 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/ssspicy')
-def ssspicy():
-    faq_data = get_faqs_for_page('ssspicy')
-    return render_template('ssspicy.html',
-                         page_title='Ssspicy',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/god-simulator')
-def god_simulator():
-    faq_data = get_faqs_for_page('god-simulator')
-    return render_template('god-simulator.html',
-                         page_title='God Simulator',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/banana-clicker')
-def banana_clicker():
-    faq_data = get_faqs_for_page('banana-clicker')
-    return render_template('banana-clicker.html',
-                         page_title='Banana Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())  
-
-@app.route('/stonecraft')
-def stonecraft():
-    faq_data = get_faqs_for_page('stonecraft')
-    return render_template('stonecraft.html',
-                         page_title='Stonecraft',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/red-rush')
-def red_rush():
-    faq_data = get_faqs_for_page('red-rush')
-    return render_template('red-rush.html',
-                         page_title='Red Rush',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/scrandle')
-def scrandle():
-    faq_data = get_faqs_for_page('scrandle')
-    return render_template('scrandle.html',
-                         page_title='Scrandle',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/poop-clicker-2')
-def poop_clicker_2():
-    faq_data = get_faqs_for_page('poop-clicker-2')
-    return render_template('poop-clicker-2.html',
-                         page_title='Poop Clicker 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/banana-clicker-unblocked')
-def banana_clicker_unblocked():
-    faq_data = get_faqs_for_page('banana-clicker-unblocked')
-    return render_template('banana-clicker-unblocked.html',
-                         page_title='Banana Clicker Unblocked',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/chill-clicker')
-def chill_clicker():
-    faq_data = get_faqs_for_page('chill-clicker')
-    return render_template('chill-clicker.html',
-                         page_title='Chill Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())                     
-
-@app.route('/clock-clicker')
-def clock_clicker():
-    faq_data = get_faqs_for_page('clock-clicker')
-    return render_template('clock-clicker.html',
-                         page_title='Clock Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/cat-clicker')
-def cat_clicker():
-    faq_data = get_faqs_for_page('cat-clicker')
-    return render_template('cat-clicker.html',
-                         page_title='Cat Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/muscle-clicker-2')
-def muscle_clicker_2():
-    faq_data = get_faqs_for_page('muscle-clicker-2')
-    return render_template('muscle-clicker-2.html',
-                         page_title='Muscle Clicker 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/big-dig-treasure-clickers')
-def big_dig_treasure_clickers():
-    faq_data = get_faqs_for_page('big-dig-treasure-clickers')
-    return render_template('big-dig-treasure-clickers.html',
-                         page_title='Big Dig Treasure Clickers',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/ice-cream-clicker')
-def ice_cream_clicker():
-    faq_data = get_faqs_for_page('ice-cream-clicker')
-    return render_template('ice-cream-clicker.html',
-                         page_title='Ice Cream Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/whopper-clicker')
-def whopper_clicker():
-    faq_data = get_faqs_for_page('whopper-clicker')
-    return render_template('whopper-clicker.html',
-                         page_title='Whopper Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    return send_compressed('static', 'ads.txt')
 
-@app.route('/chicken-jockey-clicker')
-def chicken_jockey_clicker():
-    faq_data = get_faqs_for_page('chicken-jockey-clicker')
-    return render_template('chicken-jockey-clicker.html',
-                         page_title='Chicken Jockey Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/duck-duck-clicker-3d')
-def duck_duck_clicker_3d():
-    faq_data = get_faqs_for_page('duck-duck-clicker-3d')
-    return render_template('duck-duck-clicker-3d.html',
-                         page_title='Duck Duck Clicker 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/cat-clicker-mlg')
-def cat_clicker_mlg():
-    faq_data = get_faqs_for_page('cat-clicker-mlg')
-    return render_template('cat-clicker-mlg.html',
-                         page_title='Cat Clicker MLG',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 游戏页面注册表：进程启动时根据 games.json 和 templates/ 构建一次
+GAME_PAGES = load_game_pages(GAMES_JSON_PATH, TEMPLATES_DIR)
 
-@app.route('/sprunki-idle-clicker')
-def sprunki_idle_clicker():
-    faq_data = get_faqs_for_page('sprunki-idle-clicker')
-    return render_template('sprunki-idle-clicker.html',
-                         page_title='Sprunki Idle Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 热门游戏卡片区：由 games.json 生成，按数据版本缓存
+# 首屏只输出 TRENDING_INITIAL_CARDS 张卡片，其余通过 /api/games 滚动加载；设为 0 时全部输出
+trending_grid = TrendingGrid(GAMES_JSON_PATH, GAME_IMAGES_DIR, GAME_PAGES,
+                             initial_cards=int(os.getenv('TRENDING_INITIAL_CARDS', '21')),
+                             watched=page_cache.watched)
+app.jinja_env.globals.update(trending_grid.template_global(timer=metrics.phase))
 
+CATALOG_PAGE_SIZE = 48
+CATALOG_MAX_PAGE_SIZE = 100
 
-@app.route('/loot-heroes-clicker')
-def loot_heroes_clicker():
-    faq_data = get_faqs_for_page('loot-heroes-clicker')
-    return render_template('loot-heroes-clicker.html',
-                         page_title='Loot Heroes Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+def limit_arg(default, maximum):
+    """
+    读取 limit 查询参数
 
-@app.route('/my-cupcake-clicker')
-def my_cupcake_clicker():
-    faq_data = get_faqs_for_page('my-cupcake-clicker')
-    return render_template('my-cupcake-clicker.html',
-                         page_title='My Cupcake Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    Returns:
+        int | None: 参数缺省时为 default；不是整数或不在 1..maximum 之间时为 None
+    """
+    raw = request.args.get('limit')
+    if raw is None or raw == '':
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        return None
+    return limit if 1 <= limit <= maximum else None
 
-@app.route('/noob-basketball-clicker')
-def noob_basketball_clicker():
-    faq_data = get_faqs_for_page('noob-basketball-clicker')
-    return render_template('noob-basketball-clicker.html',
-                         page_title='Noob Basketball Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+@app.route('/api/games', methods=['GET'])
+def games_catalog():
+    """
+    游戏目录 JSON 接口，按游标分页
 
-@app.route('/cookie-clicker-4')
-def cookie_clicker_4():
-    faq_data = get_faqs_for_page('cookie-clicker-4')
-    return render_template('cookie-clicker-4.html',
-                         page_title='Cookie Clicker 4',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    查询参数：
+        cursor: 上一页返回的 next_cursor，为空时从第一页开始
+        limit: 每页条数，默认 48，最大 100
+        fields: 逗号分隔的字段列表，可选 id、title、thumbnail，默认全部
+    """
+    limit = limit_arg(CATALOG_PAGE_SIZE, CATALOG_MAX_PAGE_SIZE)
+    if limit is None:
+        return jsonify({'error': f'limit must be between 1 and {CATALOG_MAX_PAGE_SIZE}'}), 400
 
-@app.route('/cookie-clicker-5')
-def cookie_clicker_5():
-    faq_data = get_faqs_for_page('cookie-clicker-5')
-    return render_template('cookie-clicker-5.html',
-                         page_title='Cookie Clicker 5',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    fields = [field for field in request.args.get('fields', '').split(',') if field] or list(CATALOG_FIELDS)
+    unknown = [field for field in fields if field not in CATALOG_FIELDS]
+    if unknown:
+        return jsonify({'error': f"unknown fields: {', '.join(unknown)}"}), 400
 
-@app.route('/cookie-clicker-3')
-def cookie_clicker_3():
-    faq_data = get_faqs_for_page('cookie-clicker-3')
-    return render_template('cookie-clicker-3.html',
-                         page_title='Cookie Clicker 3',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    try:
+        cards, next_cursor = trending_grid.page(request.args.get('cursor'), limit, get_translations())
+    except KeyError:
+        return jsonify({'error': 'invalid cursor'}), 400
+
+    items = []
+    for card in cards:
+        values = {
+            'id': card['slug'],
+            'title': card['title'],
+            'thumbnail': url_for('static', filename=card['image']),
+        }
+        items.append({field: values[field] for field in fields})
+
+    return json_response({'items': items, 'next_cursor': next_cursor})
+
+def json_response(data, cache_control='public, max-age=300'):
+    """紧凑 JSON 响应，带 ETag（支持 304）并按 Accept-Encoding 压缩"""
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    encoding = negotiate(SUPPORTED_ENCODINGS) if len(body) >= MIN_SIZE else None
+    variants = {encoding: compress(body, encoding, gzip_level=6, brotli_quality=6)} if encoding else {}
+    response = encoded_response(body, 'application/json', hashlib.sha1(body).hexdigest(), variants)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def build_search_documents():
+    """每个已注册游戏页面的标题、模板中的描述和 FAQ"""
+    documents = []
+    for card in trending_grid.catalog_cards(data_cache.get(GAMES_JSON_PATH)):
+        slug = card['slug']
+        documents.append({
+            'slug': slug,
+            'title': card['title'],
+            'image': card['image'],
+            'description': template_description(os.path.join(TEMPLATES_DIR, GAME_PAGES[slug]['template'])),
+            'faqs': get_faqs_for_page(slug)['faqs'],
+        })
+    return documents
+
+# 站内搜索：索引在第一次搜索时构建，模板或数据文件变化后重建
+site_search = SiteSearch(page_cache.watched, build_search_documents)
+
+SEARCH_PAGE_SIZE = 24
+SEARCH_MAX_LIMIT = 50
+SEARCH_MAX_QUERY_LENGTH = 200
+
+@app.route('/search')
+def search():
+    """搜索结果页，对应 base.html 中 schema.org SearchAction 的 target"""
+    query = request.args.get('q', '').strip()[:SEARCH_MAX_QUERY_LENGTH]
+    results = site_search.search(query, SEARCH_PAGE_SIZE) if query else []
+    response = make_response(render_template('search.html',
+                                              query=query,
+                                              results=results,
+                                              translations=get_translations()))
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
+
+@app.route('/api/search', methods=['GET'])
+def search_api():
+    """
+    搜索 JSON 接口
 
-@app.route('/cheese-chompers-3d')
-def cheese_chompers_3d():
-    faq_data = get_faqs_for_page('cheese-chompers-3d')
-    return render_template('cheese-chompers-3d.html',
-                         page_title='Cheese Chompers 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    查询参数：
+        q: 搜索词
+        limit: 返回条数，默认 10，最大 50
+    """
+    query = request.args.get('q', '').strip()[:SEARCH_MAX_QUERY_LENGTH]
+    limit = limit_arg(10, SEARCH_MAX_LIMIT)
+    if limit is None:
+        return jsonify({'error': f'limit must be between 1 and {SEARCH_MAX_LIMIT}'}), 400
+    results = site_search.search(query, limit) if query else []
+    return json_response({
+        'query': query,
+        'results': [
+            {
+                'id': result['slug'],
+                'title': result['title'],
+                'description': result['description'],
+                'url': url_for('game_page', slug=result['slug']),
+                'thumbnail': url_for('static', filename=result['image']),
+                'score': result['score'],
+            }
+            for result in results
+        ],
+    })
+
+def build_suggest_entries():
+    """联想结果：按 games.json 顺序（即热门游戏区的顺序）排列，链接和封面地址预先生成"""
+    return [
+        {
+            'id': card['slug'],
+            'slug': card['slug'],
+            'title': card['title'],
+            'url': url_for('game_page', slug=card['slug']),
+            'thumbnail': url_for('static', filename=card['image']),
+        }
+        for card in trending_grid.catalog_cards(data_cache.get(GAMES_JSON_PATH))
+    ]
+
+# 标题前缀联想：每个前缀的前 SUGGEST_TOP_K 个结果在建索引时算好
+SUGGEST_TOP_K = 8
+SUGGEST_MAX_QUERY_LENGTH = 64
+# 结果只随 games.json 变化（部署时边缘缓存会整体失效），每个前缀都可以在 CDN 缓存较长时间
+SUGGEST_CACHE_CONTROL = os.getenv('SUGGEST_CACHE_CONTROL',
+                                  'public, max-age=3600, s-maxage=604800, stale-while-revalidate=86400')
+autocomplete = Autocomplete(page_cache.watched, build_suggest_entries, top_k=SUGGEST_TOP_K)
+
+@app.route('/api/suggest', methods=['GET'])
+def suggest_api():
+    """
+    游戏标题联想
 
-@app.route('/crazy-cattle-3d')
-def crazy_cattle_3d():
-    faq_data = get_faqs_for_page('crazy-cattle-3d')
-    return render_template('crazy-cattle-3d.html',
-                         page_title='Crazy Cattle 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
+    查询参数：
+        q: 已输入的前缀（不区分大小写，空格与 - 等价）
+    """
+    query = request.args.get('q', '')[:SUGGEST_MAX_QUERY_LENGTH]
+    suggestions = autocomplete.suggest(query)
+    return json_response({
+        'query': query,
+        'suggestions': [
+            {key: entry[key] for key in ('id', 'title', 'url', 'thumbnail')}
+            for entry in suggestions
+        ],
+    }, cache_control=SUGGEST_CACHE_CONTROL)
+
+# 合法 slug 的成员集合：未登记的 slug 不进入页面缓存，直接返回缓存的 404 页面
+GAME_SLUGS = frozenset(GAME_PAGES)
+
+@app.route('/<slug>')
+def game_page(slug):
+    """所有游戏详情页共用的通配路由"""
+    hit = slug in GAME_SLUGS
+    miss_counter.record('slug', hit)
+    if not hit:
+        set_route(UNMATCHED)
+        return not_found_page.response()
+    # 登记的 slug 是固定集合，按具体页面统计不会让序列数随请求无限增长
+    set_route(f'/{slug}')
+    return render_game_page(slug)
+
+@page_cache.cached
+def render_game_page(slug):
+    page = GAME_PAGES[slug]
+    faq_data = get_faqs_for_page(slug)
+    return render_template(page['template'],
+                         page_title=page['page_title'],
+                         dynamic_faqs=faq_data.get('faqs', []),
+                         conclusion=faq_data.get('conclusion', ''),
                          translations=get_translations())
 
-@app.route('/crazy-kitty-3d')
-def crazy_kitty_3d():
-    faq_data = get_faqs_for_page('crazy-kitty-3d')
-    return render_template('crazy-kitty-3d.html',
-                         page_title='Crazy Kitty 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+@app.route('/paper')
+def paper():
+    # 读取文档数据
+    paper_data = data_cache.get(os.path.join(app.static_folder, 'data', 'paper.json'))
+    return render_template('paper.html', paper=paper_data)
 
-@app.route('/tung-tung-sahur-gta-miami')
-def tung_tung_sahur_gta_miami():
-    faq_data = get_faqs_for_page('tung-tung-sahur-gta-miami')
-    return render_template('tung-tung-sahur-gta-miami.html',
-                         page_title='Tung Tung Sahur: GTA Miami',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+@app.route('/privacy-policy')
+def privacy_policy():
+    try:
+        translations_data = get_translations()
+        return render_template('privacy-policy.html', translations=translations_data)
+    except Exception as e:
+        app.logger.error(f"Error in privacy policy route: {e}")
+        return render_template('error.html', error="An error occurred loading the privacy policy page.")
 
-@app.route('/doge-miner')
-def doge_miner():
-    faq_data = get_faqs_for_page('doge-miner')
-    return render_template('doge-miner.html',
-                         page_title='Doge Miner',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+@app.route('/terms-of-service')
+def terms_of_service():
+    try:
+        translations_data = get_translations()
+        return render_template('terms-of-service.html', translations=translations_data)
+    except Exception as e:
+        app.logger.error(f"Error in terms of service route: {e}")
+        return render_template('error.html', error="An error occurred loading the terms of service page.")
 
-@app.route('/doge-miner-2')
-def doge_miner_2():
-    faq_data = get_faqs_for_page('doge-miner-2')
-    return render_template('doge-miner-2.html',
-                         page_title='Doge Miner 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 联系表单邮件默认写入本地队列，由后台线程复用同一个 SMTP 连接发送；
+# MAIL_QUEUE=0 时在请求内直接发送。Vercel（设置了 VERCEL 环境变量）文件系统只读、请求结束后会冻结后台线程，
+# 未显式设置 MAIL_QUEUE 时默认直接发送
+MAIL_QUEUE_DEFAULT = '0' if os.getenv('VERCEL') else '1'
+_mail_lock = threading.Lock()
+_mail_worker = None
+# 直接发送模式下空闲的 SMTP 连接；每个连接同一时间只给一个请求使用
+_idle_mail_connections = []
+_mail_resumed_pid = None
+
+def mail_queue_enabled():
+    return os.getenv('MAIL_QUEUE', MAIL_QUEUE_DEFAULT) != '0'
+
+def mail_queue_path():
+    return os.getenv('MAIL_QUEUE_PATH') or os.path.join(app.instance_path, 'mail_queue.sqlite3')
+
+def get_mail_worker():
+    global _mail_worker
+    # smtplib / sqlite3 只在需要发信时才导入，不放进冷启动的导入链
+    from utils.mail_queue import worker_from_env
+    with _mail_lock:
+        if _mail_worker is None:
+            _mail_worker = worker_from_env(mail_queue_path())
+        return _mail_worker
+
+def send_mail_inline(sender, recipients, message):
+    """在请求内直接发送；锁只用于取出或创建连接，SMTP 会话期间不持有，多个请求可以同时发送"""
+    from utils.mail_queue import connection_from_env
+    with _mail_lock:
+        connection = _idle_mail_connections.pop() if _idle_mail_connections else connection_from_env()
+    try:
+        connection.send(sender, recipients, message)
+    except Exception:
+        connection.close()
+        raise
+    with _mail_lock:
+        _idle_mail_connections.append(connection)
+
+def deliver_mail(sender, recipients, message):
+    if not mail_queue_enabled():
+        send_mail_inline(sender, recipients, message)
+        return
+    get_mail_worker().submit(sender, recipients, message)
+
+@app.before_request
+def resume_mail_queue():
+    """
+    每个进程处理第一个请求时，若队列文件里还有未发出的邮件（例如上一个进程崩溃或重启前留下的），启动发送线程
 
-@app.route('/cookie-clicker-evolution')
-def cookie_clicker_evolution():
-    faq_data = get_faqs_for_page('cookie-clicker-evolution')
-    return render_template('cookie-clicker-evolution.html',
-                         page_title='Cookie Clicker Evolution',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+    按 PID 判断，gunicorn preload fork 出的每个 worker 各检查一次；没有队列文件时不导入 sqlite3
+    """
+    global _mail_resumed_pid
+    pid = os.getpid()
+    if _mail_resumed_pid == pid:
+        return
+    _mail_resumed_pid = pid
+    if not mail_queue_enabled() or not os.path.exists(mail_queue_path()):
+        return
+    try:
+        worker = get_mail_worker()
+        if worker.queue.has_pending():
+            worker.start()
+    except Exception as e:
+        app.logger.error(f"Failed to resume the mail queue: {e}")
 
-@app.route('/cookie-clicker-city')
-def cookie_clicker_city():
-    faq_data = get_faqs_for_page('cookie-clicker-city')
-    return render_template('cookie-clicker-city.html',
-                         page_title='Cookie Clicker City',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+def send_message():
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    from utils.mail_queue import QueueFull
+    try:
+        name = request.form.get('name')
+        email = request.form.get('email')
+        subject = request.form.get('subject')
+        message = request.form.get('message')
+        
+        if not all([name, email, subject, message]):
+            flash('Please fill in all fields', 'error')
+            return redirect(url_for('contact'))
+        
+        try:
+            email_user = os.getenv('EMAIL_USER')
+            email_password = os.getenv('EMAIL_PASSWORD')
+            
+            if not email_user or not email_password:
+                flash('Email configuration is not set up', 'error')
+                return redirect(url_for('contact'))
+            
+            msg = MIMEMultipart()
+            msg['From'] = email_user
+            msg['To'] = email_user  # Send to yourself
+            msg['Subject'] = f"Sprunkr: {subject} - from {name}"
+            
+            body = f"""
+            Name: {name}
+            Email: {email}
+            Subject: {subject}
+            Message: {message}
+            """
+            msg.attach(MIMEText(body, 'plain'))
+            
+            deliver_mail(email_user, [email_user], msg.as_bytes())
+            
+            flash('Thank you for your message! We will get back to you soon.', 'success')
+        except QueueFull as e:
+            app.logger.error(f"Mail queue is full: {str(e)}")
+            flash('Sorry, we are receiving too many messages right now. Please try again later.', 'error')
+        except Exception as e:
+            app.logger.error(f"Error sending message: {str(e)}")
+            flash('Sorry, there was a problem sending your message. Please try again later.', 'error')
+    except Exception as e:
+        app.logger.error(f"Error in send_message: {e}")
+        flash('Sorry, there was a problem sending your message. Please try again later.', 'error')
+    
+    return redirect(url_for('contact'))
 
-@app.route('/doggo-clicker')
-def doggo_clicker():
-    faq_data = get_faqs_for_page('doggo-clicker')
-    return render_template('doggo-clicker.html',
-                         page_title='Doggo Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 添加全局错误处理器
+@app.errorhandler(500)
+def internal_error(error):
+    app.logger.error(f'Server Error: {error}')
+    return render_template('error.html', 
+                         error_code=500,
+                         error_message="Internal Server Error",
+                         translations=get_translations()), 500
 
-@app.route('/monster-clicker')
-def monster_clicker():
-    faq_data = get_faqs_for_page('monster-clicker')
-    return render_template('monster-clicker.html',
-                         page_title='Monster Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+def render_not_found(**context):
+    return render_template('error.html', 
+                         error_code=404,
+                         error_message="Page Not Found",
+                         translations=get_translations(),
+                         **context)
 
-@app.route('/panda-clicker')
-def panda_clicker():
-    faq_data = get_faqs_for_page('panda-clicker')
-    return render_template('panda-clicker.html',
-                         page_title='Panda Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 404 页面按数据版本只渲染一次
+not_found_page = NotFoundPage(page_cache.watched, render_not_found)
 
-@app.route('/capybara-evolution-clicker')
-def capybara_evolution_clicker():
-    faq_data = get_faqs_for_page('capybara-evolution-clicker')
-    return render_template('capybara-evolution-clicker.html',
-                         page_title='Capybara Evolution Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+@app.errorhandler(404)
+def not_found_error(error):
+    app.logger.debug(f'Page not found: {request.path}')
+    return not_found_page.response()
 
-@app.route('/particle-clicker')
-def particle_clicker():
-    faq_data = get_faqs_for_page('particle-clicker')
-    return render_template('particle-clicker.html',
-                         page_title='Particle Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 导入游戏API处理函数
+from api.game_api import engine as game_engine, game_api
 
-@app.route('/duck-duck-clicker')
-def duck_duck_clicker():
-    faq_data = get_faqs_for_page('duck-duck-clicker')
-    return render_template('duck-duck-clicker.html',
-                         page_title='Duck Duck Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 添加游戏API路由
+@app.route('/game/<path:game_id>', methods=['GET'])
+def game_route(game_id):
+    app.logger.debug(f"处理游戏请求: /game/{game_id}")
+    # 将game_id作为查询参数传递给game_api函数
+    return game_api(game_id=game_id)
 
-@app.route('/duck-clicker')
-def duck_clicker():
-    faq_data = get_faqs_for_page('duck-clicker')
-    return render_template('duck-clicker.html',
-                         page_title='Duck Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+# 添加游戏API路由（用于处理直接的API请求）
+@app.route('/api/game-api', methods=['GET'])
+def game_api_route():
+    app.logger.debug(f"处理游戏API请求: {request.url}")
+    # 从查询参数中获取game_id
+    game_id = request.args.get('gameId')
+    return game_api(game_id=game_id)
 
-@app.route('/capybara-clicker-pro')
-def capybara_clicker_pro():
-    faq_data = get_faqs_for_page('capybara-clicker-pro')
-    return render_template('capybara-clicker-pro.html',
-                         page_title='Capybara Clicker Pro',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/clicker-heroes')
-def clicker_heroes():
-    faq_data = get_faqs_for_page('clicker-heroes')
-    return render_template('clicker-heroes.html',
-                         page_title='Clicker Heroes',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/crusher-clicker')
-def crusher_clicker():
-    faq_data = get_faqs_for_page('crusher-clicker')
-    return render_template('crusher-clicker.html',
-                         page_title='Crusher Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
+TRANSLATIONS_PATH = os.path.join(app.static_folder, 'data', 'translations.json')
+metrics.add_collector(cache_collector({
+    'page': page_cache.stats,
+    'game_page': game_engine.stats,
+    'translations': lambda: data_cache.stats(TRANSLATIONS_PATH),
+    'faq': lambda: data_cache.stats(faq_store.index_path),
+    'search': site_search.stats,
+}))
+metrics.add_collector(lookup_collector(miss_counter))
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """
+    Prometheus 抓取接口，需要 Authorization: Bearer <METRICS_TOKEN>
 
-@app.route('/minetap-merge-clicker')
-def minetap_merge_clicker():
-    faq_data = get_faqs_for_page('minetap-merge-clicker')
-    return render_template('minetap-merge-clicker.html',
-                         page_title='MineTap Merge Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/little-farm-clicker')
-def little_farm_clicker():
-    faq_data = get_faqs_for_page('little-farm-clicker')
-    return render_template('little-farm-clicker.html',
-                         page_title='Little Farm Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/smash-car-clicker')
-def smash_car_clicker():
-    faq_data = get_faqs_for_page('smash-car-clicker')
-    return render_template('smash-car-clicker.html',
-                         page_title='Smash Car Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/omega-nuggets-clicker')
-def omega_nuggets_clicker():
-    faq_data = get_faqs_for_page('omega-nuggets-clicker')
-    return render_template('omega-nuggets-clicker.html',
-                         page_title='Omega Nugget Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/bear-clicker-girl')
-def bear_clicker_girl():
-    faq_data = get_faqs_for_page('bear-clicker-girl')
-    return render_template('bear-clicker-girl.html',
-                         page_title='Bear Clicker Girl',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/italian-brainrot-playground')
-def italian_brainrot_playground():
-    faq_data = get_faqs_for_page('italian-brainrot-playground')
-    return render_template('italian-brainrot-playground.html',
-                         page_title='Italian Brainrot Playground',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/merge-fellas-brainrot')
-def merge_fellas_brainrot():
-    faq_data = get_faqs_for_page('merge-fellas-brainrot')
-    return render_template('merge-fellas-brainrot.html',
-                         page_title='Merge Fellas Brainrot',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/crazy-mouse-battle')
-def crazy_mouse_battle():
-    faq_data = get_faqs_for_page('crazy-mouse-battle')
-    return render_template('crazy-mouse-battle.html',
-                         page_title='Crazy Mouse Battle',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/poor-bunny')
-def poor_bunny():
-    faq_data = get_faqs_for_page('poor-bunny')
-    return render_template('poor-bunny.html',
-                         page_title='Poor Bunny',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/lemon-clicker')
-def lemon_clicker():
-    faq_data = get_faqs_for_page('lemon-clicker')
-    return render_template('lemon-clicker.html',
-                         page_title='Lemon Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/tung-sahur-clicker')
-def tung_sahur_clicker():
-    faq_data = get_faqs_for_page('tung-sahur-clicker')
-    return render_template('tung-sahur-clicker.html',
-                         page_title='Tung Sahur Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/tung-tung-sahur-obby-challenge')
-def tung_tung_sahur_obby_challenge():
-    faq_data = get_faqs_for_page('tung-tung-sahur-obby-challenge')
-    return render_template('tung-tung-sahur-obby-challenge.html',
-                         page_title='Tung Tung Sahur Obby Challenge',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/brainrot-clicker')
-def brainrot_clicker():
-    faq_data = get_faqs_for_page('brainrot-clicker')
-    return render_template('brainrot-clicker.html',
-                         page_title='Brainrot Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/bear-clicker-female')
-def bear_clicker_female():
-    faq_data = get_faqs_for_page('bear-clicker-female')
-    return render_template('bear-clicker-female.html',
-                         page_title='Bear Clicker Female',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/italian-brainrot-clicker-2')
-def italian_brainrot_clicker_2():
-    faq_data = get_faqs_for_page('italian-brainrot-clicker-2')
-    return render_template('italian-brainrot-clicker-2.html',
-                         page_title='Italian Brainrot Clicker 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/cat-paw-taba-clicker')
-def cat_paw_taba_clicker():
-    faq_data = get_faqs_for_page('cat-paw-taba-clicker')
-    return render_template('cat-paw-taba-clicker.html',
-                         page_title='Cat Paw Taba Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/speed-stars')
-def speed_stars():
-    faq_data = get_faqs_for_page('speed-stars')
-    return render_template('speed-stars.html',
-                         page_title='Speed Stars',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/italian-brainrot-2048')
-def italian_brainrot_2048():
-    faq_data = get_faqs_for_page('italian-brainrot-2048')
-    return render_template('italian-brainrot-2048.html',
-                         page_title='Italian Brainrot 2048',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/pokemon-gamma-emerald')
-def pokemon_gamma_emerald():
-    faq_data = get_faqs_for_page('pokemon-gamma-emerald')
-    return render_template('pokemon-gamma-emerald.html',
-                         page_title='Pokemon Gamma Emerald',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/multi-theme-clicker-game')
-def multi_theme_clicker_game():
-    faq_data = get_faqs_for_page('multi-theme-clicker-game')
-    return render_template('multi-theme-clicker-game.html',
-                         page_title='Multi Theme Clicker Game',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/dreamy-room')
-def dreamy_room():
-    faq_data = get_faqs_for_page('dreamy-room')
-    return render_template('dreamy-room.html',
-                         page_title='Dreamy Room',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/wacky-flip')
-def wacky_flip():
-    faq_data = get_faqs_for_page('wacky-flip')
-    return render_template('wacky-flip.html',
-                         page_title='Wacky Flip',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/merge-fellas')
-def merge_fellas():
-    faq_data = get_faqs_for_page('merge-fellas')
-    return render_template('merge-fellas.html',
-                         page_title='Merge Fellas',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/drive-beyond-horizons')
-def drive_beyond_horizons():
-    faq_data = get_faqs_for_page('drive-beyond-horizons')
-    return render_template('drive-beyond-horizons.html',
-                         page_title='Drive Beyond Horizons',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/cookie-clicker-1')
-def cookie_clicker_1():
-    faq_data = get_faqs_for_page('cookie-clicker-1')
-    return render_template('cookie-clicker-1.html',
-                         page_title='Cookie Clicker 1',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/wild-west-saga-idle-tycoon-clicker')
-def wild_west_saga_idle_tycoon_clicker():
-    faq_data = get_faqs_for_page('wild-west-saga-idle-tycoon-clicker')
-    return render_template('wild-west-saga-idle-tycoon-clicker.html',
-                         page_title='Wild West Saga: Idle Tycoon Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/twitchie-clicker')
-def twitchie_clicker():
-    faq_data = get_faqs_for_page('twitchie-clicker')
-    return render_template('twitchie-clicker.html',
-                         page_title='Twitchie Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/italian-brainrot-clicker')
-def italian_brainrot_clicker():
-    faq_data = get_faqs_for_page('italian-brainrot-clicker')
-    return render_template('italian-brainrot-clicker.html',
-                         page_title='Italian Brainrot Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/robux-clicker')
-def robux_clicker():
-    faq_data = get_faqs_for_page('robux-clicker')
-    return render_template('robux-clicker.html',
-                         page_title='Robux Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/military-capitalist-idle-clicker')
-def military_capitalist_idle_clicker():
-    faq_data = get_faqs_for_page('military-capitalist-idle-clicker')
-    return render_template('military-capitalist-idle-clicker.html',
-                         page_title='Military Capitalist Idle Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/race-clicker')
-def race_clicker():
-    faq_data = get_faqs_for_page('race-clicker')
-    return render_template('race-clicker.html',
-                         page_title='Race Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/internet-roadtrip')
-def internet_roadtrip():
-    faq_data = get_faqs_for_page('internet-roadtrip')
-    return render_template('internet-roadtrip.html',
-                         page_title='Internet Roadtrip',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/smash-car-clicker-2')
-def smash_car_clicker_2():
-    faq_data = get_faqs_for_page('smash-car-clicker-2')
-    return render_template('smash-car-clicker-2.html',
-                         page_title='Smash Car Clicker 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/poop-clicker')
-def poop_clicker():
-    faq_data = get_faqs_for_page('poop-clicker')
-    return render_template('poop-clicker.html',
-                         page_title='Poop Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/gift-clicker')
-def gift_clicker():
-    faq_data = get_faqs_for_page('gift-clicker')
-    return render_template('gift-clicker.html',
-                         page_title='Gift Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/crazy-chicken-3d')
-def crazy_chicken_3d():
-    faq_data = get_faqs_for_page('crazy-chicken-3d')
-    return render_template('crazy-chicken-3d.html',
-                         page_title='Crazy Chicken 3D',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/crazy-animal-city')
-def crazy_animal_city():
-    faq_data = get_faqs_for_page('crazy-animal-city')
-    return render_template('crazy-animal-city.html',
-                         page_title='Crazy Animal City',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/css-clicker')
-def css_clicker():
-    faq_data = get_faqs_for_page('css-clicker')
-    return render_template('css-clicker.html',
-                         page_title='Css Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/clicker-sprunki-2')
-def clicker_sprunki_2():
-    faq_data = get_faqs_for_page('clicker-sprunki-2')
-    return render_template('clicker-sprunki-2.html',
-                         page_title='Clicker Sprunki 2',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/cookie-clicker-save-the-world')
-def cookie_clicker_save_the_world():
-    faq_data = get_faqs_for_page('cookie-clicker-save-the-world')
-    return render_template('cookie-clicker-save-the-world.html',
-                         page_title='Cookie Clicker Save the World',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/click-click-clicker')
-def click_click_clicker():
-    faq_data = get_faqs_for_page('click-click-clicker')
-    return render_template('click-click-clicker.html',
-                         page_title='Click Click Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/babe-clicker')
-def babe_clicker():
-    faq_data = get_faqs_for_page('babe-clicker')
-    return render_template('babe-clicker.html',
-                         page_title='Babe Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/clicker-royale')
-def clicker_royale():
-    faq_data = get_faqs_for_page('clicker-royale')
-    return render_template('clicker-royale.html',
-                         page_title='Clicker Royale',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/chill-guy-clicker')
-def chill_guy_clicker():
-    faq_data = get_faqs_for_page('chill-guy-clicker')
-    return render_template('chill-guy-clicker.html',
-                         page_title='Chill Guy Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/planet-clicker')
-def planet_clicker():
-    faq_data = get_faqs_for_page('planet-clicker')
-    return render_template('planet-clicker.html',
-                         page_title='Planet Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/astro-robot-clicker')
-def astro_robot_clicker():
-    faq_data = get_faqs_for_page('astro-robot-clicker')
-    return render_template('astro-robot-clicker.html',
-                         page_title='Astro Robot Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/tube-clicker')
-def tube_clicker():
-    faq_data = get_faqs_for_page('tube-clicker')
-    return render_template('tube-clicker.html',
-                         page_title='Tube Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-@app.route('/titans-clicker')
-def titans_clicker():
-    faq_data = get_faqs_for_page('titans-clicker')
-    return render_template('titans-clicker.html',
-                         page_title='Titans Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())                      
-
-@app.route('/kiwi-clicker')
-def kiwi_clicker():
-    faq_data = get_faqs_for_page('kiwi-clicker')
-    return render_template('kiwi-clicker.html',
-                         page_title='Kiwi Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())                     
-
-@app.route('/muscle-clicker')
-def muscle_clicker():
-    faq_data = get_faqs_for_page('muscle-clicker')
-    return render_template('muscle-clicker.html',
-                         page_title='Muscle Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/money-clicker')
-def money_clicker():
-    faq_data = get_faqs_for_page('money-clicker')
-    return render_template('money-clicker.html',
-                         page_title='Money Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/sprunki-clicker')
-def sprunki_clicker():
-    faq_data = get_faqs_for_page('sprunki-clicker')
-    return render_template('sprunki-clicker.html',
-                         page_title='Sprunki Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())
-
-@app.route('/cookie-clicker')
-def cookie_clicker():
-    faq_data = get_faqs_for_page('cookie-clicker')
-    return render_template('cookie-clicker.html',
-                         page_title='Cookie Clicker',
-                         dynamic_faqs=faq_data['faqs'],
-                         conclusion=faq_data['conclusion'],
-                         translations=get_translations())                     
-@app.route('/paper')
-def paper():
-    # 读取文档数据
-    with open('static/data/paper.json', 'r', encoding='utf-8') as f:
-        paper_data = json.load(f)
-    return render_template('paper.html', paper=paper_data)
-
-@app.route('/privacy-policy')
-def privacy_policy():
-    try:
-        translations_data = get_translations()
-        return render_template('privacy-policy.html', translations=translations_data)
-    except Exception as e:
-        app.logger.error(f"Error in privacy policy route: {e}")
-        return render_template('error.html', error="An error occurred loading the privacy policy page.")
-
-@app.route('/terms-of-service')
-def terms_of_service():
-    try:
-        translations_data = get_translations()
-        return render_template('terms-of-service.html', translations=translations_data)
-    except Exception as e:
-        app.logger.error(f"Error in terms of service route: {e}")
-        return render_template('error.html', error="An error occurred loading the terms of service page.")
-
-def send_message():
-    try:
-        name = request.form.get('name')
-        email = request.form.get('email')
-        subject = request.form.get('subject')
-        message = request.form.get('message')
-        
-        if not all([name, email, subject, message]):
-            flash('Please fill in all fields', 'error')
-            return redirect(url_for('contact'))
-        
-        try:
-            email_user = os.getenv('EMAIL_USER')
-            email_password = os.getenv('EMAIL_PASSWORD')
-            
-            if not email_user or not email_password:
-                flash('Email configuration is not set up', 'error')
-                return redirect(url_for('contact'))
-            
-            msg = MIMEMultipart()
-            msg['From'] = email_user
-            msg['To'] = email_user  # Send to yourself
-            msg['Subject'] = f"Sprunkr: {subject} - from {name}"
-            
-            body = f"""
-            Name: {name}
-            Email: {email}
-            Subject: {subject}
-            Message: {message}
-            """
-            msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls()
-            server.login(email_user, email_password)
-            server.send_message(msg)
-            server.quit()
-            
-            flash('Thank you for your message! We will get back to you soon.', 'success')
-        except Exception as e:
-            app.logger.error(f"Error sending message: {str(e)}")
-            flash('Sorry, there was a problem sending your message. Please try again later.', 'error')
-    except Exception as e:
-        app.logger.error(f"Error in send_message: {e}")
-        flash('Sorry, there was a problem sending your message. Please try again later.', 'error')
-    
-    return redirect(url_for('contact'))
-
-# 添加全局错误处理器
-@app.errorhandler(500)
-def internal_error(error):
-    app.logger.error(f'Server Error: {error}')
-    return render_template('error.html', 
-                         error_code=500,
-                         error_message="Internal Server Error",
-                         translations=get_translations()), 500
-
-@app.errorhandler(404)
-def not_found_error(error):
-    app.logger.error(f'Page not found: {error}')
-    return render_template('error.html', 
-                         error_code=404,
-                         error_message="Page Not Found",
-                         translations=get_translations()), 404
-
-# 导入游戏API处理函数
-from api.game_api import game_api
-
-# 添加游戏API路由
-@app.route('/game/<path:game_id>', methods=['GET'])
-def game_route(game_id):
-    app.logger.info(f"处理游戏请求: /game/{game_id}")
-    # 将game_id作为查询参数传递给game_api函数
-    return game_api(game_id=game_id)
-
-# 添加游戏API路由（用于处理直接的API请求）
-@app.route('/api/game-api', methods=['GET'])
-def game_api_route():
-    app.logger.info(f"处理游戏API请求: {request.url}")
-    # 从查询参数中获取game_id
-    game_id = request.args.get('gameId')
-    return game_api(game_id=game_id)
-
-
-@app.route('/pizza-clicker')
-def pizza_clicker():
-    faq_data = get_faqs_for_page('pizza-clicker')
-    return render_template('pizza-clicker.html',
-                         page_title='Pizza Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-clicker2.com')
-def cookie_clicker2_com():
-    faq_data = get_faqs_for_page('cookie-clicker2.com')
-    return render_template('cookie-clicker2.com.html',
-                         page_title='Cookie Clicker2.Com',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-clicker-2')
-def cookie_clicker_2():
-    faq_data = get_faqs_for_page('cookie-clicker-2')
-    return render_template('cookie-clicker-2.html',
-                         page_title='Cookie Clicker 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/among-us-clicker')
-def among_us_clicker():
-    faq_data = get_faqs_for_page('among-us-clicker')
-    return render_template('among-us-clicker.html',
-                         page_title='Among Us Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-tap')
-def cookie_tap():
-    faq_data = get_faqs_for_page('cookie-tap')
-    return render_template('cookie-tap.html',
-                         page_title='Cookie Tap',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sudoku')
-def sudoku():
-    faq_data = get_faqs_for_page('sudoku')
-    return render_template('sudoku.html',
-                         page_title='Sudoku',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/2048')
-def game_2048():
-    faq_data = get_faqs_for_page('2048')
-    return render_template('2048.html',
-                         page_title='2048',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-clicker2')
-def cookie_clicker2():
-    faq_data = get_faqs_for_page('cookie-clicker2')
-    return render_template('cookie-clicker2.html',
-                         page_title='Cookie Clicker2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/orbit-kick')
-def orbit_kick():
-    faq_data = get_faqs_for_page('orbit-kick')
-    return render_template('orbit-kick.html',
-                         page_title='Orbit Kick',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/steal-a-brainrot')
-def steal_a_brainrot():
-    faq_data = get_faqs_for_page('steal-a-brainrot')
-    return render_template('steal-a-brainrot.html',
-                         page_title='Steal A Brainrot',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/flying-gorilla')
-def flying_gorilla():
-    faq_data = get_faqs_for_page('flying-gorilla')
-    return render_template('flying-gorilla.html',
-                         page_title='Flying Gorilla',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/animal-rampage-3d')
-def animal_rampage_3d():
-    faq_data = get_faqs_for_page('animal-rampage-3d')
-    return render_template('animal-rampage-3d.html',
-                         page_title='Animal Rampage 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sprunki')
-def sprunki():
-    faq_data = get_faqs_for_page('sprunki')
-    return render_template('sprunki.html',
-                         page_title='Sprunki',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/wave-road')
-def wave_road():
-    faq_data = get_faqs_for_page('wave-road')
-    return render_template('wave-road.html',
-                         page_title='Wave Road',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/supermarket-master')
-def supermarket_master():
-    faq_data = get_faqs_for_page('supermarket-master')
-    return render_template('supermarket-master.html',
-                         page_title='Supermarket Master',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/mineclicker')
-def mineclicker():
-    faq_data = get_faqs_for_page('mineclicker')
-    return render_template('mineclicker.html',
-                         page_title='Mineclicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/color-rush')
-def color_rush():
-    faq_data = get_faqs_for_page('color-rush')
-    return render_template('color-rush.html',
-                         page_title='Color Rush',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/traffic-road')
-def traffic_road():
-    faq_data = get_faqs_for_page('traffic-road')
-    return render_template('traffic-road.html',
-                         page_title='Traffic Road',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/kaizo-cookie-clicker')
-def kaizo_cookie_clicker():
-    faq_data = get_faqs_for_page('kaizo-cookie-clicker')
-    return render_template('kaizo-cookie-clicker.html',
-                         page_title='Kaizo Cookie Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/10x10-farming')
-def game_10x10_farming():
-    faq_data = get_faqs_for_page('10x10-farming')
-    return render_template('10x10-farming.html',
-                         page_title='10X10 Farming',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/crazy-monsters-memory')
-def crazy_monsters_memory():
-    faq_data = get_faqs_for_page('crazy-monsters-memory')
-    return render_template('crazy-monsters-memory.html',
-                         page_title='Crazy Monsters Memory',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/alphabet-memory-game')
-def alphabet_memory_game():
-    faq_data = get_faqs_for_page('alphabet-memory-game')
-    return render_template('alphabet-memory-game.html',
-                         page_title='Alphabet Memory Game',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/vegetables-collection')
-def vegetables_collection():
-    faq_data = get_faqs_for_page('vegetables-collection')
-    return render_template('vegetables-collection.html',
-                         page_title='Vegetables Collection',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/reversi')
-def reversi():
-    faq_data = get_faqs_for_page('reversi')
-    return render_template('reversi.html',
-                         page_title='Reversi',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/happy-halloween')
-def happy_halloween():
-    faq_data = get_faqs_for_page('happy-halloween')
-    return render_template('happy-halloween.html',
-                         page_title='Happy Halloween',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/hero-rescue')
-def hero_rescue():
-    faq_data = get_faqs_for_page('hero-rescue')
-    return render_template('hero-rescue.html',
-                         page_title='Hero Rescue',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/word-wood')
-def word_wood():
-    faq_data = get_faqs_for_page('word-wood')
-    return render_template('word-wood.html',
-                         page_title='Word Wood',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/basketball-stars')
-def basketball_stars():
-    faq_data = get_faqs_for_page('basketball-stars')
-    return render_template('basketball-stars.html',
-                         page_title='Basketball Stars',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/gold-miner-bros')
-def gold_miner_bros():
-    faq_data = get_faqs_for_page('gold-miner-bros')
-    return render_template('gold-miner-bros.html',
-                         page_title='Gold Miner Bros',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/plants-vs-zombies-2')
-def plants_vs_zombies_2():
-    faq_data = get_faqs_for_page('plants-vs-zombies-2')
-    return render_template('plants-vs-zombies-2.html',
-                         page_title='Plants Vs Zombies 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sugar-heroes')
-def sugar_heroes():
-    faq_data = get_faqs_for_page('sugar-heroes')
-    return render_template('sugar-heroes.html',
-                         page_title='Sugar Heroes',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pop-the-eggs')
-def pop_the_eggs():
-    faq_data = get_faqs_for_page('pop-the-eggs')
-    return render_template('pop-the-eggs.html',
-                         page_title='Pop The Eggs',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/hex-a-mong')
-def hex_a_mong():
-    faq_data = get_faqs_for_page('hex-a-mong')
-    return render_template('hex-a-mong.html',
-                         page_title='Hex A Mong',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/geometry-dash')
-def geometry_dash():
-    faq_data = get_faqs_for_page('geometry-dash')
-    return render_template('geometry-dash.html',
-                         page_title='Geometry Dash',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/deep-io')
-def deep_io():
-    faq_data = get_faqs_for_page('deep-io')
-    return render_template('deep-io.html',
-                         page_title='Deep Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/crazypartyio')
-def crazypartyio():
-    faq_data = get_faqs_for_page('crazypartyio')
-    return render_template('crazypartyio.html',
-                         page_title='Crazypartyio',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fallerzio')
-def fallerzio():
-    faq_data = get_faqs_for_page('fallerzio')
-    return render_template('fallerzio.html',
-                         page_title='Fallerzio',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/super-mario-bros')
-def super_mario_bros():
-    faq_data = get_faqs_for_page('super-mario-bros')
-    return render_template('super-mario-bros.html',
-                         page_title='Super Mario Bros',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/goo-goo-gaga-clicker')
-def goo_goo_gaga_clicker():
-    faq_data = get_faqs_for_page('goo-goo-gaga-clicker')
-    return render_template('goo-goo-gaga-clicker.html',
-                         page_title='Goo Goo Gaga Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/checkers')
-def checkers():
-    faq_data = get_faqs_for_page('checkers')
-    return render_template('checkers.html',
-                         page_title='Checkers',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/words-finder')
-def words_finder():
-    faq_data = get_faqs_for_page('words-finder')
-    return render_template('words-finder.html',
-                         page_title='Words Finder',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/ultimate-tic-tac-toe')
-def ultimate_tic_tac_toe():
-    faq_data = get_faqs_for_page('ultimate-tic-tac-toe')
-    return render_template('ultimate-tic-tac-toe.html',
-                         page_title='Ultimate Tic Tac Toe',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fruit-slice')
-def fruit_slice():
-    faq_data = get_faqs_for_page('fruit-slice')
-    return render_template('fruit-slice.html',
-                         page_title='Fruit Slice',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pull-pin')
-def pull_pin():
-    faq_data = get_faqs_for_page('pull-pin')
-    return render_template('pull-pin.html',
-                         page_title='Pull Pin',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/jelly-crush')
-def jelly_crush():
-    faq_data = get_faqs_for_page('jelly-crush')
-    return render_template('jelly-crush.html',
-                         page_title='Jelly Crush',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/temple-runner')
-def temple_runner():
-    faq_data = get_faqs_for_page('temple-runner')
-    return render_template('temple-runner.html',
-                         page_title='Temple Runner',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/doodle-jump')
-def doodle_jump():
-    faq_data = get_faqs_for_page('doodle-jump')
-    return render_template('doodle-jump.html',
-                         page_title='Doodle Jump',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/duck-shooter')
-def duck_shooter():
-    faq_data = get_faqs_for_page('duck-shooter')
-    return render_template('duck-shooter.html',
-                         page_title='Duck Shooter',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/super-pineapple-pen')
-def super_pineapple_pen():
-    faq_data = get_faqs_for_page('super-pineapple-pen')
-    return render_template('super-pineapple-pen.html',
-                         page_title='Super Pineapple Pen',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/g-switch-3')
-def g_switch_3():
-    faq_data = get_faqs_for_page('g-switch-3')
-    return render_template('g-switch-3.html',
-                         page_title='G Switch 3',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/zumba-mania')
-def zumba_mania():
-    faq_data = get_faqs_for_page('zumba-mania')
-    return render_template('zumba-mania.html',
-                         page_title='Zumba Mania',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/paperio-2')
-def paperio_2():
-    faq_data = get_faqs_for_page('paperio-2')
-    return render_template('paperio-2.html',
-                         page_title='Paperio 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/crowd-city')
-def crowd_city():
-    faq_data = get_faqs_for_page('crowd-city')
-    return render_template('crowd-city.html',
-                         page_title='Crowd City',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/master-chess')
-def master_chess():
-    faq_data = get_faqs_for_page('master-chess')
-    return render_template('master-chess.html',
-                         page_title='Master Chess',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/run-3')
-def run_3():
-    faq_data = get_faqs_for_page('run-3')
-    return render_template('run-3.html',
-                         page_title='Run 3',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/slither-dragon-io')
-def slither_dragon_io():
-    faq_data = get_faqs_for_page('slither-dragon-io')
-    return render_template('slither-dragon-io.html',
-                         page_title='Slither Dragon Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/catch-dots')
-def catch_dots():
-    faq_data = get_faqs_for_page('catch-dots')
-    return render_template('catch-dots.html',
-                         page_title='Catch Dots',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/flammy')
-def flammy():
-    faq_data = get_faqs_for_page('flammy')
-    return render_template('flammy.html',
-                         page_title='Flammy',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/jump-color')
-def jump_color():
-    faq_data = get_faqs_for_page('jump-color')
-    return render_template('jump-color.html',
-                         page_title='Jump Color',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-blast')
-def cookie_blast():
-    faq_data = get_faqs_for_page('cookie-blast')
-    return render_template('cookie-blast.html',
-                         page_title='Cookie Blast',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/neon-360')
-def neon_360():
-    faq_data = get_faqs_for_page('neon-360')
-    return render_template('neon-360.html',
-                         page_title='Neon 360',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/extreme-thumb-war')
-def extreme_thumb_war():
-    faq_data = get_faqs_for_page('extreme-thumb-war')
-    return render_template('extreme-thumb-war.html',
-                         page_title='Extreme Thumb War',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/space-blaze')
-def space_blaze():
-    faq_data = get_faqs_for_page('space-blaze')
-    return render_template('space-blaze.html',
-                         page_title='Space Blaze',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/stickman-hook')
-def stickman_hook():
-    faq_data = get_faqs_for_page('stickman-hook')
-    return render_template('stickman-hook.html',
-                         page_title='Stickman Hook',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/stickman-vector')
-def stickman_vector():
-    faq_data = get_faqs_for_page('stickman-vector')
-    return render_template('stickman-vector.html',
-                         page_title='Stickman Vector',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/8-ball-pool')
-def game_8_ball_pool():
-    faq_data = get_faqs_for_page('8-ball-pool')
-    return render_template('8-ball-pool.html',
-                         page_title='8 Ball Pool',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/moto-maniac-2')
-def moto_maniac_2():
-    faq_data = get_faqs_for_page('moto-maniac-2')
-    return render_template('moto-maniac-2.html',
-                         page_title='Moto Maniac 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/space-hunting')
-def space_hunting():
-    faq_data = get_faqs_for_page('space-hunting')
-    return render_template('space-hunting.html',
-                         page_title='Space Hunting',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/stickman-shooter-2')
-def stickman_shooter_2():
-    faq_data = get_faqs_for_page('stickman-shooter-2')
-    return render_template('stickman-shooter-2.html',
-                         page_title='Stickman Shooter 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/happy-glass-2')
-def happy_glass_2():
-    faq_data = get_faqs_for_page('happy-glass-2')
-    return render_template('happy-glass-2.html',
-                         page_title='Happy Glass 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/neon-invaders')
-def neon_invaders():
-    faq_data = get_faqs_for_page('neon-invaders')
-    return render_template('neon-invaders.html',
-                         page_title='Neon Invaders',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/inca-adventure')
-def inca_adventure():
-    faq_data = get_faqs_for_page('inca-adventure')
-    return render_template('inca-adventure.html',
-                         page_title='Inca Adventure',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/shortcut-pro')
-def shortcut_pro():
-    faq_data = get_faqs_for_page('shortcut-pro')
-    return render_template('shortcut-pro.html',
-                         page_title='Shortcut Pro',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fireboy-and-watergirl')
-def fireboy_and_watergirl():
-    faq_data = get_faqs_for_page('fireboy-and-watergirl')
-    return render_template('fireboy-and-watergirl.html',
-                         page_title='Fireboy And Watergirl',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pull-mermaid-out')
-def pull_mermaid_out():
-    faq_data = get_faqs_for_page('pull-mermaid-out')
-    return render_template('pull-mermaid-out.html',
-                         page_title='Pull Mermaid Out',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/among-us-io')
-def among_us_io():
-    faq_data = get_faqs_for_page('among-us-io')
-    return render_template('among-us-io.html',
-                         page_title='Among Us Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/color-spin-2')
-def color_spin_2():
-    faq_data = get_faqs_for_page('color-spin-2')
-    return render_template('color-spin-2.html',
-                         page_title='Color Spin 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/wormo-io')
-def wormo_io():
-    faq_data = get_faqs_for_page('wormo-io')
-    return render_template('wormo-io.html',
-                         page_title='Wormo Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cut-the-rope-2')
-def cut_the_rope_2():
-    faq_data = get_faqs_for_page('cut-the-rope-2')
-    return render_template('cut-the-rope-2.html',
-                         page_title='Cut The Rope 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/colored-drawing')
-def colored_drawing():
-    faq_data = get_faqs_for_page('colored-drawing')
-    return render_template('colored-drawing.html',
-                         page_title='Colored Drawing',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/risky-rescue')
-def risky_rescue():
-    faq_data = get_faqs_for_page('risky-rescue')
-    return render_template('risky-rescue.html',
-                         page_title='Risky Rescue',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sweet-candy-mania')
-def sweet_candy_mania():
-    faq_data = get_faqs_for_page('sweet-candy-mania')
-    return render_template('sweet-candy-mania.html',
-                         page_title='Sweet Candy Mania',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/whack-a-mole')
-def whack_a_mole():
-    faq_data = get_faqs_for_page('whack-a-mole')
-    return render_template('whack-a-mole.html',
-                         page_title='Whack A Mole',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/mahjong')
-def mahjong():
-    faq_data = get_faqs_for_page('mahjong')
-    return render_template('mahjong.html',
-                         page_title='Mahjong',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/knife-hit')
-def knife_hit():
-    faq_data = get_faqs_for_page('knife-hit')
-    return render_template('knife-hit.html',
-                         page_title='Knife Hit',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/yohoho-io')
-def yohoho_io():
-    faq_data = get_faqs_for_page('yohoho-io')
-    return render_template('yohoho-io.html',
-                         page_title='Yohoho Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/aquapark-io')
-def aquapark_io():
-    faq_data = get_faqs_for_page('aquapark-io')
-    return render_template('aquapark-io.html',
-                         page_title='Aquapark Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/super-rocket-buddy')
-def super_rocket_buddy():
-    faq_data = get_faqs_for_page('super-rocket-buddy')
-    return render_template('super-rocket-buddy.html',
-                         page_title='Super Rocket Buddy',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/stack-colors')
-def stack_colors():
-    faq_data = get_faqs_for_page('stack-colors')
-    return render_template('stack-colors.html',
-                         page_title='Stack Colors',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-zoo')
-def idle_zoo():
-    faq_data = get_faqs_for_page('idle-zoo')
-    return render_template('idle-zoo.html',
-                         page_title='Idle Zoo',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/alphabet-kitchen')
-def alphabet_kitchen():
-    faq_data = get_faqs_for_page('alphabet-kitchen')
-    return render_template('alphabet-kitchen.html',
-                         page_title='Alphabet Kitchen',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/zombie-tsunami-online')
-def zombie_tsunami_online():
-    faq_data = get_faqs_for_page('zombie-tsunami-online')
-    return render_template('zombie-tsunami-online.html',
-                         page_title='Zombie Tsunami Online',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/spin-wheel')
-def spin_wheel():
-    faq_data = get_faqs_for_page('spin-wheel')
-    return render_template('spin-wheel.html',
-                         page_title='Spin Wheel',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/rolly-vortex')
-def rolly_vortex():
-    faq_data = get_faqs_for_page('rolly-vortex')
-    return render_template('rolly-vortex.html',
-                         page_title='Rolly Vortex',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fire-balls-3d')
-def fire_balls_3d():
-    faq_data = get_faqs_for_page('fire-balls-3d')
-    return render_template('fire-balls-3d.html',
-                         page_title='Fire Balls 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pop-it')
-def pop_it():
-    faq_data = get_faqs_for_page('pop-it')
-    return render_template('pop-it.html',
-                         page_title='Pop It',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/flyufo-io')
-def flyufo_io():
-    faq_data = get_faqs_for_page('flyufo-io')
-    return render_template('flyufo-io.html',
-                         page_title='Flyufo Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/hex-pipes')
-def hex_pipes():
-    faq_data = get_faqs_for_page('hex-pipes')
-    return render_template('hex-pipes.html',
-                         page_title='Hex Pipes',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pop-us')
-def pop_us():
-    faq_data = get_faqs_for_page('pop-us')
-    return render_template('pop-us.html',
-                         page_title='Pop Us',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/line-color')
-def line_color():
-    faq_data = get_faqs_for_page('line-color')
-    return render_template('line-color.html',
-                         page_title='Line Color',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/hole-io')
-def hole_io():
-    faq_data = get_faqs_for_page('hole-io')
-    return render_template('hole-io.html',
-                         page_title='Hole Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/element-evolution')
-def element_evolution():
-    faq_data = get_faqs_for_page('element-evolution')
-    return render_template('element-evolution.html',
-                         page_title='Element Evolution',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/burger-now')
-def burger_now():
-    faq_data = get_faqs_for_page('burger-now')
-    return render_template('burger-now.html',
-                         page_title='Burger Now',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/farm-panic')
-def farm_panic():
-    faq_data = get_faqs_for_page('farm-panic')
-    return render_template('farm-panic.html',
-                         page_title='Farm Panic',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/beat-hop')
-def beat_hop():
-    faq_data = get_faqs_for_page('beat-hop')
-    return render_template('beat-hop.html',
-                         page_title='Beat Hop',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/wings-rush')
-def wings_rush():
-    faq_data = get_faqs_for_page('wings-rush')
-    return render_template('wings-rush.html',
-                         page_title='Wings Rush',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/wormate-io')
-def wormate_io():
-    faq_data = get_faqs_for_page('wormate-io')
-    return render_template('wormate-io.html',
-                         page_title='Wormate Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/drunken-duel-2')
-def drunken_duel_2():
-    faq_data = get_faqs_for_page('drunken-duel-2')
-    return render_template('drunken-duel-2.html',
-                         page_title='Drunken Duel 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/super-buddy-kick')
-def super_buddy_kick():
-    faq_data = get_faqs_for_page('super-buddy-kick')
-    return render_template('super-buddy-kick.html',
-                         page_title='Super Buddy Kick',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/color-switch')
-def color_switch():
-    faq_data = get_faqs_for_page('color-switch')
-    return render_template('color-switch.html',
-                         page_title='Color Switch',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fast-words')
-def fast_words():
-    faq_data = get_faqs_for_page('fast-words')
-    return render_template('fast-words.html',
-                         page_title='Fast Words',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/bubble-spinner')
-def bubble_spinner():
-    faq_data = get_faqs_for_page('bubble-spinner')
-    return render_template('bubble-spinner.html',
-                         page_title='Bubble Spinner',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/muscle-race-3d')
-def muscle_race_3d():
-    faq_data = get_faqs_for_page('muscle-race-3d')
-    return render_template('muscle-race-3d.html',
-                         page_title='Muscle Race 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/among-us-space-rush')
-def among_us_space_rush():
-    faq_data = get_faqs_for_page('among-us-space-rush')
-    return render_template('among-us-space-rush.html',
-                         page_title='Among Us Space Rush',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sushi-roll-3d')
-def sushi_roll_3d():
-    faq_data = get_faqs_for_page('sushi-roll-3d')
-    return render_template('sushi-roll-3d.html',
-                         page_title='Sushi Roll 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/habbo-clicker')
-def habbo_clicker():
-    faq_data = get_faqs_for_page('habbo-clicker')
-    return render_template('habbo-clicker.html',
-                         page_title='Habbo Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/tap-tap-dash-online')
-def tap_tap_dash_online():
-    faq_data = get_faqs_for_page('tap-tap-dash-online')
-    return render_template('tap-tap-dash-online.html',
-                         page_title='Tap Tap Dash Online',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/spiral-roll')
-def spiral_roll():
-    faq_data = get_faqs_for_page('spiral-roll')
-    return render_template('spiral-roll.html',
-                         page_title='Spiral Roll',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/stick-duel-battle')
-def stick_duel_battle():
-    faq_data = get_faqs_for_page('stick-duel-battle')
-    return render_template('stick-duel-battle.html',
-                         page_title='Stick Duel Battle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pole-vault-3d')
-def pole_vault_3d():
-    faq_data = get_faqs_for_page('pole-vault-3d')
-    return render_template('pole-vault-3d.html',
-                         page_title='Pole Vault 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/unblock-ball')
-def unblock_ball():
-    faq_data = get_faqs_for_page('unblock-ball')
-    return render_template('unblock-ball.html',
-                         page_title='Unblock Ball',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/arrow-challenge')
-def arrow_challenge():
-    faq_data = get_faqs_for_page('arrow-challenge')
-    return render_template('arrow-challenge.html',
-                         page_title='Arrow Challenge',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/lolbeans-io')
-def lolbeans_io():
-    faq_data = get_faqs_for_page('lolbeans-io')
-    return render_template('lolbeans-io.html',
-                         page_title='Lolbeans Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/slice-a-lot')
-def slice_a_lot():
-    faq_data = get_faqs_for_page('slice-a-lot')
-    return render_template('slice-a-lot.html',
-                         page_title='Slice A Lot',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/rugbyio-ball-mayhem')
-def rugbyio_ball_mayhem():
-    faq_data = get_faqs_for_page('rugbyio-ball-mayhem')
-    return render_template('rugbyio-ball-mayhem.html',
-                         page_title='Rugbyio Ball Mayhem',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/slidey-block-puzzle')
-def slidey_block_puzzle():
-    faq_data = get_faqs_for_page('slidey-block-puzzle')
-    return render_template('slidey-block-puzzle.html',
-                         page_title='Slidey Block Puzzle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/squid-game')
-def squid_game():
-    faq_data = get_faqs_for_page('squid-game')
-    return render_template('squid-game.html',
-                         page_title='Squid Game',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/tricky-tiles')
-def tricky_tiles():
-    faq_data = get_faqs_for_page('tricky-tiles')
-    return render_template('tricky-tiles.html',
-                         page_title='Tricky Tiles',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-merge')
-def cookie_merge():
-    faq_data = get_faqs_for_page('cookie-merge')
-    return render_template('cookie-merge.html',
-                         page_title='Cookie Merge',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/target-hit-3d')
-def target_hit_3d():
-    faq_data = get_faqs_for_page('target-hit-3d')
-    return render_template('target-hit-3d.html',
-                         page_title='Target Hit 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pokeio')
-def pokeio():
-    faq_data = get_faqs_for_page('pokeio')
-    return render_template('pokeio.html',
-                         page_title='Pokeio',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-mining-empire')
-def idle_mining_empire():
-    faq_data = get_faqs_for_page('idle-mining-empire')
-    return render_template('idle-mining-empire.html',
-                         page_title='Idle Mining Empire',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/room-clicker')
-def room_clicker():
-    faq_data = get_faqs_for_page('room-clicker')
-    return render_template('room-clicker.html',
-                         page_title='Room Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/candy-clicker')
-def candy_clicker():
-    faq_data = get_faqs_for_page('candy-clicker')
-    return render_template('candy-clicker.html',
-                         page_title='Candy Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/sticky-road')
-def sticky_road():
-    faq_data = get_faqs_for_page('sticky-road')
-    return render_template('sticky-road.html',
-                         page_title='Sticky Road',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/gold-miner')
-def gold_miner():
-    faq_data = get_faqs_for_page('gold-miner')
-    return render_template('gold-miner.html',
-                         page_title='Gold Miner',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/house-flipper')
-def house_flipper():
-    faq_data = get_faqs_for_page('house-flipper')
-    return render_template('house-flipper.html',
-                         page_title='House Flipper',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/factory-idle')
-def factory_idle():
-    faq_data = get_faqs_for_page('factory-idle')
-    return render_template('factory-idle.html',
-                         page_title='Factory Idle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/grindcraft')
-def grindcraft():
-    faq_data = get_faqs_for_page('grindcraft')
-    return render_template('grindcraft.html',
-                         page_title='Grindcraft',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/my-sugar-factory')
-def my_sugar_factory():
-    faq_data = get_faqs_for_page('my-sugar-factory')
-    return render_template('my-sugar-factory.html',
-                         page_title='My Sugar Factory',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/juice-production-tycoon')
-def juice_production_tycoon():
-    faq_data = get_faqs_for_page('juice-production-tycoon')
-    return render_template('juice-production-tycoon.html',
-                         page_title='Juice Production Tycoon',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/dualforce-idle')
-def dualforce_idle():
-    faq_data = get_faqs_for_page('dualforce-idle')
-    return render_template('dualforce-idle.html',
-                         page_title='Dualforce Idle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/enchanted-heroes')
-def enchanted_heroes():
-    faq_data = get_faqs_for_page('enchanted-heroes')
-    return render_template('enchanted-heroes.html',
-                         page_title='Enchanted Heroes',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pinatamasters')
-def pinatamasters():
-    faq_data = get_faqs_for_page('pinatamasters')
-    return render_template('pinatamasters.html',
-                         page_title='Pinatamasters',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pou')
-def pou():
-    faq_data = get_faqs_for_page('pou')
-    return render_template('pou.html',
-                         page_title='Pou',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/ant-destroyer-2')
-def ant_destroyer_2():
-    faq_data = get_faqs_for_page('ant-destroyer-2')
-    return render_template('ant-destroyer-2.html',
-                         page_title='Ant Destroyer 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pull-him-out')
-def pull_him_out():
-    faq_data = get_faqs_for_page('pull-him-out')
-    return render_template('pull-him-out.html',
-                         page_title='Pull Him Out',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/freddy-run')
-def freddy_run():
-    faq_data = get_faqs_for_page('freddy-run')
-    return render_template('freddy-run.html',
-                         page_title='Freddy Run',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/adam-and-eve-go')
-def adam_and_eve_go():
-    faq_data = get_faqs_for_page('adam-and-eve-go')
-    return render_template('adam-and-eve-go.html',
-                         page_title='Adam And Eve Go',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/among-stacky-runner')
-def among_stacky_runner():
-    faq_data = get_faqs_for_page('among-stacky-runner')
-    return render_template('among-stacky-runner.html',
-                         page_title='Among Stacky Runner',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/diskio')
-def diskio():
-    faq_data = get_faqs_for_page('diskio')
-    return render_template('diskio.html',
-                         page_title='Diskio',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/slope-game')
-def slope_game():
-    faq_data = get_faqs_for_page('slope-game')
-    return render_template('slope-game.html',
-                         page_title='Slope Game',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fit-and-go-shape-puzzle')
-def fit_and_go_shape_puzzle():
-    faq_data = get_faqs_for_page('fit-and-go-shape-puzzle')
-    return render_template('fit-and-go-shape-puzzle.html',
-                         page_title='Fit And Go Shape Puzzle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/10x10-winter-gems')
-def game_10x10_winter_gems():
-    faq_data = get_faqs_for_page('10x10-winter-gems')
-    return render_template('10x10-winter-gems.html',
-                         page_title='10X10 Winter Gems',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/funny-bone-surgery')
-def funny_bone_surgery():
-    faq_data = get_faqs_for_page('funny-bone-surgery')
-    return render_template('funny-bone-surgery.html',
-                         page_title='Funny Bone Surgery',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pop-it-master')
-def pop_it_master():
-    faq_data = get_faqs_for_page('pop-it-master')
-    return render_template('pop-it-master.html',
-                         page_title='Pop It Master',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/helix-jump')
-def helix_jump():
-    faq_data = get_faqs_for_page('helix-jump')
-    return render_template('helix-jump.html',
-                         page_title='Helix Jump',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/teeth-runner')
-def teeth_runner():
-    faq_data = get_faqs_for_page('teeth-runner')
-    return render_template('teeth-runner.html',
-                         page_title='Teeth Runner',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-money-tree')
-def idle_money_tree():
-    faq_data = get_faqs_for_page('idle-money-tree')
-    return render_template('idle-money-tree.html',
-                         page_title='Idle Money Tree',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/rabbit-samurai-2')
-def rabbit_samurai_2():
-    faq_data = get_faqs_for_page('rabbit-samurai-2')
-    return render_template('rabbit-samurai-2.html',
-                         page_title='Rabbit Samurai 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/k-challenge-456')
-def k_challenge_456():
-    faq_data = get_faqs_for_page('k-challenge-456')
-    return render_template('k-challenge-456.html',
-                         page_title='K Challenge 456',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/conquer-the-city')
-def conquer_the_city():
-    faq_data = get_faqs_for_page('conquer-the-city')
-    return render_template('conquer-the-city.html',
-                         page_title='Conquer The City',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/helix-stack-ball')
-def helix_stack_ball():
-    faq_data = get_faqs_for_page('helix-stack-ball')
-    return render_template('helix-stack-ball.html',
-                         page_title='Helix Stack Ball',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/taps-to-riches')
-def taps_to_riches():
-    faq_data = get_faqs_for_page('taps-to-riches')
-    return render_template('taps-to-riches.html',
-                         page_title='Taps To Riches',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/ball-merge-2048')
-def ball_merge_2048():
-    faq_data = get_faqs_for_page('ball-merge-2048')
-    return render_template('ball-merge-2048.html',
-                         page_title='Ball Merge 2048',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/bubble-fight-io')
-def bubble_fight_io():
-    faq_data = get_faqs_for_page('bubble-fight-io')
-    return render_template('bubble-fight-io.html',
-                         page_title='Bubble Fight Io',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/color-drop')
-def color_drop():
-    faq_data = get_faqs_for_page('color-drop')
-    return render_template('color-drop.html',
-                         page_title='Color Drop',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/squid-challenge-2')
-def squid_challenge_2():
-    faq_data = get_faqs_for_page('squid-challenge-2')
-    return render_template('squid-challenge-2.html',
-                         page_title='Squid Challenge 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/mouth-shift-3d')
-def mouth_shift_3d():
-    faq_data = get_faqs_for_page('mouth-shift-3d')
-    return render_template('mouth-shift-3d.html',
-                         page_title='Mouth Shift 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/planet-clicker-2')
-def planet_clicker_2():
-    faq_data = get_faqs_for_page('planet-clicker-2')
-    return render_template('planet-clicker-2.html',
-                         page_title='Planet Clicker 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/shortcut-race-3d')
-def shortcut_race_3d():
-    faq_data = get_faqs_for_page('shortcut-race-3d')
-    return render_template('shortcut-race-3d.html',
-                         page_title='Shortcut Race 3D',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fruit-mahjong')
-def fruit_mahjong():
-    faq_data = get_faqs_for_page('fruit-mahjong')
-    return render_template('fruit-mahjong.html',
-                         page_title='Fruit Mahjong',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/merge-cakes')
-def merge_cakes():
-    faq_data = get_faqs_for_page('merge-cakes')
-    return render_template('merge-cakes.html',
-                         page_title='Merge Cakes',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/high-pizza-game')
-def high_pizza_game():
-    faq_data = get_faqs_for_page('high-pizza-game')
-    return render_template('high-pizza-game.html',
-                         page_title='High Pizza Game',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/fruit-master')
-def fruit_master():
-    faq_data = get_faqs_for_page('fruit-master')
-    return render_template('fruit-master.html',
-                         page_title='Fruit Master',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-farm')
-def idle_farm():
-    faq_data = get_faqs_for_page('idle-farm')
-    return render_template('idle-farm.html',
-                         page_title='Idle Farm',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/drift-boss')
-def drift_boss():
-    faq_data = get_faqs_for_page('drift-boss')
-    return render_template('drift-boss.html',
-                         page_title='Drift Boss',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/oil-tycoon-2')
-def oil_tycoon_2():
-    faq_data = get_faqs_for_page('oil-tycoon-2')
-    return render_template('oil-tycoon-2.html',
-                         page_title='Oil Tycoon 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-crush-3')
-def cookie_crush_3():
-    faq_data = get_faqs_for_page('cookie-crush-3')
-    return render_template('cookie-crush-3.html',
-                         page_title='Cookie Crush 3',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/city-blocks')
-def city_blocks():
-    faq_data = get_faqs_for_page('city-blocks')
-    return render_template('city-blocks.html',
-                         page_title='City Blocks',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/candy-clicker-2')
-def candy_clicker_2():
-    faq_data = get_faqs_for_page('candy-clicker-2')
-    return render_template('candy-clicker-2.html',
-                         page_title='Candy Clicker 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/smiling-glass-2')
-def smiling_glass_2():
-    faq_data = get_faqs_for_page('smiling-glass-2')
-    return render_template('smiling-glass-2.html',
-                         page_title='Smiling Glass 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/the-mergest-kingdom')
-def the_mergest_kingdom():
-    faq_data = get_faqs_for_page('the-mergest-kingdom')
-    return render_template('the-mergest-kingdom.html',
-                         page_title='The Mergest Kingdom',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/swing-robber')
-def swing_robber():
-    faq_data = get_faqs_for_page('swing-robber')
-    return render_template('swing-robber.html',
-                         page_title='Swing Robber',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-master')
-def cookie_master():
-    faq_data = get_faqs_for_page('cookie-master')
-    return render_template('cookie-master.html',
-                         page_title='Cookie Master',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/wood-block-puzzle')
-def wood_block_puzzle():
-    faq_data = get_faqs_for_page('wood-block-puzzle')
-    return render_template('wood-block-puzzle.html',
-                         page_title='Wood Block Puzzle',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-startup-tycoon')
-def idle_startup_tycoon():
-    faq_data = get_faqs_for_page('idle-startup-tycoon')
-    return render_template('idle-startup-tycoon.html',
-                         page_title='Idle Startup Tycoon',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/skydom')
-def skydom():
-    faq_data = get_faqs_for_page('skydom')
-    return render_template('skydom.html',
-                         page_title='Skydom',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cupcake-clicker')
-def cupcake_clicker():
-    faq_data = get_faqs_for_page('cupcake-clicker')
-    return render_template('cupcake-clicker.html',
-                         page_title='Cupcake Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pie-inc')
-def pie_inc():
-    faq_data = get_faqs_for_page('pie-inc')
-    return render_template('pie-inc.html',
-                         page_title='Pie Inc',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/crowd-drift-city')
-def crowd_drift_city():
-    faq_data = get_faqs_for_page('crowd-drift-city')
-    return render_template('crowd-drift-city.html',
-                         page_title='Crowd Drift City',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/puzzle-math')
-def puzzle_math():
-    faq_data = get_faqs_for_page('puzzle-math')
-    return render_template('puzzle-math.html',
-                         page_title='Puzzle Math',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-crush-mania')
-def cookie_crush_mania():
-    faq_data = get_faqs_for_page('cookie-crush-mania')
-    return render_template('cookie-crush-mania.html',
-                         page_title='Cookie Crush Mania',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/burger-clicker')
-def burger_clicker():
-    faq_data = get_faqs_for_page('burger-clicker')
-    return render_template('burger-clicker.html',
-                         page_title='Burger Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-miner-tycoon')
-def idle_miner_tycoon():
-    faq_data = get_faqs_for_page('idle-miner-tycoon')
-    return render_template('idle-miner-tycoon.html',
-                         page_title='Idle Miner Tycoon',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-crunch')
-def cookie_crunch():
-    faq_data = get_faqs_for_page('cookie-crunch')
-    return render_template('cookie-crunch.html',
-                         page_title='Cookie Crunch',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-blast-mania')
-def cookie_blast_mania():
-    faq_data = get_faqs_for_page('cookie-blast-mania')
-    return render_template('cookie-blast-mania.html',
-                         page_title='Cookie Blast Mania',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/grindcraft-2')
-def grindcraft_2():
-    faq_data = get_faqs_for_page('grindcraft-2')
-    return render_template('grindcraft-2.html',
-                         page_title='Grindcraft 2',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-run')
-def cookie_run():
-    faq_data = get_faqs_for_page('cookie-run')
-    return render_template('cookie-run.html',
-                         page_title='Cookie Run',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/shell-shockers')
-def shell_shockers():
-    faq_data = get_faqs_for_page('shell-shockers')
-    return render_template('shell-shockers.html',
-                         page_title='Shell Shockers',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/poppy-playtime')
-def poppy_playtime():
-    faq_data = get_faqs_for_page('poppy-playtime')
-    return render_template('poppy-playtime.html',
-                         page_title='Poppy Playtime',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-crush-pokemon')
-def cookie_crush_pokemon():
-    faq_data = get_faqs_for_page('cookie-crush-pokemon')
-    return render_template('cookie-crush-pokemon.html',
-                         page_title='Cookie Crush Pokemon',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/pixel-gold-clicker')
-def pixel_gold_clicker():
-    faq_data = get_faqs_for_page('pixel-gold-clicker')
-    return render_template('pixel-gold-clicker.html',
-                         page_title='Pixel Gold Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/word-cookies')
-def word_cookies():
-    faq_data = get_faqs_for_page('word-cookies')
-    return render_template('word-cookies.html',
-                         page_title='Word Cookies',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/blacksmith-clicker')
-def blacksmith_clicker():
-    faq_data = get_faqs_for_page('blacksmith-clicker')
-    return render_template('blacksmith-clicker.html',
-                         page_title='Blacksmith Clicker',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/idle-farm-tycoon')
-def idle_farm_tycoon():
-    faq_data = get_faqs_for_page('idle-farm-tycoon')
-    return render_template('idle-farm-tycoon.html',
-                         page_title='Idle Farm Tycoon',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-
-
-@app.route('/cookie-jam')
-def cookie_jam():
-    faq_data = get_faqs_for_page('cookie-jam')
-    return render_template('cookie-jam.html',
-                         page_title='Cookie Jam',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
+    未设置 METRICS_TOKEN 时返回 404，除非显式设置 METRICS_PUBLIC=1（例如只在内网监听的实例）
+    """
+    token = os.getenv('METRICS_TOKEN')
+    if not token:
+        if os.getenv('METRICS_PUBLIC', '0') != '1':
+            return 'Not Found', 404
+    elif request.headers.get('Authorization') != f'Bearer {token}':
+        return 'Forbidden', 403
+    response = app.response_class(metrics.exposition(), content_type=METRICS_CONTENT_TYPE)
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 if __name__ == '__main__':
     app.run(debug=True, port=5002)
@@ -1,10 +1,13 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
+import sys
 import urllib.parse
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from automation.http_client import http_client
+
 def build_image_map():
     base_url = "https://cookie-clicker2.com"
     ajax_url = "https://cookie-clicker2.com/paging.ajax"
@@ -20,7 +23,8 @@ def build_image_map():
         payload = {"page": str(page)}
         
         try:
-            resp = requests.post(ajax_url, data=payload, headers=headers, timeout=15)
+            # Listing pages are read-only, so this POST may be served from the response cache
+            resp = http_client.post(ajax_url, data=payload, headers=headers, timeout=15, cache=True)
             # The server actually returns a JSON-encoded string containing HTML (e.g. `" <div class=\"... "`)
             try:
                 html_content = json.loads(resp.text)
@@ -9,6 +9,9 @@ from ai_optimizer import AIOptimizer
 from template_generator import TemplateGenerator
 import logging
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from automation.http_client import http_client
+
 # Set up logging to output both to file and standard out
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -17,9 +20,7 @@ def get_latest_games_from_source():
     url = "https://cookie-clicker2.com/new-games"
     new_slugs = []
     try:
-        import cloudscraper
-        scraper = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True})
-        resp = scraper.get(url, timeout=15)
+        resp = http_client.get(url, browser=True, timeout=15)
         soup = BeautifulSoup(resp.content, "html.parser")
         games = soup.find_all("a", href=True)
         
@@ -164,6 +165,7 @@ def run_daily_update():
         except Exception as e:
             logging.error(f"Error processing {url}: {e}")
             failed_records.append(f"{slug} (Exception: {str(e)})")
+    scraper.save_caches()
 
     # Final wrap up
     # 1. Push to indexnow
@@ -191,11 +193,16 @@ def run_daily_update():
             logging.error(f"Could not hook into Google Search Console submitter: {e}")
             
     # 3. Inform Feishu Webhook
+    http_summary = http_client.summary()
+    logging.info(f"HTTP connection reuse: {http_summary}")
+    for host, stats in sorted(http_client.stats().items()):
+        logging.info(f"  {host}: {stats['requests']} requests, {stats['connections']} connections")
     summary = {
         "success_games": success_records,
         "failed_games": failed_records,
         "indexnow_status": indexnow_success,
         "gsc_sitemap_status": gsc_sitemap_success,
+        "http_summary": http_summary,
     }
     
     # Use WebhookSender
@@ -211,4 +218,11 @@ def run_daily_update():
         logging.error(f"Could not hook into Feishu sender: {e}")
 
 if __name__ == "__main__":
-    run_daily_update()
+    try:
+        run_daily_update()
+    finally:
+        # Once per run, so the cache saved by actions/cache between runs stays bounded
+        if http_client.cache is not None and http_client.cache.mode == 'on':
+            pruned = http_client.cache.prune()
+            logging.info(f"HTTP cache pruned: {pruned['expired']} expired, {pruned['orphaned']} orphaned, "
+                         f"{pruned['evicted']} evicted, {pruned['kept']} kept ({pruned['bytes'] / 1e6:.1f} MB)")
@@ -0,0 +1,346 @@
+"""Persistent response cache for the automation HTTP client.
+
+Responses are stored under AUTOMATION_HTTP_CACHE_DIR (default automation/.http_cache), one
+`<key>.json` (URL, status, headers, ETag / Last-Modified, fetch time) and one `<key>.body` per
+request, keyed by method, URL and request body.
+
+Modes (AUTOMATION_HTTP_CACHE):
+- on (default): responses younger than their URL class's TTL are served from disk; older ones
+  are revalidated with If-None-Match / If-Modified-Since and a 304 reuses the stored body
+- off: every request goes to the network
+- record: every request goes to the network and every response (any status, any URL class)
+  is stored, to build an offline fixture set
+- replay: nothing goes to the network; stored responses are served regardless of age and
+  unrecorded requests raise requests.ConnectionError
+
+TTL policies are (pattern, seconds) pairs matched against the URL in order; a TTL of 0 means
+"always revalidate" and None means "never cache" (still recorded and replayed). In mode `on` only
+GET and HEAD are cached; other methods go straight to the network unless the caller opts in with
+cache=True (e.g. the read-only paging.ajax POST used for the image map).
+
+Requests made with stream=True are written to disk chunk by chunk and served from the stored
+body file, so a large download (e.g. a sitemap) is never held in memory by the cache.
+
+prune() runs once per run (at the end of daily_update.py) in mode `on`: entries not refreshed
+within their TTL plus a grace period (AUTOMATION_HTTP_CACHE_GRACE_DAYS, default 7) are no longer
+requested and are removed, as are half-written files, and the oldest entries are then evicted
+until the store fits AUTOMATION_HTTP_CACHE_MAX_MB (default 256). Record / replay stores are
+fixtures and are never pruned.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODES = ('off', 'on', 'record', 'replay')
+# Methods cached in mode `on` without an explicit opt-in
+CACHEABLE_METHODS = ('GET', 'HEAD')
+DAY = 24 * 3600
+
+TTL_POLICIES = (
+    # What the daily run is looking for: always ask the source whether it changed
+    (r'/sitemap[^/]*\.xml$', 0),
+    (r'/new-games/?$', 0),
+    # Listing pages used for the image map
+    (r'/paging\.ajax$', 6 * 3600),
+    # Images never change under the same URL in practice
+    (r'\.(?:jpe?g|png|gif|webp)(?:\?|$)', 30 * DAY),
+    # Submissions and pings have side effects
+    (r'indexnow|google\.com/ping|open\.feishu\.cn', None),
+    # Game detail pages on the source site
+    (r'^https?://(?:www\.)?cookie-clicker2\.com/[^/?#]+/?$', 7 * DAY),
+)
+# Everything else (mostly iframe / embed pages)
+DEFAULT_TTL = DAY
+# Read size when storing a streamed body
+CHUNK_SIZE = 64 * 1024
+# An entry is dropped once it has gone this long past its TTL without being requested again
+PRUNE_GRACE = 7 * DAY
+PRUNE_MAX_BYTES = 256 * 1024 * 1024
+# Temp files older than this are left over from a killed run
+STALE_TMP_AGE = 3600
+
+# The stored body is already decoded, so these no longer describe it
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+class ResponseCache:
+    """On-disk HTTP response store with conditional revalidation and record / replay."""
+
+    def __init__(self, directory, mode='on', policies=TTL_POLICIES, default_ttl=DEFAULT_TTL,
+                 grace=PRUNE_GRACE, max_bytes=PRUNE_MAX_BYTES):
+        if mode not in MODES:
+            raise ValueError(f"unknown cache mode {mode!r}, expected one of {', '.join(MODES)}")
+        self.directory = directory
+        self.mode = mode
+        self.policies = tuple((re.compile(pattern), ttl) for pattern, ttl in policies)
+        self.default_ttl = default_ttl
+        self.grace = grace
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.counts = {'hits': 0, 'revalidated': 0, 'misses': 0, 'replayed': 0, 'stored': 0}
+
+    def ttl(self, url):
+        """TTL in seconds for url's class (None = not cacheable)."""
+        for pattern, ttl in self.policies:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def key(self, method, url, data=None, json_body=None):
+        if isinstance(data, dict):
+            data = urllib.parse.urlencode(sorted(data.items()))
+        if json_body is not None:
+            data = json.dumps(json_body, sort_keys=True)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        digest = hashlib.sha256(f'{method.upper()} {url}\n'.encode('utf-8'))
+        if data:
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, f'{key}{suffix}')
+
+    def load(self, key, stream=False):
+        """Stored (meta, body) for key, or None; with stream, body is the open body file."""
+        try:
+            with open(self._path(key, '.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if stream:
+                return meta, open(self._path(key, '.body'), 'rb')
+            with open(self._path(key, '.body'), 'rb') as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, data):
+        """Atomically write bytes, or an iterable of byte chunks, to path."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if isinstance(data, bytes):
+                    f.write(data)
+                else:
+                    for chunk in data:
+                        f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def save(self, key, method, url, response, body):
+        os.makedirs(self.directory, exist_ok=True)
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        meta = {
+            'method': method.upper(),
+            'url': url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': time.time(),
+        }
+        # Body first, so a reader never sees metadata without its body
+        self._write(self._path(key, '.body'), body)
+        self._write(self._path(key, '.json'), json.dumps(meta, indent=2, sort_keys=True).encode('utf-8'))
+        self._count('stored')
+
+    def _touch(self, key, meta):
+        meta['stored_at'] = time.time()
+        self._write(self._path(key, '.json'), json.dumps(meta, indent=2, sort_keys=True).encode('utf-8'))
+
+    def _count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    @staticmethod
+    def build_response(meta, body, source):
+        """A requests.Response backed by the stored body (bytes, or a file read lazily)."""
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta.get('reason')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.url = meta['url']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        if isinstance(body, bytes):
+            response._content = body
+            response._content_consumed = True
+        else:
+            response.raw = body
+        response.from_cache = source
+        return response
+
+    def _save_streamed(self, key, method, url, response, source):
+        """Store a streamed response's body chunk by chunk and serve it back from disk."""
+        try:
+            self.save(key, method, url, response, response.iter_content(CHUNK_SIZE))
+        finally:
+            response.close()
+        stored = self.load(key, stream=True)
+        if stored is None:
+            raise requests.ConnectionError(f"{method.upper()} {url}: stored response disappeared from {self.directory}")
+        return self.build_response(*stored, source=source)
+
+    def fetch(self, method, url, send, data=None, json_body=None, headers=None, stream=False, cache=False):
+        """
+        Serve a request from the store or through send(headers) -> requests.Response.
+
+        send is called at most once, with the request headers plus any validators. With
+        stream, stored bodies are returned as files and new ones are written to disk
+        without being read into memory. In mode `on`, methods other than GET / HEAD are
+        only cached with cache=True; record and replay cover every method.
+        """
+        if self.mode == 'off':
+            return send(headers)
+        key = self.key(method, url, data, json_body)
+
+        if self.mode == 'replay':
+            stored = self.load(key, stream)
+            if stored is None:
+                raise requests.ConnectionError(f"{method.upper()} {url} is not recorded in {self.directory}")
+            self._count('replayed')
+            return self.build_response(*stored, source='replay')
+
+        if self.mode == 'record':
+            response = send(headers)
+            self._count('misses')
+            if stream:
+                return self._save_streamed(key, method, url, response, source='record')
+            self.save(key, method, url, response, response.content)
+            return response
+
+        if method.upper() not in CACHEABLE_METHODS and not cache:
+            return send(headers)
+        ttl = self.ttl(url)
+        if ttl is None:
+            return send(headers)
+        stored = self.load(key, stream)
+        if stored is not None:
+            meta, body = stored
+            if time.time() - meta['stored_at'] < ttl:
+                self._count('hits')
+                return self.build_response(meta, body, source='hit')
+            if stream:
+                body.close()
+                stored = meta, None
+            if method.upper() == 'GET' and (meta.get('etag') or meta.get('last_modified')):
+                headers = dict(headers or {})
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+
+        response = send(headers)
+        if response.status_code == 304 and stored is not None:
+            response.close()
+            meta, body = self.load(key, stream) if stream else stored
+            self._touch(key, meta)
+            self._count('revalidated')
+            return self.build_response(meta, body, source='revalidated')
+
+        self._count('misses')
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', ''):
+            if stream:
+                return self._save_streamed(key, method, url, response, source='stored')
+            self.save(key, method, url, response, response.content)
+        return response
+
+    def _remove(self, key):
+        """Remove an entry's files; returns the bytes freed."""
+        freed = 0
+        # Metadata first, so a reader never sees metadata without its body
+        for suffix in ('.json', '.body'):
+            try:
+                path = self._path(key, suffix)
+                size = os.path.getsize(path)
+                os.unlink(path)
+                freed += size
+            except OSError:
+                pass
+        return freed
+
+    def prune(self, now=None):
+        """
+        Drop entries nobody asks for any more, then evict the oldest until under max_bytes.
+
+        An entry is refreshed (stored or touched by a 304) every time it is requested past its
+        TTL, so one whose age exceeds TTL + grace has not been requested for at least `grace`.
+        Entries whose URL class is no longer cached (TTL None) go too, as do bodies without
+        metadata (and vice versa) and stale temp files. Only runs in mode `on`.
+
+        Returns:
+            dict: {'expired', 'orphaned', 'evicted', 'kept', 'bytes'} (bytes = size after pruning)
+        """
+        result = {'expired': 0, 'orphaned': 0, 'evicted': 0, 'kept': 0, 'bytes': 0}
+        if self.mode != 'on' or not os.path.isdir(self.directory):
+            return result
+        now = now or time.time()
+        sizes, metas = {}, {}
+        for entry in os.scandir(self.directory):
+            key, suffix = os.path.splitext(entry.name)
+            if suffix == '.tmp':
+                if now - entry.stat().st_mtime > STALE_TMP_AGE:
+                    os.unlink(entry.path)
+                continue
+            if suffix not in ('.json', '.body'):
+                continue
+            sizes[key] = sizes.get(key, 0) + entry.stat().st_size
+            if suffix == '.json':
+                metas[key] = None
+
+        live = []
+        for key in sizes:
+            meta = None
+            if key in metas and os.path.exists(self._path(key, '.body')):
+                try:
+                    with open(self._path(key, '.json'), 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    pass
+            if meta is None:
+                self._remove(key)
+                result['orphaned'] += 1
+                continue
+            ttl = self.ttl(meta['url'])
+            if ttl is None or now - meta['stored_at'] > ttl + self.grace:
+                self._remove(key)
+                result['expired'] += 1
+                continue
+            live.append((meta['stored_at'], key))
+
+        total = sum(sizes[key] for _, key in live)
+        live.sort()
+        while live and total > self.max_bytes:
+            _, key = live.pop(0)
+            total -= sizes[key]
+            self._remove(key)
+            result['evicted'] += 1
+        result['kept'] = len(live)
+        result['bytes'] = total
+        return result
+
+    def summary(self):
+        counts = dict(self.counts)
+        return (f"cache {self.mode}: {counts['hits']} fresh, {counts['revalidated']} revalidated (304), "
+                f"{counts['misses']} fetched, {counts['replayed']} replayed, {counts['stored']} stored")
+
+
+def cache_from_env():
+    """ResponseCache configured from AUTOMATION_HTTP_CACHE / _DIR / _GRACE_DAYS / _MAX_MB."""
+    directory = os.getenv('AUTOMATION_HTTP_CACHE_DIR') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '.http_cache')
+    return ResponseCache(
+        directory,
+        mode=os.getenv('AUTOMATION_HTTP_CACHE', 'on'),
+        grace=float(os.getenv('AUTOMATION_HTTP_CACHE_GRACE_DAYS', '7')) * DAY,
+        max_bytes=int(float(os.getenv('AUTOMATION_HTTP_CACHE_MAX_MB', '256')) * 1024 * 1024),
+    )
@@ -0,0 +1,167 @@
+"""Shared HTTP client for the automation scripts.
+
+Every fetcher (sitemap, detail pages, iframe chains, image map, image downloads) goes through
+the module-level `http_client`, which keeps one pooled session per (host, kind):
+
+- kind "browser" is a cloudscraper session, used for the source site behind its anti-bot shield;
+  the challenge is solved once per host and its cookies are reused for later pages
+- kind "plain" is a requests session for everything else
+
+Each session keeps up to AUTOMATION_HTTP_POOL_SIZE keep-alive connections, retries
+connection errors and 429/5xx responses AUTOMATION_HTTP_RETRIES times with exponential
+backoff, and uses AUTOMATION_HTTP_TIMEOUT seconds unless a call passes its own timeout.
+
+Responses go through the on-disk cache in automation/http_cache.py (TTL per URL class,
+conditional revalidation, record / replay; see AUTOMATION_HTTP_CACHE). Only GET and HEAD are
+cached by default; pass cache=True to cache a side-effect-free POST.
+
+`http_client.stats()` reports requests and new connections per host; `summary()` formats
+them, with the cache counts, for the run summary.
+"""
+import os
+import threading
+import urllib.parse
+
+import requests
+from urllib3.util.retry import Retry
+
+from automation.http_cache import cache_from_env
+
+BROWSER = {'browser': 'chrome', 'platform': 'windows', 'desktop': True}
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host across threads."""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url):
+        host = urllib.parse.urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+        return semaphore
+
+
+class HttpClient:
+    """Pooled sessions per host, shared across threads."""
+
+    def __init__(self, pool_size=10, timeout=20, retries=2, backoff=0.5, cache=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _retry(self):
+        return Retry(total=self.retries, connect=self.retries, read=self.retries, status=self.retries,
+                     backoff_factor=self.backoff, status_forcelist=RETRY_STATUSES, raise_on_status=False)
+
+    def _configure(self, session):
+        # Keep each adapter's own class (cloudscraper's https adapter carries its TLS settings),
+        # only resize its pool and add retries
+        for adapter in session.adapters.values():
+            adapter.max_retries = self._retry()
+            adapter._pool_connections = 4
+            adapter._pool_maxsize = self.pool_size
+            adapter.init_poolmanager(4, self.pool_size, block=False)
+        return session
+
+    def session(self, url, browser=False):
+        """The shared session for url's host."""
+        key = ('browser' if browser else 'plain', urllib.parse.urlparse(url).netloc.lower())
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    if browser:
+                        import cloudscraper
+                        session = cloudscraper.create_scraper(browser=BROWSER)
+                    else:
+                        session = requests.Session()
+                    session = self._sessions[key] = self._configure(session)
+        return session
+
+    def request(self, method, url, browser=False, cache=False, **kwargs):
+        """Send a request; cache=True lets the response cache store a method other than GET / HEAD."""
+        kwargs.setdefault('timeout', self.timeout)
+        if self.cache is None:
+            return self.session(url, browser).request(method, url, **kwargs)
+
+        def send(headers):
+            # The session is only created when the cache actually needs the network
+            return self.session(url, browser).request(method, url, **dict(kwargs, headers=headers))
+
+        return self.cache.fetch(method, url, send, data=kwargs.get('data'), json_body=kwargs.get('json'),
+                                headers=kwargs.get('headers'), stream=kwargs.get('stream', False), cache=cache)
+
+    def get(self, url, browser=False, **kwargs):
+        """GET through the pooled session; browser=True uses cloudscraper."""
+        return self.request('GET', url, browser, **kwargs)
+
+    def post(self, url, browser=False, **kwargs):
+        return self.request('POST', url, browser, **kwargs)
+
+    def stats(self):
+        """Requests and new connections per host, across all sessions.
+
+        Returns:
+            dict: {host: {'requests', 'connections', 'reused'}}
+        """
+        hosts = {}
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    entry = hosts.setdefault(pool.host, {'requests': 0, 'connections': 0})
+                    entry['requests'] += pool.num_requests
+                    entry['connections'] += pool.num_connections
+        for entry in hosts.values():
+            entry['reused'] = max(0, entry['requests'] - entry['connections'])
+        return hosts
+
+    def summary(self):
+        """One line for logs and the run report, e.g. "42 requests, 5 connections (88% reused) ..."."""
+        stats = self.stats()
+        requests_made = sum(entry['requests'] for entry in stats.values())
+        connections = sum(entry['connections'] for entry in stats.values())
+        if requests_made:
+            reused = max(0, requests_made - connections) / requests_made
+            line = f"{requests_made} requests, {connections} connections ({reused:.0%} reused) across {len(stats)} hosts"
+        else:
+            line = "no network requests"
+        if self.cache is not None and self.cache.mode != 'off':
+            line = f"{line}; {self.cache.summary()}"
+        return line
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.close()
+
+
+def client_from_env():
+    """HttpClient configured from AUTOMATION_HTTP_POOL_SIZE / _TIMEOUT / _RETRIES."""
+    return HttpClient(
+        pool_size=int(os.getenv('AUTOMATION_HTTP_POOL_SIZE', '10')),
+        timeout=float(os.getenv('AUTOMATION_HTTP_TIMEOUT', '20')),
+        retries=int(os.getenv('AUTOMATION_HTTP_RETRIES', '2')),
+        cache=cache_from_env(),
+    )
+
+
+http_client = client_from_env()
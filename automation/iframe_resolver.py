@@ -0,0 +1,236 @@
+"""Memoized resolver from game wrapper pages to the game's CDN URL.
+
+Game pages embed the game through up to a few levels of wrapper pages
+(cookie-clicker2.com/<slug>.embed -> ... -> html5.gamemonetize.com/<id>/). The resolver follows
+the first <iframe> on each page until it reaches a known CDN host, and remembers the outcome
+for every URL on the chain in a JSON file (IFRAME_RESOLVER_CACHE, default
+automation/.iframe_cache.json), so the wrapper -> CDN mapping is fetched once rather than every run.
+
+Outcomes and how long they are trusted:
+- cdn: the chain reached a known CDN host (IFRAME_KNOWN_HOSTS); kept for IFRAME_CDN_TTL_DAYS (90)
+- page: a page without a further iframe, returned as-is (it may be the game itself, or a
+  challenge page); retried after IFRAME_PAGE_TTL_DAYS (7)
+- error: fetching failed, the URL reached so far is returned; retried after IFRAME_ERROR_TTL_HOURS (24)
+
+resolve_many() resolves a batch concurrently: URLs are grouped by host and interleaved so the
+workers spread across hosts, and a HostLimiter caps the requests in flight per host.
+
+Usage:
+    python -m automation.iframe_resolver [--refresh] [--workers 16] [--per-host 8]   # re-resolve games.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from automation.http_client import HostLimiter, http_client
+
+AUTOMATION_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_KNOWN_HOSTS = ("html5.gamemonetize.com", "gamedistribution.com", "gamesnacks.com", "poki.com", "crazygames.com")
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+DAY = 24 * 3600
+
+
+def host_of(url):
+    return urllib.parse.urlparse(url).netloc.lower()
+
+
+class IframeResolver:
+    """Follows nested iframes to a known CDN host, with a persistent per-URL cache.
+
+    Args:
+        cache_path (str): JSON file holding resolved chains
+        known_hosts (iterable): CDN hosts; a URL matches a host or any of its subdomains
+        max_depth (int): deepest nested level followed (3 = at most 4 pages fetched)
+        ttls (dict): seconds each outcome ('cdn', 'page', 'error') stays valid
+        host_limit (HostLimiter): per-host cap on concurrent requests, shared with other fetchers
+        client (HttpClient): HTTP client, defaults to the shared automation client
+    """
+
+    def __init__(self, cache_path, known_hosts=DEFAULT_KNOWN_HOSTS, max_depth=3, ttls=None, host_limit=None, client=None):
+        self.cache_path = cache_path
+        self.known_hosts = tuple(host.lower() for host in known_hosts)
+        self.max_depth = max_depth
+        self.ttls = dict({'cdn': 90 * DAY, 'page': 7 * DAY, 'error': DAY}, **(ttls or {}))
+        self.host_limit = host_limit or HostLimiter(4)
+        self.client = client or http_client
+        self._entries = self._load()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.counts = Counter()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Write the cache if anything changed since the last save.
+
+        The lock is held through the atomic replace, so a concurrent save can never put an
+        older snapshot over a newer file. Meant to be called once per run, not per resolve.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, indent=1, sort_keys=True)
+            directory = os.path.dirname(os.path.abspath(self.cache_path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+
+    def is_known(self, url):
+        host = host_of(url)
+        return any(host == known or host.endswith('.' + known) for known in self.known_hosts)
+
+    def cached(self, url, now=None):
+        """The unexpired cache entry for url, or None."""
+        entry = self._entries.get(url)
+        if entry is None or entry['expires_at'] < (now or time.time()):
+            return None
+        return entry
+
+    def _count(self, outcome):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def _remember(self, chain, result, outcome, expires_at=None):
+        now = time.time()
+        entry = {'result': result, 'outcome': outcome, 'resolved_at': now,
+                 'expires_at': expires_at or now + self.ttls[outcome]}
+        with self._lock:
+            # Every hop on the chain leads to the same result
+            for url in chain:
+                self._entries[url] = dict(entry, hops=len(chain) - chain.index(url))
+            self._dirty = True
+
+    def _next_hop(self, url):
+        with self.host_limit(url):
+            response = self.client.get(url, headers={"User-Agent": USER_AGENT}, timeout=10)
+        # The client returns 403 / 429 / 5xx pages once its retries are spent; they have no iframe
+        # but must be cached as errors (short TTL), not as pages without a CDN iframe
+        response.raise_for_status()
+        iframe = BeautifulSoup(response.content, "html.parser").find("iframe")
+        if not iframe or not iframe.get("src"):
+            return None
+        src = iframe.get("src").strip()
+        if src.startswith("//"):
+            return "https:" + src
+        return urllib.parse.urljoin(url, src)
+
+    def resolve(self, url, cancel=None, refresh=False):
+        """CDN URL behind url (or the deepest page reached), using the cache unless refresh.
+
+        If `cancel` (a threading.Event) is set, stops descending and returns the current URL
+        without caching it.
+        """
+        if not url or self.is_known(url):
+            return url
+        chain = []
+        current = url
+        for _ in range(self.max_depth + 1):
+            entry = None if refresh else self.cached(current)
+            if entry is not None:
+                self._count('cached')
+                if chain:
+                    self._remember(chain, entry['result'], entry['outcome'], entry['expires_at'])
+                return entry['result']
+            if cancel is not None and cancel.is_set():
+                return current
+            chain.append(current)
+            try:
+                src = self._next_hop(current)
+            except Exception as e:
+                logging.warning(f"Deep scrap error at depth {len(chain) - 1} for {current}: {e}")
+                self._count('error')
+                self._remember(chain, current, 'error')
+                return current
+            if src is None:
+                self._count('page')
+                self._remember(chain, current, 'page')
+                return current
+            if self.is_known(src):
+                self._count('cdn')
+                self._remember(chain, src, 'cdn')
+                return src
+            current = src
+        # Ran out of depth: same as the original recursion, return the last URL reached
+        self._count('page')
+        self._remember(chain, current, 'page')
+        return current
+
+    def resolve_many(self, urls, workers=16, refresh=False):
+        """Resolve a batch concurrently.
+
+        Returns:
+            OrderedDict: url -> result, in the order given
+        """
+        unique = list(OrderedDict.fromkeys(url for url in urls if url))
+        by_host = OrderedDict()
+        for url in unique:
+            by_host.setdefault(host_of(url), []).append(url)
+        # Round-robin across hosts so a slow host does not tie up every worker
+        ordered = [url for batch in zip_longest(*by_host.values()) for url in batch if url is not None]
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="iframe") as executor:
+            results = dict(zip(ordered, executor.map(lambda url: self.resolve(url, refresh=refresh), ordered)))
+        self.save()
+        return OrderedDict((url, results[url]) for url in unique)
+
+    def summary(self):
+        counts = self.counts
+        return (f"{counts['cached']} cached, {counts['cdn']} resolved to a CDN, "
+                f"{counts['page']} without a CDN iframe, {counts['error']} errors")
+
+
+def resolver_from_env(host_limit=None):
+    """IframeResolver configured from IFRAME_* environment variables."""
+    known_hosts = os.getenv('IFRAME_KNOWN_HOSTS')
+    return IframeResolver(
+        os.getenv('IFRAME_RESOLVER_CACHE') or os.path.join(AUTOMATION_DIR, '.iframe_cache.json'),
+        known_hosts=[host.strip() for host in known_hosts.split(',') if host.strip()] if known_hosts else DEFAULT_KNOWN_HOSTS,
+        ttls={
+            'cdn': float(os.getenv('IFRAME_CDN_TTL_DAYS', '90')) * DAY,
+            'page': float(os.getenv('IFRAME_PAGE_TTL_DAYS', '7')) * DAY,
+            'error': float(os.getenv('IFRAME_ERROR_TTL_HOURS', '24')) * 3600,
+        },
+        host_limit=host_limit or HostLimiter(int(os.getenv('SCRAPER_PER_HOST', '4'))),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resolve the iframe URL of every game in games.json')
+    parser.add_argument('--games-json', default=os.path.join(os.path.dirname(AUTOMATION_DIR), 'static', 'game-config', 'games.json'))
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=None, help='concurrent requests per host (default SCRAPER_PER_HOST)')
+    parser.add_argument('--refresh', action='store_true', help='ignore cached results')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    with open(args.games_json, 'r', encoding='utf-8') as f:
+        urls = [game.get('url') for game in json.load(f).get('games', [])]
+    resolver = resolver_from_env(HostLimiter(args.per_host) if args.per_host else None)
+    started = time.perf_counter()
+    results = resolver.resolve_many(urls, workers=args.workers, refresh=args.refresh)
+    elapsed = time.perf_counter() - started
+    logging.info(f"Resolved {len(results)} game URLs in {elapsed:.1f}s: {resolver.summary()}")
+    logging.info(f"HTTP: {http_client.summary()}")
+
+
+if __name__ == '__main__':
+    main()
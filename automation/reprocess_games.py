@@ -47,6 +47,7 @@ def reprocess_all():
         except Exception as e:
             print(f"Error processing {url}: {e}")
             traceback.print_exc()
+    scraper.save_caches()
 
 if __name__ == "__main__":
     reprocess_all()
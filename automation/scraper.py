@@ -1,50 +1,57 @@
-import requests
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
 import urllib.parse
+import inspect
 import os
+import sys
 import json
 import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Works both as `automation.scraper` and when run from inside automation/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from automation.http_client import HostLimiter, http_client
+from automation.iframe_resolver import resolver_from_env
+from automation.sitemap import SitemapScan, SitemapWatermark
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Candidate pages scraped in parallel by get_new_games (1 = one at a time, in sitemap order)
+DEFAULT_WORKERS = int(os.getenv("SCRAPER_WORKERS", "8"))
+# Simultaneous requests allowed to any single host, shared by all workers
+DEFAULT_PER_HOST = int(os.getenv("SCRAPER_PER_HOST", "4"))
+
+
 class GameScraper:
-    def __init__(self, sitemap_url="https://cookie-clicker2.com/sitemap.xml", processed_log="automation/processed_games.json"):
+    def __init__(self, sitemap_url="https://cookie-clicker2.com/sitemap.xml", processed_log="automation/processed_games.json",
+                 workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST, sitemap_state=None, incremental=True):
         self.sitemap_url = sitemap_url
         self.processed_log = processed_log
         self.processed_games = self._load_processed_games()
+        # Newest sitemap <lastmod> already handled; kept next to the processed log unless given
+        self.sitemap_watermark = SitemapWatermark(
+            sitemap_state or os.path.join(os.path.dirname(processed_log), 'sitemap_state.json'), sitemap_url)
+        self.incremental = incremental
+        self.workers = max(1, workers)
+        self.host_limit = HostLimiter(max(1, per_host))
+        # Shares the per-host cap with the detail page fetches
+        self.iframe_resolver = resolver_from_env(host_limit=self.host_limit)
 
-    def get_deep_iframe(self, url, depth=0, max_depth=3):
-        """Recursively fetch nested iframes to find the actual game source URL."""
-        if depth > max_depth or not url:
-            return url
-            
+    def get_deep_iframe(self, url, cancel=None):
+        """Follow nested iframes to find the actual game source URL.
+
+        Resolved chains are cached across runs by `self.iframe_resolver` (see iframe_resolver.py);
+        the cache file is written once per run by iter_new_games, or by callers through save_caches().
+        If `cancel` (a threading.Event) is set, stops descending and returns the current URL.
+        """
+        return self.iframe_resolver.resolve(url, cancel=cancel)
+
+    def save_caches(self):
+        """Write the iframe resolution cache; call once at the end of a run."""
         try:
-            headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"}
-            resp = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(resp.content, "html.parser")
-            
-            iframe = soup.find("iframe")
-            if not iframe or not iframe.get("src"):
-                return url
-                
-            src = iframe.get("src")
-            if src.startswith("//"):
-                src = "https:" + src
-            elif src.startswith("/"):
-                parsed = urllib.parse.urlparse(url)
-                src = urllib.parse.urljoin(f"{parsed.scheme}://{parsed.netloc}", src)
-                
-            # Known game CDNs directly returned
-            known_hosts = ["html5.gamemonetize.com", "gamedistribution.com", "gamesnacks.com", "poki.com", "crazygames.com"]
-            if any(host in src for host in known_hosts):
-                return src
-                
-            return self.get_deep_iframe(src, depth + 1, max_depth)
-            
-        except Exception as e:
-            logging.warning(f"Deep scrap error at depth {depth} for {url}: {e}")
-            return url
+            self.iframe_resolver.save()
+        except OSError as e:
+            logging.error(f"Failed to save the iframe resolution cache: {e}")
 
     def _load_processed_games(self):
         if os.path.exists(self.processed_log):
@@ -63,44 +70,30 @@ class GameScraper:
             json.dump(list(self.processed_games), f, indent=2)
 
     def fetch_sitemap_urls(self):
-        """Fetch all URLs from the sitemap"""
+        """Fetch all URLs from the sitemap (following a sitemap index), ignoring the watermark"""
         logging.info(f"Fetching sitemap from {self.sitemap_url}")
+        scan = SitemapScan(self.sitemap_url)
         try:
-            import cloudscraper
-            scraper = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True})
-            response = scraper.get(self.sitemap_url, timeout=15)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
-            # Handle XML namespace
-            namespace = ""
-            if "}" in root.tag:
-                namespace = root.tag.split("}")[0] + "}"
-            
-            urls = []
-            for url_elem in root.findall(f"{namespace}url"):
-                loc = url_elem.find(f"{namespace}loc")
-                if loc is not None and loc.text:
-                    urls.append(loc.text.strip())
-            
+            urls = [entry.loc for entry in scan]
             logging.info(f"Found {len(urls)} URLs in sitemap")
             return urls
         except Exception as e:
             logging.error(f"Failed to fetch or parse sitemap: {e}")
             return []
 
-    def scrape_game_page(self, url):
-        """Extract metadata, iframe, and images from a single game page."""
+    def scrape_game_page(self, url, cancel=None):
+        """Extract metadata, iframe, and images from a single game page.
+
+        Returns None without fetching anything once `cancel` (a threading.Event) is set.
+        """
+        if cancel is not None and cancel.is_set():
+            return None
         logging.info(f"Scraping {url}...")
         try:
-            # Use cloudscraper to bypass advanced Anti-Bot/Cloudflare shields commonly encountered in CI IPs
-            import cloudscraper
-            scraper = cloudscraper.create_scraper(browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            })
-            response = scraper.get(url, timeout=20)
+            # Use cloudscraper to bypass advanced Anti-Bot/Cloudflare shields commonly encountered in CI IPs;
+            # the shared session keeps its connections and clearance cookies between pages
+            with self.host_limit(url):
+                response = http_client.get(url, browser=True, timeout=20)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -128,7 +121,7 @@ class GameScraper:
                 base_iframe_src = urllib.parse.urljoin(base_url, base_iframe_src)
                 
             # Perform Deep Scraping to bypass Cloudflare and get direct CDN link
-            data['iframe_src'] = self.get_deep_iframe(base_iframe_src)
+            data['iframe_src'] = self.get_deep_iframe(base_iframe_src, cancel=cancel)
             
             # OG Image fallback
             og_image = soup.find('meta', property='og:image')
@@ -177,12 +170,10 @@ class GameScraper:
             logging.error(f"Error scraping {url}: {e}")
             return None
 
-    def get_new_games(self, limit=1):
-        """Finds games from sitemap that haven't been processed yet."""
-        urls = self.fetch_sitemap_urls()
-        
-        new_games_data = []
-        for url in urls:
+    def _candidate_urls(self, entries):
+        """Sitemap entries that look like unprocessed game pages, in sitemap order."""
+        for entry in entries:
+            url = entry.loc
             # Skip root domain or weird routes
             if url.count('/') <= 3 and (url.endswith('com') or url.endswith('com/')):
                 continue
@@ -194,16 +185,125 @@ class GameScraper:
                     continue
                 if '.' in slug: # To prevent pulling domain names or broken routes
                     continue
-                    
-                game_data = self.scrape_game_page(url)
-                if game_data and game_data['iframe_src']: # Ensure it's actually a playable game
-                    new_games_data.append(game_data)
-                    logging.info(f"Found new valid game: {slug}")
-                    
-                    if len(new_games_data) >= limit:
-                        break
-        
-        return new_games_data
+                yield entry
+
+    def _sitemap_entries(self, scan):
+        """The scan's entries; a failing sitemap ends the run with nothing found, as before."""
+        logging.info(f"Fetching sitemap from {self.sitemap_url}"
+                     + (f" (entries modified since {scan.since.isoformat()})" if scan.since else ""))
+        try:
+            yield from scan
+            logging.info(f"Sitemap: {scan.summary()}")
+        except Exception as e:
+            logging.error(f"Failed to fetch or parse sitemap: {e}")
+
+    def _settle_sitemap(self, scan, remaining, unsettled):
+        """Advance the sitemap watermark past every entry this run has finished with.
+
+        When the run stopped before the end of the sitemap (limit reached, or the caller stopped
+        iterating), the entries not read yet may be older than anything seen, so the watermark is
+        left where it is; the rest of the scan is abandoned rather than fetched just to settle it.
+
+        Args:
+            scan (SitemapScan): this run's scan
+            remaining (generator): the candidate generator the run was consuming
+            unsettled (list): lastmod of picked candidates that need another look
+        """
+        try:
+            if inspect.getgeneratorstate(remaining) != inspect.GEN_CLOSED:
+                # Closing it also closes the sitemap body being read
+                remaining.close()
+                logging.info(f"Stopped before the end of the sitemap; watermark left at {self.sitemap_watermark.value}")
+                return
+            oldest = min((lastmod for lastmod in unsettled if lastmod is not None), default=None)
+            if self.sitemap_watermark.settle(scan, oldest):
+                logging.info(f"Sitemap watermark advanced to {self.sitemap_watermark.value.isoformat()}")
+        except Exception as e:
+            logging.error(f"Failed to update the sitemap watermark: {e}")
+
+    def iter_new_games(self, limit=1, workers=None):
+        """Yields up to `limit` playable new games from the sitemap.
+
+        In incremental mode only sitemap entries modified at or after the stored watermark are
+        considered (inclusive, so same-day pages behind a date-only <lastmod> are not lost; games
+        already processed are filtered out), and the watermark then advances to what this run
+        finished with: pages that were scraped and turned out not to be playable are not retried
+        until their <lastmod> changes (except those sharing the watermark's own <lastmod>), while
+        failed pages, games handed to the caller (until they are marked
+        processed) and candidates never reached are looked at again next run. The watermark
+        only moves on runs that read the sitemap to the end; a run that stops at `limit` leaves
+        it in place instead of reading the rest of the sitemap.
+
+        With more than one worker, candidate pages (and their iframe chains) are scraped
+        concurrently and games are yielded in completion order. At most `workers` candidates
+        are in flight, requests to each host are capped by `host_limit`, and once `limit`
+        games are found no new candidates start and in-flight iframe chains stop early.
+        """
+        if limit <= 0:
+            return
+        workers = self.workers if workers is None else max(1, workers)
+        scan = SitemapScan(self.sitemap_url, since=self.sitemap_watermark.value if self.incremental else None)
+        candidates = self._candidate_urls(self._sitemap_entries(scan))
+        unsettled = []
+
+        if workers == 1:
+            try:
+                found = 0
+                for entry in candidates:
+                    game_data = self.scrape_game_page(entry.loc)
+                    if game_data is None or game_data['iframe_src']:
+                        unsettled.append(entry.lastmod)
+                    if game_data and game_data['iframe_src']: # Ensure it's actually a playable game
+                        logging.info(f"Found new valid game: {game_data['slug']}")
+                        yield game_data
+                        found += 1
+                        if found >= limit:
+                            return
+            finally:
+                self._settle_sitemap(scan, candidates, unsettled)
+                self.save_caches()
+            return
+
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+        pending = {}
+
+        def submit_next():
+            for entry in candidates:
+                pending[executor.submit(self.scrape_game_page, entry.loc, cancel)] = entry.lastmod
+                return True
+            return False
+
+        try:
+            for _ in range(workers):
+                if not submit_next():
+                    break
+            found = 0
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    lastmod = pending.pop(future)
+                    game_data = future.result()
+                    if game_data is None or game_data['iframe_src']:
+                        unsettled.append(lastmod)
+                    if game_data and game_data['iframe_src'] and found < limit:
+                        logging.info(f"Found new valid game: {game_data['slug']}")
+                        found += 1
+                        yield game_data
+                        if found >= limit:
+                            return
+                    submit_next()
+        finally:
+            # Also runs when the caller stops iterating early
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            unsettled.extend(pending.values())
+            self._settle_sitemap(scan, candidates, unsettled)
+            self.save_caches()
+
+    def get_new_games(self, limit=1, workers=None):
+        """Finds games from sitemap that haven't been processed yet."""
+        return list(self.iter_new_games(limit, workers))
 
     def mark_as_processed(self, slug):
         self._save_processed_game(slug)
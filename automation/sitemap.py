@@ -0,0 +1,297 @@
+"""Streaming sitemap reader with <sitemapindex> support and a persistent lastmod watermark.
+
+SitemapScan parses sitemaps incrementally (XMLPullParser fed in chunks, each <url> cleared once
+read), so memory stays flat however many URLs the upstream sitemap lists. A <sitemapindex> is
+followed into its child sitemaps; gzip-compressed children (sitemap.xml.gz) are inflated on the fly.
+
+With `since` (a datetime), entries whose <lastmod> is older are skipped, and child sitemaps
+whose <lastmod> is older are not fetched at all. The comparison is inclusive: date-only values
+(2024-05-01) all map to midnight, so a page added later on the watermark's day carries the same
+<lastmod> and must still be returned; callers dedupe what they have already handled. Entries
+without a <lastmod> are always returned. SitemapWatermark stores `since` per sitemap URL in a small JSON file
+(automation/sitemap_state.json next to processed_games.json) between runs.
+
+Usage:
+    python -m automation.sitemap [URL] [--since 2024-01-01]   # count new / changed entries
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from collections import Counter, namedtuple
+from datetime import datetime, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from automation.http_client import http_client
+
+CHUNK_SIZE = 64 * 1024
+# Network responses are spooled to disk past this size before parsing, so the connection is not
+# held open while the caller scrapes pages between entries
+SPOOL_SIZE = 1024 * 1024
+# An index may point at further indexes; deeper nesting is ignored
+MAX_DEPTH = 2
+
+SitemapEntry = namedtuple('SitemapEntry', 'loc lastmod')
+
+
+def parse_lastmod(text):
+    """W3C datetime (2024-05-01, 2024-05-01T10:00:00+08:00, ...) as an aware UTC datetime, or None."""
+    text = (text or '').strip()
+    if not text:
+        return None
+    try:
+        value = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        for fmt in ('%Y-%m', '%Y'):
+            try:
+                value = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _inflate(chunks):
+    """Byte chunks, with a gzip-compressed document (sitemap.xml.gz) inflated in bounded pieces."""
+    decompressor = None
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if decompressor is None:
+            decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16) if chunk[:2] == b'\x1f\x8b' else False
+        if not decompressor:
+            yield chunk
+            continue
+        data = decompressor.decompress(chunk, CHUNK_SIZE)
+        while data:
+            yield data
+            data = decompressor.decompress(decompressor.unconsumed_tail, CHUNK_SIZE)
+    if decompressor:
+        yield decompressor.flush()
+
+
+class _ElementReader:
+    """Turns the pull parser's events into (kind, loc, lastmod) tuples, clearing what it has read."""
+
+    def __init__(self):
+        self.parser = ET.XMLPullParser(events=('start', 'end'))
+        self.root = None
+
+    def _bind(self, root):
+        # <url> / <sitemap> and their fields live in the root element's namespace
+        self.root = root
+        namespace = root.tag[:root.tag.index('}') + 1] if root.tag.startswith('{') else ''
+        self.kinds = {namespace + 'url': 'url', namespace + 'sitemap': 'sitemap'}
+        self.loc = namespace + 'loc'
+        self.lastmod = namespace + 'lastmod'
+
+    def read(self):
+        entries = []
+        for event, elem in self.parser.read_events():
+            if self.root is None:
+                self._bind(elem)
+                continue
+            if event == 'start':
+                continue
+            kind = self.kinds.get(elem.tag)
+            if kind is None:
+                continue
+            loc = (elem.findtext(self.loc) or '').strip()
+            lastmod = parse_lastmod(elem.findtext(self.lastmod))
+            # Drop everything parsed so far; only the open root element stays in memory
+            self.root.clear()
+            if loc:
+                entries.append((kind, loc, lastmod))
+        return entries
+
+
+def iter_elements(chunks):
+    """(kind, loc, lastmod) for each <url> or <sitemap> of a sitemap document given as byte chunks.
+
+    Tags are matched in the root element's namespace, so image:loc / video:* extensions are ignored.
+    """
+    reader = _ElementReader()
+    for chunk in _inflate(chunks):
+        reader.parser.feed(chunk)
+        yield from reader.read()
+    reader.parser.close()
+    yield from reader.read()
+
+
+class SitemapScan:
+    """Iterates the SitemapEntry(loc, lastmod) of a sitemap or sitemap index, not older than `since`.
+
+    After a full iteration `complete` is True and `latest` holds the newest <lastmod> of any URL
+    read; `counts` tracks sitemaps fetched / skipped and URLs returned / unchanged. A child sitemap
+    that fails to load is logged and skipped, leaving `complete` False.
+
+    Args:
+        url (str): sitemap or sitemap index URL
+        since (datetime): only return entries modified at or after this (None = everything)
+        client (HttpClient): HTTP client, defaults to the shared automation client
+    """
+
+    def __init__(self, url, since=None, client=None, max_depth=MAX_DEPTH):
+        self.url = url
+        self.since = since
+        self.client = client or http_client
+        self.max_depth = max_depth
+        self.complete = False
+        self.latest = None
+        self.counts = Counter()
+
+    def _is_new(self, lastmod):
+        return lastmod is None or self.since is None or lastmod >= self.since
+
+    def _open(self, url):
+        """The sitemap body as a file positioned at the start."""
+        response = self.client.get(url, browser=True, timeout=15, stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        if getattr(response, 'from_cache', None):
+            # Already on disk: read straight from the response cache's body file
+            return response.raw
+        with response:
+            body = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+            for chunk in response.iter_content(CHUNK_SIZE):
+                body.write(chunk)
+        body.seek(0)
+        return body
+
+    def _iter_sitemap(self, url, depth, visited):
+        visited.add(url)
+        self.counts['sitemaps'] += 1
+        body = self._open(url)
+        try:
+            for kind, loc, lastmod in iter_elements(iter(lambda: body.read(CHUNK_SIZE), b'')):
+                if kind == 'sitemap':
+                    if depth >= self.max_depth or loc in visited:
+                        continue
+                    if not self._is_new(lastmod):
+                        self.counts['unchanged sitemaps'] += 1
+                        continue
+                    try:
+                        yield from self._iter_sitemap(loc, depth + 1, visited)
+                    except Exception as e:
+                        logging.error(f"Failed to fetch or parse child sitemap {loc}: {e}")
+                        self.counts['failed sitemaps'] += 1
+                    continue
+                if lastmod is not None and (self.latest is None or lastmod > self.latest):
+                    self.latest = lastmod
+                if not self._is_new(lastmod):
+                    self.counts['unchanged'] += 1
+                    continue
+                self.counts['urls'] += 1
+                yield SitemapEntry(loc, lastmod)
+        finally:
+            body.close()
+
+    def __iter__(self):
+        self.complete = False
+        self.latest = None
+        self.counts.clear()
+        yield from self._iter_sitemap(self.url, 0, set())
+        self.complete = not self.counts['failed sitemaps']
+
+    def summary(self):
+        counts = self.counts
+        line = (f"{counts['urls']} new or changed URLs, {counts['unchanged']} unchanged, "
+                f"{counts['sitemaps']} sitemaps fetched")
+        if counts['unchanged sitemaps']:
+            line += f", {counts['unchanged sitemaps']} unchanged sitemaps skipped"
+        if counts['failed sitemaps']:
+            line += f", {counts['failed sitemaps']} failed"
+        return line
+
+
+class SitemapWatermark:
+    """Newest <lastmod> already handled for a sitemap URL, persisted in a JSON file.
+
+    Args:
+        path (str): state file shared by all sitemaps ({sitemap_url: {'watermark', 'updated_at'}})
+        sitemap_url (str): the sitemap this watermark belongs to
+    """
+
+    def __init__(self, path, sitemap_url):
+        self.path = path
+        self.sitemap_url = sitemap_url
+        entry = self._load().get(sitemap_url) or {}
+        self.value = parse_lastmod(entry.get('watermark'))
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def advance(self, value):
+        """Move the watermark forward to value (never backwards) and save it."""
+        if value is None or (self.value is not None and value <= self.value):
+            return False
+        self.value = value
+        state = self._load()
+        state[self.sitemap_url] = {
+            'watermark': value.isoformat(),
+            'updated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        return True
+
+    def settle(self, scan, unsettled=None):
+        """Advance after a complete scan.
+
+        Args:
+            scan (SitemapScan): the finished scan
+            unsettled (datetime): oldest lastmod among entries that still need another look
+                (failed, or handed to the caller but not yet processed), if any
+
+        Returns:
+            bool: whether the watermark moved
+        """
+        if not scan.complete:
+            logging.warning(f"Sitemap scan of {self.sitemap_url} was incomplete, watermark left at {self.value}")
+            return False
+        if unsettled is not None:
+            # Everything older than the oldest unfinished entry is done; `since` is inclusive,
+            # so that entry is returned again
+            return self.advance(unsettled)
+        if scan.latest is None:
+            return False
+        # A <lastmod> in the future would hide entries published before it
+        return self.advance(min(scan.latest, datetime.now(timezone.utc)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the new or changed entries of a sitemap')
+    parser.add_argument('url', nargs='?', default='https://cookie-clicker2.com/sitemap.xml')
+    parser.add_argument('--since', help='W3C datetime; only entries modified at or after it are counted')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    scan = SitemapScan(args.url, since=parse_lastmod(args.since))
+    started = time.perf_counter()
+    entries = sum(1 for _ in scan)
+    logging.info(f"{entries} entries in {time.perf_counter() - started:.2f}s: {scan.summary()} (newest lastmod {scan.latest})")
+    logging.info(f"HTTP: {http_client.summary()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,13 @@
 import os
+import sys
 import json
-import requests
 import logging
 
+# Allow importing the app-side utils package when run from automation/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.faq_store import FaqStore
+from automation.http_client import http_client
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class TemplateGenerator:
@@ -12,7 +17,6 @@ class TemplateGenerator:
         self.images_dir = os.path.join(base_dir, "static", "images", "games")
         self.favicon_dir = os.path.join(base_dir, "static", "images", "favicon")
         self.data_dir = os.path.join(base_dir, "static", "data")
-        self.app_py_path = os.path.join(base_dir, "app.py")
         
         # Ensure all necessary output directories exist
         for d in [self.templates_dir, self.images_dir, self.favicon_dir, self.data_dir]:
@@ -40,20 +44,12 @@ class TemplateGenerator:
         temp_img = os.path.join(tempfile.gettempdir(), f"{slug}_dl.img")
         try:
             headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            # CI 环境网络较慢，使用 30 秒超时并支持一次重试
-            response = None
-            for attempt in range(2):
-                try:
-                    response = requests.get(source_url, headers=headers, stream=True, timeout=30)
-                    response.raise_for_status()
-                    break
-                except Exception as retry_err:
-                    logging.warning(f"Image download attempt {attempt+1} failed for {slug}: {retry_err}")
-                    if attempt == 1:
-                        raise
-            with open(temp_img, 'wb') as f:
-                for chunk in response.iter_content(1024):
-                    f.write(chunk)
+            # CI 环境网络较慢，使用 30 秒超时；连接错误和 5xx 由共享客户端重试
+            with http_client.get(source_url, headers=headers, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                with open(temp_img, 'wb') as f:
+                    for chunk in response.iter_content(64 * 1024):
+                        f.write(chunk)
                     
             img = Image.open(temp_img)
             img = img.convert("RGBA")
@@ -115,19 +111,9 @@ class TemplateGenerator:
         # Generate thumbnail and favicons
         self._process_image_assets(img_source, slug)
         
-        # 2. Update FAQs JSON
-        faqs_path = os.path.join(self.data_dir, "faqs.json")
-        try:
-            with open(faqs_path, 'r', encoding='utf-8') as f:
-                all_faqs = json.load(f)
-        except Exception:
-            all_faqs = {}
-            
-        all_faqs[slug] = faqs_data
-        
-        with open(faqs_path, 'w', encoding='utf-8') as f:
-            json.dump(all_faqs, f, indent=2, ensure_ascii=False)
-            logging.info(f"Updated faqs.json with data for {slug}")
+        # 2. Update FAQ store (appends one record instead of rewriting every game's FAQs)
+        FaqStore(self.data_dir).put(slug, faqs_data)
+        logging.info(f"Updated FAQ store with data for {slug}")
 
         # 3. Generate HTML Template
         html_content = self._create_html_content(slug, optimized_tdk)
@@ -137,18 +123,11 @@ class TemplateGenerator:
             f.write(html_content)
         logging.info(f"Generated template at {html_path}")
 
-        # 4. Modify app.py to add route
-        self._add_route_to_app(slug)
-
-        # 5. Update games.json
+        # 4. Update games.json (app.py routes every game listed here with a template)
         games_json = os.path.join(self.base_dir, "static", "game-config", "games.json")
         self._update_games_json(games_json, slug, display_title, game_data.get('iframe_src'))
         
-        # 6. Update trending_games.html
-        trending_html = os.path.join(self.base_dir, "templates", "components", "trending_games.html")
-        self._update_trending_games(trending_html, slug, display_title)
-        
-        # 7. Update sitemap.xml
+        # 5. Update sitemap.xml (the trending grid is generated from games.json at runtime)
         sitemap_path = os.path.join(self.base_dir, "static", "sitemap.xml")
         self._update_sitemap(sitemap_path, slug)
         
@@ -208,47 +187,6 @@ class TemplateGenerator:
 """
         return template
 
-    def _add_route_to_app(self, slug):
-        # Create a safe python function name
-        function_name = slug.replace('-', '_').replace('.', '_')
-        if function_name[0].isdigit():
-            function_name = f"game_{function_name}"
-            
-        # Check if route already exists
-        with open(self.app_py_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if f"def {function_name}()" in content or f"/{slug}'" in content or f'/{slug}"' in content:
-                logging.info(f"Route for {slug} seems to already exist in app.py. Skipping injection.")
-                return
-
-        # Prepare snippet
-        route_snippet = f"""
-@app.route('/{slug}')
-def {function_name}():
-    faq_data = get_faqs_for_page('{slug}')
-    return render_template('{slug}.html',
-                         page_title='{slug.replace('-', ' ').title()}',
-                         dynamic_faqs=faq_data.get('faqs', []),
-                         conclusion=faq_data.get('conclusion', ''),
-                         translations=get_translations())
-"""
-        # Append to the end of app.py to avoid complex parsing problems, ensuring it's above any if __name__ == '__main__': if needed.
-        # This is a basic injection hook. In real-world projects we might look for a specific marker.
-        logging.info(f"Injecting route {function_name} into {self.app_py_path}")
-        
-        lines = content.split('\n')
-        # find where to insert: preferably right before if __name__ == "__main__": or at the end
-        insert_idx = len(lines)
-        for i, line in enumerate(lines):
-            if line.strip().startswith("if __name__ =="):
-                insert_idx = i
-                break
-                
-        lines.insert(insert_idx, route_snippet)
-        
-        with open(self.app_py_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-
     def _update_games_json(self, path, slug, title, url):
         try:
             with open(path, 'r', encoding='utf-8') as f:
@@ -272,44 +210,6 @@ def {function_name}():
         except Exception as e:
             logging.error(f"Failed to update games.json: {e}")
 
-    def _update_trending_games(self, path, slug, title):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            content = "".join(lines)
-            if f'href="https://bearclicker.net/{slug}"' in content:
-                return # Already exists
-                
-            components = f"""            <!-- {title} Card -->
-            <a href="https://bearclicker.net/{slug}" class="group relative rounded-lg overflow-hidden shadow-lg transition-transform duration-300 hover:transform hover:scale-105 flex flex-col">
-                <div class="relative">
-                    <img src="{{{{ url_for('static', filename='images/games/{slug}.jpg') }}}}" 
-                         alt="{title} img" loading="lazy" class="w-full aspect-[4/3] object-cover">
-                    <div class="absolute inset-0 bg-gradient-to-t from-black/30 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-300"></div>
-                </div>
-                <div class="p-2 bg-gray-100 dark:bg-gray-800">
-                    <p class="text-xs sm:text-sm font-medium text-gray-800 dark:text-gray-200 truncate text-center">
-                        {{{{ translations.get('trending', {{}}).get('{slug.replace('-', '_')}', '{title}') }}}}
-                    </p>
-                </div>
-            </a>
-"""
-            # Insert right after the grid container div to be the absolute first item
-            insert_idx = -1
-            for i, line in enumerate(lines):
-                if 'class="grid' in line and 'grid-cols-2' in line:
-                    insert_idx = i
-                    break
-                    
-            if insert_idx != -1:
-                lines.insert(insert_idx + 1, components)
-                with open(path, 'w', encoding='utf-8') as f:
-                    f.writelines(lines)
-                logging.info(f"Added {slug} to trending_games.html")
-        except Exception as e:
-            logging.error(f"Failed to update trending_games.html: {e}")
-
     def _update_sitemap(self, path, slug):
         """将新游戏的 URL 追加到 sitemap.xml 中（如尚未存在）"""
         try:
@@ -344,7 +244,7 @@ def {function_name}():
             # Ping Google to notify of sitemap update
             try:
                 ping_url = "https://www.google.com/ping?sitemap=https://bearclicker.net/sitemap.xml"
-                requests.get(ping_url, timeout=5)
+                http_client.get(ping_url, timeout=5)
                 logging.info("Pinged Google to re-crawl sitemap.xml")
             except Exception:
                 pass  # Non-fatal, don't raise
@@ -0,0 +1,68 @@
+"""
+冷启动基准测试：从 `import wsgi` 到第一个 /cookie-clicker 响应的耗时
+
+每次运行都在全新的子进程中进行，分别测量：
+- no-cache：不使用模板字节码缓存（JINJA_BYTECODE_CACHE=0）
+- cache：使用预编译的字节码缓存（先预编译到临时目录）
+
+用法：
+    python benchmarks/cold_start_bench.py [--runs 5] [--path /cookie-clicker]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, logging, sys, time
+start = time.perf_counter()
+import wsgi
+imported = time.perf_counter()
+logging.disable(logging.INFO)
+response = wsgi.app.test_client().get(sys.argv[1])
+done = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({'import_ms': (imported - start) * 1e3, 'first_response_ms': (done - imported) * 1e3,
+                  'total_ms': (done - start) * 1e3}))
+"""
+
+
+def run_once(path, env):
+    output = subprocess.check_output([sys.executable, '-c', CHILD, path], cwd=ROOT_DIR, env=env,
+                                     stderr=subprocess.DEVNULL)
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/cookie-clicker')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        subprocess.check_call([sys.executable, '-m', 'utils.template_cache', '--dir', cache_dir],
+                              cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        modes = {
+            'no-cache': dict(os.environ, JINJA_BYTECODE_CACHE='0'),
+            'cache': dict(os.environ, JINJA_BYTECODE_CACHE='1', JINJA_BYTECODE_CACHE_DIR=cache_dir),
+        }
+
+        # 先跑一次让 Python 的 .pyc 就绪，避免第一次运行偏慢
+        run_once(args.path, modes['no-cache'])
+
+        print(f"{args.path}, {args.runs} runs (median)")
+        print(f"{'mode':<10} {'import(ms)':>12} {'first response(ms)':>20} {'total(ms)':>12}")
+        for mode, env in modes.items():
+            results = [run_once(args.path, env) for _ in range(args.runs)]
+            median = {key: statistics.median(r[key] for r in results) for key in results[0]}
+            print(f"{mode:<10} {median['import_ms']:>12.1f} {median['first_response_ms']:>20.1f} "
+                  f"{median['total_ms']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+响应压缩基准测试：每个请求的传输字节数和 CPU 时间
+
+对比几种方式：
+- identity：不带 Accept-Encoding，即改造前的未压缩响应
+- gzip-per-request：未压缩响应再逐次 gzip（没有缓存压缩结果时的代价）
+- gzip / br：带 Accept-Encoding，由页面缓存中的预压缩版本或构建时生成的 .gz / .br 直接返回
+
+路径包括随机抽取的游戏详情页、/、/api/games、sitemap.xml 和 static 下的 css / js。
+静态文件的预压缩版本需要先运行 `python export_static.py --assets-only` 生成。
+
+用法：
+    python benchmarks/compression_bench.py [--pages 20] [--rounds 5]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.compression import SUPPORTED_ENCODINGS, gzip_bytes  # noqa: E402
+
+
+def _paths(game_pages, pages):
+    rng = random.Random(42)
+    slugs = rng.sample(sorted(game_pages), min(pages, len(game_pages)))
+    return [f'/{slug}' for slug in slugs] + [
+        '/', '/api/games', '/sitemap.xml', '/static/css/style.css', '/static/js/main.min.js',
+    ]
+
+
+def _fetch(client, path, headers):
+    response = client.get(path, headers=headers)
+    response.direct_passthrough = False
+    body = response.get_data()
+    response.close()
+    return body
+
+
+def run_mode(client, paths, mode, rounds):
+    headers = {'Accept-Encoding': mode} if mode in SUPPORTED_ENCODINGS else {}
+    for path in paths:
+        _fetch(client, path, headers)
+
+    wire_bytes = 0
+    requests = 0
+    start = time.process_time()
+    for _ in range(rounds):
+        for path in paths:
+            body = _fetch(client, path, headers)
+            if mode == 'gzip-per-request':
+                body = gzip_bytes(body, level=6)
+            wire_bytes += len(body)
+            requests += 1
+    cpu = time.process_time() - start
+    return {
+        'mode': mode,
+        'requests': requests,
+        'avg_bytes': wire_bytes / requests,
+        'cpu_us': cpu / requests * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='number of game pages to sample')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    from app import GAME_PAGES, app
+
+    client = app.test_client()
+    paths = _paths(GAME_PAGES, args.pages)
+
+    print(f"{len(paths)} paths x {args.rounds} rounds")
+    print(f"{'mode':<18} {'avg bytes':>12} {'cpu/request(us)':>16}")
+    for mode in ('identity', 'gzip-per-request') + SUPPORTED_ENCODINGS:
+        result = run_mode(client, paths, mode, args.rounds)
+        print(f"{mode:<18} {result['avg_bytes']:>12.0f} {result['cpu_us']:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+每日自动更新流程的离线基准测试：在回放模式下完整运行 automation/daily_update.py
+
+每次运行都在临时目录中的仓库副本里执行（流程会改写 games.json、sitemap、模板和补位队列），
+HTTP 请求全部由 AUTOMATION_HTTP_CACHE=replay 从夹具目录回放，不访问网络；
+AI、Search Console 和飞书的密钥从环境中移除，AI 使用内置的回退结果。
+
+夹具来源：
+- --record DIR：在副本中对真实源站运行一次（AUTOMATION_HTTP_CACHE=record），把所有响应保存到 DIR
+- --synthesize DIR：生成一组合成夹具（3 个新游戏的列表页、详情页、iframe、封面图等），不需要网络
+- --fixtures DIR：使用已有的夹具
+
+用法：
+    python benchmarks/daily_update_bench.py --synthesize /tmp/daily_fixtures [--runs 3]
+    python benchmarks/daily_update_bench.py --fixtures /tmp/daily_fixtures --runs 5
+    python benchmarks/daily_update_bench.py --record /tmp/daily_fixtures
+"""
+import argparse
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from automation.http_cache import ResponseCache  # noqa: E402
+
+SOURCE = 'https://cookie-clicker2.com'
+SYNTHETIC_SLUGS = ('bench-farm-clicker', 'bench-rocket-idle', 'bench-candy-merge')
+# 运行副本需要的文件；static/images 等大目录由流程按需创建
+COPY_PATHS = ('automation', 'utils', 'templates', 'indexnow.py',
+              'static/game-config', 'static/data', 'static/sitemap.xml')
+SECRET_PREFIXES = ('OPENAI_', 'GEMINI_', 'DEEPSEEK_', 'FEISHU_', 'GOOGLE_SEARCH_CONSOLE_')
+
+DETAIL_PAGE = """<!DOCTYPE html>
+<html><head>
+<title>{title} - Play {title} On Cookie Clicker 2</title>
+<meta name="description" content="{title} is a free clicker game. Click, upgrade and automate your way to the top.">
+<link rel="canonical" href="{source}/{slug}">
+<meta property="og:image" content="/images/{slug}.jpg">
+<link rel="icon" href="/favicon.png">
+</head><body>
+<iframe src="{source}/embed/{slug}"></iframe>
+<div id="description"><p>{title} is a clicker game. Click to earn coins, buy upgrades and unlock new worlds.</p></div>
+</body></html>
+"""
+
+
+def make_sandbox():
+    sandbox = tempfile.mkdtemp(prefix='daily-update-')
+    ignore = shutil.ignore_patterns('__pycache__', '.http_cache', '.iframe_cache.json', '*.pid')
+    for path in COPY_PATHS:
+        source = os.path.join(ROOT_DIR, path)
+        target = os.path.join(sandbox, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isdir(source):
+            shutil.copytree(source, target, ignore=ignore)
+        elif os.path.exists(source):
+            shutil.copy2(source, target)
+    return sandbox
+
+
+def pipeline_env(mode, fixtures):
+    env = {name: value for name, value in os.environ.items() if not name.startswith(SECRET_PREFIXES)}
+    env.update({'AUTOMATION_HTTP_CACHE': mode, 'AUTOMATION_HTTP_CACHE_DIR': os.path.abspath(fixtures)})
+    return env
+
+
+def run_pipeline(sandbox, mode, fixtures):
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, 'daily_update.py'], cwd=os.path.join(sandbox, 'automation'),
+                            env=pipeline_env(mode, fixtures), capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f'daily_update.py exited with {result.returncode}')
+    return elapsed, result.stderr
+
+
+def _store(cache, method, url, body, content_type, status=200, data=None, json_body=None):
+    meta = {'url': url, 'status': status, 'reason': 'OK', 'headers': {'Content-Type': content_type}}
+    response = cache.build_response(meta, body, source='synthetic')
+    cache.save(cache.key(method, url, data, json_body), method, url, response, body)
+
+
+def _png(seed):
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new('RGB', (400, 300), ((seed * 70) % 256, 120, 200)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def synthesize(fixtures):
+    """写入 3 个新游戏所需的全部响应"""
+    cache = ResponseCache(fixtures, mode='record')
+    links = ''.join(f'<a href="/{slug}"><img src="/images/m250x195/{slug}.png"></a>' for slug in SYNTHETIC_SLUGS)
+    _store(cache, 'POST', f'{SOURCE}/paging.ajax', json.dumps(links).encode('utf-8'), 'application/json',
+           data={'page': '1'})
+    _store(cache, 'POST', f'{SOURCE}/paging.ajax', b'""', 'application/json', data={'page': '2'})
+    _store(cache, 'GET', f'{SOURCE}/new-games', f'<html><body>{links}</body></html>'.encode('utf-8'), 'text/html')
+    for index, slug in enumerate(SYNTHETIC_SLUGS):
+        title = slug.replace('-', ' ').title()
+        page = DETAIL_PAGE.format(title=title, slug=slug, source=SOURCE)
+        _store(cache, 'GET', f'{SOURCE}/{slug}', page.encode('utf-8'), 'text/html')
+        embed = f'<html><body><iframe src="https://html5.gamemonetize.com/bench{index}/"></iframe></body></html>'
+        _store(cache, 'GET', f'{SOURCE}/embed/{slug}', embed.encode('utf-8'), 'text/html')
+        _store(cache, 'GET', f'{SOURCE}/images/m250x195/{slug}.png', _png(index), 'image/png')
+    _store(cache, 'GET', 'https://www.google.com/ping?sitemap=https://bearclicker.net/sitemap.xml', b'OK', 'text/plain')
+    _store(cache, 'POST', 'https://api.indexnow.org/IndexNow', b'', 'text/plain', status=202, json_body={
+        'host': 'www.bearclicker.net',
+        'key': '79b10f40ab4848b5a84b4d154927ed13',
+        'keyLocation': 'https://bearclicker.net/79b10f40ab4848b5a84b4d154927ed13.txt',
+        'urlList': [f'https://bearclicker.net/{slug}' for slug in SYNTHETIC_SLUGS],
+    })
+    print(f"synthesized {cache.counts['stored']} responses in {fixtures}")
+
+
+def published(sandbox):
+    with open(os.path.join(sandbox, 'static', 'game-config', 'games.json'), 'r', encoding='utf-8') as f:
+        return len(json.load(f).get('games', []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--fixtures', help='replay an existing fixture directory')
+    source.add_argument('--synthesize', metavar='DIR', help='write synthetic fixtures to DIR, then replay them')
+    source.add_argument('--record', metavar='DIR', help='run once against the live source, recording into DIR')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--keep', action='store_true', help='keep the last sandbox for inspection')
+    args = parser.parse_args()
+
+    if args.record:
+        sandbox = make_sandbox()
+        elapsed, _ = run_pipeline(sandbox, 'record', args.record)
+        print(f"recorded a live run in {elapsed:.1f}s into {args.record}")
+        shutil.rmtree(sandbox, ignore_errors=True)
+        return
+    fixtures = args.fixtures
+    if args.synthesize:
+        fixtures = args.synthesize
+        synthesize(fixtures)
+
+    timings = []
+    for run in range(args.runs):
+        sandbox = make_sandbox()
+        before = published(sandbox)
+        elapsed, log = run_pipeline(sandbox, 'replay', fixtures)
+        timings.append(elapsed)
+        reuse = next((line.split('HTTP connection reuse: ', 1)[1] for line in log.splitlines()
+                      if 'HTTP connection reuse: ' in line), '?')
+        print(f"run {run + 1}: {elapsed:.2f}s, published {published(sandbox) - before} games; {reuse}")
+        if args.keep and run == args.runs - 1:
+            print(f"sandbox kept at {sandbox}")
+        else:
+            shutil.rmtree(sandbox, ignore_errors=True)
+    print(f"median {statistics.median(timings):.2f}s over {args.runs} offline runs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+FAQ 存储基准测试：单个 slug 查询延迟和进程 RSS
+
+对比三种方式：
+- legacy-json：每次请求重新 json.load 整个 faqs.json（改造前的行为）
+- legacy-dict：整个 faqs.json 解析一次后常驻内存
+- store：faqs.jsonl + 偏移索引，只解码目标 slug
+
+legacy 模式使用的 faqs.json 由当前 FAQ 存储临时导出，不依赖仓库里的旧文件。
+RSS 在独立子进程中测量，避免互相干扰。
+
+用法：
+    python benchmarks/faq_store_bench.py [--iterations 2000]
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.faq_store import FaqStore  # noqa: E402
+
+DATA_DIR = os.path.join(ROOT_DIR, 'static', 'data')
+MODES = ('legacy-json', 'legacy-dict', 'store')
+
+
+def _export_legacy_json(path):
+    store = FaqStore(DATA_DIR)
+    entries = {slug: store._read(slug) for slug in store.slugs()}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=2, ensure_ascii=False)
+
+
+def _make_lookup(mode, legacy_path):
+    if mode == 'legacy-json':
+        def lookup(slug):
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get(slug)
+        return lookup
+    if mode == 'legacy-dict':
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        return entries.get
+    return FaqStore(DATA_DIR).get
+
+
+def run_mode(mode, legacy_path, iterations):
+    """在当前进程中运行一种模式，返回统计结果"""
+    slugs = FaqStore(DATA_DIR).slugs()
+    rng = random.Random(42)
+    targets = [rng.choice(slugs) for _ in range(iterations)]
+
+    lookup = _make_lookup(mode, legacy_path)
+    lookup(targets[0])
+
+    timings = []
+    for slug in targets:
+        start = time.perf_counter()
+        lookup(slug)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    # Linux 上 ru_maxrss 单位是 KB
+    return {
+        'mode': mode,
+        'iterations': iterations,
+        'mean_us': sum(timings) / len(timings) * 1e6,
+        'p50_us': timings[len(timings) // 2] * 1e6,
+        'p99_us': timings[int(len(timings) * 0.99)] * 1e6,
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--legacy-path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.legacy_path, args.iterations)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, 'faqs.json')
+        _export_legacy_json(legacy_path)
+
+        print(f"{'mode':<12} {'mean(us)':>10} {'p50(us)':>10} {'p99(us)':>10} {'maxrss(KB)':>12}")
+        for mode in MODES:
+            # legacy-json 每次都要解析 500KB+，减少迭代次数
+            iterations = args.iterations if mode != 'legacy-json' else max(args.iterations // 20, 20)
+            output = subprocess.check_output([
+                sys.executable, os.path.abspath(__file__),
+                '--mode', mode, '--legacy-path', legacy_path, '--iterations', str(iterations),
+            ])
+            result = json.loads(output)
+            print(f"{mode:<12} {result['mean_us']:>10.1f} {result['p50_us']:>10.1f} "
+                  f"{result['p99_us']:>10.1f} {result['max_rss_kb']:>12}")
+
+
+if __name__ == '__main__':
+    main()
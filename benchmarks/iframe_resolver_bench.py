@@ -0,0 +1,133 @@
+"""
+iframe 解析基准测试：重新解析整个游戏目录的耗时
+
+本地服务模拟 games.json 中的包装页：每个游戏的地址（两个主机名之间交替）先指向一层嵌入页，
+嵌入页再指向已知的游戏 CDN；--no-cdn 比例的游戏最后一层没有 iframe（负结果）。
+每个请求注入固定延迟（加随机抖动）。
+
+对比三种情况：
+- sequential：逐个解析、无缓存（改造前的方式），只跑 --sample 个游戏并按比例推算全量耗时
+- concurrent cold：resolve_many 并发解析全部游戏、无缓存
+- warm：新进程加载上一步保存的缓存文件后再解析全部游戏
+
+用法：
+    python benchmarks/iframe_resolver_bench.py [--games 319] [--workers 16] [--latency 80]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+# 测的是解析缓存本身，不使用 HTTP 响应缓存
+os.environ['AUTOMATION_HTTP_CACHE'] = 'off'
+
+from automation.http_client import HostLimiter, http_client  # noqa: E402
+from automation.iframe_resolver import IframeResolver  # noqa: E402
+
+
+class StandIn:
+    """本地包装页服务：/<slug>.embed -> /frame/<slug> -> CDN"""
+
+    def __init__(self, games, no_cdn, latency, jitter, seed=42):
+        rng = random.Random(seed)
+        self.no_cdn = {f'game-{i}' for i in range(games) if rng.random() < no_cdn}
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        port = self.server.server_address[1]
+        self.hosts = (f'http://127.0.0.1:{port}', f'http://localhost:{port}')
+        self.urls = [f'{self.hosts[i % 2]}/game-{i}.embed' for i in range(games)]
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with stand_in.lock:
+                    stand_in.requests += 1
+                    delay = stand_in.latency + stand_in.rng.uniform(0, stand_in.jitter)
+                time.sleep(delay)
+                slug = self.path.strip('/').split('/')[-1].replace('.embed', '')
+                if self.path.endswith('.embed'):
+                    body = f'<html><body><iframe src="/frame/{slug}"></iframe></body></html>'
+                elif slug in stand_in.no_cdn:
+                    body = '<html><body><canvas id="game"></canvas></body></html>'
+                else:
+                    body = f'<html><body><iframe src="https://html5.gamemonetize.com/{slug}/"></iframe></body></html>'
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+def timed(stand_in, func):
+    stand_in.requests = 0
+    started = time.perf_counter()
+    results = func()
+    return time.perf_counter() - started, stand_in.requests, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=319, help='catalog size (games.json has 319)')
+    parser.add_argument('--no-cdn', type=float, default=0.1, help='fraction of games whose chain has no CDN iframe')
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=8)
+    parser.add_argument('--sample', type=int, default=20, help='games resolved sequentially to project the old cost')
+    parser.add_argument('--latency', type=float, default=80, help='injected latency per request (ms)')
+    parser.add_argument('--jitter', type=float, default=40, help='extra random latency per request (ms)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    stand_in = StandIn(args.games, args.no_cdn, args.latency / 1e3, args.jitter / 1e3)
+    stand_in.start()
+    directory = tempfile.mkdtemp()
+
+    def resolver(name):
+        return IframeResolver(os.path.join(directory, f'{name}.json'), host_limit=HostLimiter(args.per_host))
+
+    print(f"{args.games} games on 2 hosts ({len(stand_in.no_cdn)} without a CDN iframe), "
+          f"latency {args.latency:.0f}+{args.jitter:.0f}ms, {args.workers} workers, per-host {args.per_host}")
+
+    sequential = resolver('sequential')
+    sample = stand_in.urls[:args.sample]
+    elapsed, requests_made, _ = timed(stand_in, lambda: [sequential.resolve(url) for url in sample])
+    print(f"sequential (no cache)  {elapsed:>7.2f}s for {len(sample)} games, {requests_made} requests "
+          f"-> ~{elapsed / len(sample) * args.games:.0f}s for the catalog")
+
+    cold = resolver('catalog')
+    elapsed, requests_made, results = timed(stand_in, lambda: cold.resolve_many(stand_in.urls, workers=args.workers))
+    print(f"concurrent, cold cache {elapsed:>7.2f}s, {requests_made} requests; {cold.summary()}")
+
+    warm = resolver('catalog')
+    elapsed, requests_made, warm_results = timed(stand_in, lambda: warm.resolve_many(stand_in.urls, workers=args.workers))
+    print(f"concurrent, warm cache {elapsed:>7.3f}s, {requests_made} requests; {warm.summary()}")
+    assert warm_results == results
+    print(f"HTTP: {http_client.summary()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""
+冷启动剖析：每个模块的导入耗时、路由注册、首次模板编译和第一个响应
+
+每次运行都在全新的子进程中用 `python -X importtime` 导入入口模块（默认 wsgi，Vercel 的入口），
+同时在子进程里统计：
+- Flask.add_url_rule 的累计耗时（路由注册）
+- jinja2 Environment.compile 的累计耗时和次数（模板编译；有字节码缓存时为 0）
+- 导入完成后第一个请求（--path）的耗时
+
+多次运行取中位数，输出各阶段耗时、自身耗时最多的模块和项目内模块的累计耗时。
+
+--history 把结果连同当前 git commit 追加到 JSONL 文件，并与上一条记录对比，用于跨提交跟踪；
+--budget-ms 设定冷启动预算（导入 + 第一个响应），超出时退出码为 1。
+
+用法：
+    python benchmarks/import_profile.py [--runs 5] [--entry wsgi] [--path /cookie-clicker]
+    python benchmarks/import_profile.py --history instance/cold_start_history.jsonl --budget-ms 250
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 冷启动预算（毫秒）：导入入口模块 + 第一个响应，见 README「冷启动」
+DEFAULT_BUDGET_MS = 250
+
+PROJECT_PREFIXES = ('app', 'wsgi', 'vercel_app', 'utils', 'api', 'config')
+
+CHILD = """
+import importlib, json, logging, sys, time
+
+timings = {'route_registration_ms': 0.0, 'template_compile_ms': 0.0, 'templates_compiled': 0}
+
+def timed(owner, name, key, count_key=None):
+    original = getattr(owner, name)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings[key] += (time.perf_counter() - started) * 1e3
+            if count_key:
+                timings[count_key] += 1
+    setattr(owner, name, wrapper)
+
+start = time.perf_counter()
+import flask, jinja2
+timed(flask.Flask, 'add_url_rule', 'route_registration_ms')
+timed(jinja2.Environment, 'compile', 'template_compile_ms', 'templates_compiled')
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+logging.disable(logging.CRITICAL)
+response = module.app.test_client().get(sys.argv[2])
+done = time.perf_counter()
+timings.update({
+    'import_ms': (imported - start) * 1e3,
+    'first_response_ms': (done - imported) * 1e3,
+    'total_ms': (done - start) * 1e3,
+    'status': response.status_code,
+})
+print(json.dumps(timings))
+"""
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def parse_importtime(stderr):
+    """
+    Returns:
+        dict: 模块名 -> (自身耗时 ms, 累计耗时 ms)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)) / 1e3, int(match.group(2)) / 1e3)
+    return modules
+
+
+def run_once(entry, path, env):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD, entry, path],
+                            cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def is_project_module(name):
+    return name.split('.', 1)[0] in PROJECT_PREFIXES
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def profile(entry, path, runs, env):
+    phases = defaultdict(list)
+    self_times = defaultdict(list)
+    cumulative_times = defaultdict(list)
+    # 先跑一次让 .pyc 就绪
+    run_once(entry, path, env)
+    for _ in range(runs):
+        timings, modules = run_once(entry, path, env)
+        for key, value in timings.items():
+            phases[key].append(value)
+        for name, (self_ms, cumulative_ms) in modules.items():
+            self_times[name].append(self_ms)
+            cumulative_times[name].append(cumulative_ms)
+    return (
+        {key: statistics.median(values) for key, values in phases.items()},
+        {name: statistics.median(values) for name, values in self_times.items()},
+        {name: statistics.median(values) for name, values in cumulative_times.items()},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entry', default='wsgi', help='module to import (wsgi or vercel_app)')
+    parser.add_argument('--path', default='/cookie-clicker', help='first request after import')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='modules to list by self time')
+    parser.add_argument('--history', help='append results to this JSONL file and compare with the last entry')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help=f'fail when import + first response exceeds this (suggested {DEFAULT_BUDGET_MS})')
+    args = parser.parse_args()
+
+    phases, self_times, cumulative_times = profile(args.entry, args.path, args.runs, dict(os.environ))
+
+    print(f"{args.entry} -> {args.path}, {args.runs} runs (median), status {int(phases['status'])}")
+    for key in ('import_ms', 'route_registration_ms', 'first_response_ms', 'template_compile_ms', 'total_ms'):
+        print(f"  {key:<24} {phases[key]:>9.1f}")
+    print(f"  {'templates_compiled':<24} {phases['templates_compiled']:>9.0f}")
+
+    print(f"\ntop {args.top} modules by self time (ms)")
+    for name, value in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<48} {value:>7.2f}")
+
+    project = {name: value for name, value in cumulative_times.items() if is_project_module(name)}
+    print("\nproject modules, cumulative (ms)")
+    for name, value in sorted(project.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<48} {value:>7.2f}")
+
+    record = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'entry': args.entry,
+        'path': args.path,
+        'python': sys.version.split()[0],
+        'phases': {key: round(value, 2) for key, value in phases.items()},
+        'project_modules': {name: round(value, 2) for name, value in project.items()},
+    }
+    if args.history:
+        previous = None
+        if os.path.exists(args.history):
+            with open(args.history, 'r', encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            previous = next((e for e in reversed(entries)
+                             if e['entry'] == args.entry and e['path'] == args.path), None)
+        if previous:
+            print(f"\nchange since {previous['commit']} ({previous['timestamp']})")
+            for key in ('import_ms', 'first_response_ms', 'total_ms'):
+                before, after = previous['phases'][key], phases[key]
+                print(f"  {key:<24} {before:>9.1f} -> {after:>9.1f} ({after - before:+.1f})")
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+
+    if args.budget_ms is not None:
+        if phases['total_ms'] > args.budget_ms:
+            print(f"\ncold start {phases['total_ms']:.1f}ms exceeds budget {args.budget_ms:.0f}ms")
+            sys.exit(1)
+        print(f"\ncold start {phases['total_ms']:.1f}ms within budget {args.budget_ms:.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+"""
+WSGI 负载基准测试：覆盖 app.url_map 中的所有 GET 路由
+
+目标由 url_map 自动生成：
+- 无参数的路由（/、/faq、/sitemap.xml、/api/games 等）各一个
+- /<slug>：GAME_PAGES 中的每个游戏详情页
+- /game/<id>：games.json 中的每个游戏播放页
+- 两个 404 路径（未知 slug、未知游戏 id）
+- /static/ 由 Vercel 直接提供，不在测试范围内；只接受 POST 的路由跳过
+
+每个目标先预热，再用 --concurrency 个线程发送 --requests 个请求，统计吞吐、p50/p95/p99 延迟；
+wsgi 模式下另用 tracemalloc 单线程测量每个请求的峰值内存分配。结束时报告进程峰值 RSS。
+
+--server gunicorn 时启动本地 gunicorn（wsgi:app）通过 HTTP 测试，此时不统计内存分配，
+峰值 RSS 取所有 worker 中的最大值。
+
+全程离线：games.json 中的嵌入地址只出现在页面 HTML 里，不会被请求。
+
+用法：
+    python benchmarks/load_bench.py [--requests 100] [--concurrency 4] [--filter REGEX]
+    python benchmarks/load_bench.py --save /tmp/load_baseline.json
+    python benchmarks/load_bench.py --compare /tmp/load_baseline.json [--threshold 0.25]
+    python benchmarks/load_bench.py --server gunicorn --workers 2
+"""
+import argparse
+import http.client
+import json
+import logging
+import math
+import os
+import platform
+import re
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+MISSING_SLUG = '/__load_bench_missing__'
+MISSING_GAME = '/game/__load_bench_missing__'
+
+
+def discover_targets(app, game_pages, game_ids):
+    """
+    根据 url_map 生成测试目标
+
+    Returns:
+        list: [(路由规则, 请求路径)]
+    """
+    targets = []
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+        if 'GET' not in rule.methods or rule.endpoint == 'static':
+            continue
+        if not rule.arguments:
+            targets.append((rule.rule, rule.rule))
+        elif rule.endpoint == 'game_page':
+            targets.extend((rule.rule, f'/{slug}') for slug in sorted(game_pages))
+        elif rule.endpoint == 'game_route':
+            targets.extend((rule.rule, f'/game/{game_id}') for game_id in sorted(game_ids))
+    targets.append(('404', MISSING_SLUG))
+    targets.append(('404', MISSING_GAME))
+    return targets
+
+
+def percentile(sorted_values, q):
+    """最近秩百分位数"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class WsgiClient:
+    """直接调用 WSGI 应用，不经过网络和 test client"""
+
+    def __init__(self, app, headers):
+        from werkzeug.test import EnvironBuilder
+        self.app = app
+        self._builder = lambda path: EnvironBuilder(path=path, headers=headers).get_environ()
+        self._environs = {}
+
+    def request(self, path):
+        environ = self._environs.get(path)
+        if environ is None:
+            environ = self._environs[path] = self._builder(path)
+        status = []
+
+        def start_response(status_line, headers, exc_info=None):
+            status.append(int(status_line.split(' ', 1)[0]))
+
+        app_iter = self.app(dict(environ), start_response)
+        try:
+            for _ in app_iter:
+                pass
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+        return status[0]
+
+
+class HttpClient:
+    """通过 HTTP 请求本地 gunicorn，每个线程一个连接"""
+
+    def __init__(self, port, headers):
+        self.port = port
+        self.headers = dict(headers, Connection='close')
+
+    def request(self, path):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+        try:
+            connection.request('GET', path, headers=self.headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+
+def run_target(client, path, requests, concurrency, warmup):
+    for _ in range(warmup):
+        client.request(path)
+
+    latencies = [[] for _ in range(concurrency)]
+    statuses = Counter()
+    counts = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+
+    def worker(index):
+        own = latencies[index]
+        for _ in range(counts[index]):
+            started = time.perf_counter()
+            status = client.request(path)
+            own.append(time.perf_counter() - started)
+            statuses[status] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    values = sorted(value for own in latencies for value in own)
+    return {
+        'status': statuses.most_common(1)[0][0],
+        'requests': len(values),
+        'rps': len(values) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(values, 50) * 1e3,
+        'p95_ms': percentile(values, 95) * 1e3,
+        'p99_ms': percentile(values, 99) * 1e3,
+        'latencies': values,
+    }
+
+
+def measure_allocations(client, path, samples=20):
+    """单线程下每个请求的峰值内存分配（KB），取中位数"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            client.request(path)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    peaks.sort()
+    return peaks[len(peaks) // 2] / 1024
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(workers, threads):
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-w', str(workers), '--threads', str(threads),
+         '-b', f'127.0.0.1:{port}', '--log-level', 'warning', 'wsgi:app'],
+        cwd=ROOT_DIR, stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError('gunicorn did not start within 30s')
+
+
+def summarize(results, targets):
+    """按路由规则汇总"""
+    by_rule = defaultdict(list)
+    for rule, path in targets:
+        by_rule[rule].append(results[path])
+    rows = []
+    for rule, items in by_rule.items():
+        values = sorted(value for item in items for value in item['latencies'])
+        allocs = [item['alloc_kb'] for item in items if item.get('alloc_kb') is not None]
+        rows.append({
+            'rule': rule,
+            'targets': len(items),
+            'statuses': ','.join(str(s) for s in sorted({item['status'] for item in items})),
+            'rps': sum(item['rps'] for item in items) / len(items),
+            'p50_ms': percentile(values, 50) * 1e3,
+            'p95_ms': percentile(values, 95) * 1e3,
+            'p99_ms': percentile(values, 99) * 1e3,
+            'alloc_kb': max(allocs) if allocs else None,
+        })
+    return rows
+
+
+def compare(results, baseline, metric, threshold, min_delta_ms):
+    """
+    Returns:
+        list: 超过阈值的 (路径, 基线值, 当前值)
+    """
+    regressions = []
+    for path, result in results.items():
+        base = baseline['targets'].get(path)
+        if base is None:
+            continue
+        before, after = base[metric], result[metric]
+        if after > before * (1 + threshold) and after - before > min_delta_ms:
+            regressions.append((path, before, after))
+    return sorted(regressions, key=lambda item: item[2] - item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=100, help='measured requests per target')
+    parser.add_argument('--warmup', type=int, default=5, help='unmeasured requests per target')
+    parser.add_argument('--concurrency', type=int, default=4, help='client threads')
+    parser.add_argument('--filter', help='only paths matching this regex')
+    parser.add_argument('--accept-encoding', default='gzip, br', help='Accept-Encoding sent with every request')
+    parser.add_argument('--server', choices=('wsgi', 'gunicorn'), default='wsgi')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn workers')
+    parser.add_argument('--threads', type=int, default=4, help='gunicorn threads per worker')
+    parser.add_argument('--no-alloc', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--save', help='write results to this JSON baseline')
+    parser.add_argument('--compare', help='compare against this JSON baseline and fail on regressions')
+    parser.add_argument('--metric', choices=('p50_ms', 'p95_ms', 'p99_ms'), default='p95_ms')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed relative slowdown (0.25 = 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=0.5, help='ignore slowdowns smaller than this')
+    parser.add_argument('--verbose', action='store_true', help='print every target, not only per-rule totals')
+    args = parser.parse_args()
+
+    # /metrics 默认需要令牌；基准中直接开放，测到的是导出本身的耗时
+    os.environ.setdefault('METRICS_PUBLIC', '1')
+    # 应用日志会写 stdout，测试期间关闭
+    import app as app_module
+    logging.disable(logging.CRITICAL)
+    from api.game_api import engine
+    engine.refresh()
+
+    flask_app = app_module.app
+    targets = discover_targets(flask_app, app_module.GAME_PAGES, engine.ids)
+    if args.filter:
+        pattern = re.compile(args.filter)
+        targets = [(rule, path) for rule, path in targets if pattern.search(path)]
+    headers = {'Accept-Encoding': args.accept_encoding} if args.accept_encoding else {}
+
+    process = None
+    if args.server == 'gunicorn':
+        process, port = start_gunicorn(args.workers, args.threads)
+        client = HttpClient(port, headers)
+    else:
+        client = WsgiClient(flask_app, headers)
+
+    results = {}
+    started = time.perf_counter()
+    try:
+        for rule, path in targets:
+            result = run_target(client, path, args.requests, args.concurrency, args.warmup)
+            result['rule'] = rule
+            result['alloc_kb'] = (None if args.server == 'gunicorn' or args.no_alloc
+                                  else measure_allocations(client, path))
+            results[path] = result
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    elapsed = time.perf_counter() - started
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if process else resource.RUSAGE_SELF)
+    # Linux 上 ru_maxrss 单位是 KB，macOS 上是字节
+    peak_rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+    rows = summarize(results, targets)
+    total = sum(result['requests'] for result in results.values())
+    print(f"{args.server}: {len(targets)} targets, {total} requests, concurrency {args.concurrency}, "
+          f"{elapsed:.1f}s, peak RSS {peak_rss_mb:.1f} MB")
+    print(f"{'route':<28} {'n':>4} {'status':>9} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} "
+          f"{'p99(ms)':>9} {'alloc(KB)':>10}")
+    for row in rows:
+        alloc = f"{row['alloc_kb']:.1f}" if row['alloc_kb'] is not None else '-'
+        print(f"{row['rule'][:28]:<28} {row['targets']:>4} {row['statuses']:>9} {row['rps']:>9.0f} "
+              f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {alloc:>10}")
+    if args.verbose:
+        for path, result in results.items():
+            print(f"  {path[:60]:<60} {result['status']:>4} {result['rps']:>9.0f} {result['p50_ms']:>9.2f} "
+                  f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f}")
+
+    for result in results.values():
+        del result['latencies']
+    report = {
+        'meta': {
+            'server': args.server,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'python': platform.python_version(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'peak_rss_mb': round(peak_rss_mb, 1),
+        },
+        'targets': results,
+    }
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.metric, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} targets regressed ({args.metric} > +{args.threshold:.0%} "
+                  f"and > +{args.min_delta_ms}ms):")
+            for path, before, after in regressions:
+                print(f"  {path:<50} {before:>8.2f} -> {after:>8.2f} ms")
+            sys.exit(1)
+        print(f"no regressions against {args.compare} ({args.metric}, threshold {args.threshold:.0%})")
+
+
+if __name__ == '__main__':
+    main()
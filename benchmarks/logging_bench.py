@@ -0,0 +1,98 @@
+"""
+日志开销基准测试：每个请求的日志耗时
+
+用一个最小的 Flask 应用模拟改造前 /game/<id> 的日志量（每个请求 15 条 INFO），对比：
+- none：不输出日志，作为基线
+- sync：setup_logging 默认的同步 StreamHandler
+- async：LOG_MODE=async，QueueHandler 入队后由后台线程输出 JSON
+- async-sampled：在 async 基础上 LOG_SAMPLE_RATE=0.1
+
+每种模式在独立子进程中运行，stdout / stderr 重定向到临时文件，模拟真实的写出开销。
+
+用法：
+    python benchmarks/logging_bench.py [--requests 3000] [--lines 15]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+MODES = {
+    'none': {'LOG_MODE': 'sync'},
+    'sync': {'LOG_MODE': 'sync'},
+    'async': {'LOG_MODE': 'async', 'LOG_SAMPLE_RATE': '1.0'},
+    'async-sampled': {'LOG_MODE': 'async', 'LOG_SAMPLE_RATE': '0.1'},
+}
+
+
+def run_mode(mode, requests, lines, result_path):
+    import logging
+
+    from flask import Flask
+
+    from config.logging_config import setup_logging
+
+    app = Flask('logging_bench')
+    setup_logging(app)
+    if mode == 'none':
+        logging.disable(logging.CRITICAL)
+
+    @app.route('/game/<game_id>')
+    def game(game_id):
+        for i in range(lines):
+            app.logger.info(f"request detail {i}: {game_id}")
+        return 'ok'
+
+    client = app.test_client()
+    for _ in range(100):
+        client.get('/game/warmup')
+
+    start = time.perf_counter()
+    for i in range(requests):
+        client.get(f'/game/{i}')
+    elapsed = time.perf_counter() - start
+
+    with open(result_path, 'w') as f:
+        json.dump({'mode': mode, 'us_per_request': elapsed / requests * 1e6}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--lines', type=int, default=15, help='INFO log lines per request')
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.requests, args.lines, args.result)
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mode, env in MODES.items():
+            result_path = os.path.join(tmp_dir, f'{mode}.json')
+            with open(os.path.join(tmp_dir, f'{mode}.log'), 'w') as log_file:
+                subprocess.check_call(
+                    [sys.executable, os.path.abspath(__file__), '--mode', mode, '--result', result_path,
+                     '--requests', str(args.requests), '--lines', str(args.lines)],
+                    env=dict(os.environ, **env), stdout=log_file, stderr=log_file,
+                )
+            with open(result_path) as f:
+                results[mode] = json.load(f)['us_per_request']
+
+    baseline = results['none']
+    print(f"{args.lines} INFO lines per request, {args.requests} requests")
+    print(f"{'mode':<14} {'us/request':>12} {'overhead(us)':>14}")
+    for mode, value in results.items():
+        print(f"{mode:<14} {value:>12.1f} {value - baseline:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+自动化抓取基准测试：GameScraper.get_new_games 串行与并发模式的耗时对比
+
+在本地启动一个模拟源站的 HTTP 服务，每个请求注入固定延迟（加随机抖动）：
+- /sitemap.xml 列出 --candidates 个游戏页面
+- 游戏页面（127.0.0.1）的结构与源站详情页一致，其中 --invalid 比例的页面没有 iframe
+- iframe 指向另一个主机名（localhost）上的嵌入页，嵌入页再指向已知的游戏 CDN，
+  因此每个有效候选需要 2 次请求、分布在两个主机上
+
+输出每种 worker 数的总耗时、服务端收到的请求数（提前取消后多余的抓取）、每个主机的最大并发，
+以及共享 HTTP 客户端的连接复用情况（每种配置前重置连接池）。
+
+用法：
+    python benchmarks/scraper_bench.py [--workers 1 4 8 16] [--latency 80] [--limit 10]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+# 测的是网络并发，不使用响应缓存和 iframe 解析缓存
+os.environ['AUTOMATION_HTTP_CACHE'] = 'off'
+os.environ['IFRAME_RESOLVER_CACHE'] = os.path.join(tempfile.mkdtemp(), 'iframe_cache.json')
+
+from automation.http_client import http_client  # noqa: E402
+from automation.scraper import GameScraper  # noqa: E402
+
+GAME_PAGE = """<!DOCTYPE html>
+<html><head>
+<title>{title} - Play Online</title>
+<meta name="description" content="Play {title} online for free.">
+<link rel="canonical" href="{base}/{slug}">
+<meta property="og:image" content="/images/{slug}.jpg">
+<link rel="icon" href="/favicon/{slug}.png">
+</head><body>
+{iframe}
+<div id="description"><p>{title} is a clicker game. Click, upgrade and automate.</p></div>
+</body></html>
+"""
+EMBED_PAGE = '<html><body><iframe src="https://html5.gamemonetize.com/{token}/"></iframe></body></html>'
+
+
+class StandIn:
+    """本地模拟源站，记录请求数和每个主机的最大并发"""
+
+    def __init__(self, candidates, invalid, latency, jitter, seed=42):
+        self.candidates = candidates
+        rng = random.Random(seed)
+        self.invalid = {i for i in range(candidates) if rng.random() < invalid}
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.active = Counter()
+        self.peak = Counter()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.page_base = f'http://127.0.0.1:{self.port}'
+        self.embed_base = f'http://localhost:{self.port}'
+
+    def reset(self):
+        with self.lock:
+            self.requests.clear()
+            self.peak.clear()
+
+    def _body(self, path):
+        if path == '/sitemap.xml':
+            urls = ''.join(f'<url><loc>{self.page_base}/game-{i}</loc></url>' for i in range(self.candidates))
+            return 'application/xml', f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+        if path.startswith('/embed/game-'):
+            return 'text/html', EMBED_PAGE.format(token=f'g{path.rsplit("-", 1)[1]}')
+        if path.startswith('/game-'):
+            index = int(path.rsplit('-', 1)[1])
+            slug = f'game-{index}'
+            iframe = '' if index in self.invalid else f'<iframe src="{self.embed_base}/embed/{slug}"></iframe>'
+            return 'text/html', GAME_PAGE.format(title=f'Game {index}', slug=slug, base=self.page_base, iframe=iframe)
+        return None, None
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                host = self.headers.get('Host', '')
+                with stand_in.lock:
+                    stand_in.requests[host] += 1
+                    stand_in.active[host] += 1
+                    stand_in.peak[host] = max(stand_in.peak[host], stand_in.active[host])
+                    delay = stand_in.latency + stand_in.rng.uniform(0, stand_in.jitter)
+                try:
+                    if self.path != '/sitemap.xml':
+                        time.sleep(delay)
+                    content_type, body = stand_in._body(self.path)
+                    if body is None:
+                        self.send_error(404)
+                        return
+                    data = body.encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', content_type)
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with stand_in.lock:
+                        stand_in.active[host] -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16])
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--candidates', type=int, default=200)
+    parser.add_argument('--invalid', type=float, default=0.3, help='fraction of candidate pages without an iframe')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=80, help='injected latency per request (ms)')
+    parser.add_argument('--jitter', type=float, default=40, help='extra random latency per request (ms)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    stand_in = StandIn(args.candidates, args.invalid, args.latency / 1e3, args.jitter / 1e3)
+    stand_in.start()
+    processed_log = os.path.join(tempfile.mkdtemp(), 'processed_games.json')
+
+    print(f"{args.candidates} candidates ({len(stand_in.invalid)} without iframe), limit {args.limit}, "
+          f"latency {args.latency:.0f}+{args.jitter:.0f}ms, per-host {args.per_host}")
+    print(f"{'workers':>7} {'seconds':>8} {'found':>6} {'requests':>9} {'peak/host':>10}  connections")
+    try:
+        for workers in args.workers:
+            stand_in.reset()
+            http_client.close()
+            if os.path.exists(os.environ['IFRAME_RESOLVER_CACHE']):
+                os.remove(os.environ['IFRAME_RESOLVER_CACHE'])
+            scraper = GameScraper(sitemap_url=f'{stand_in.page_base}/sitemap.xml', processed_log=processed_log,
+                                  workers=workers, per_host=args.per_host)
+            started = time.perf_counter()
+            games = scraper.get_new_games(limit=args.limit)
+            elapsed = time.perf_counter() - started
+            # 提前取消后仍在进行的请求会在返回后结束，稍等再读计数
+            time.sleep((args.latency + args.jitter) / 1e3 * 2)
+            peak = max(stand_in.peak.values())
+            print(f"{workers:>7} {elapsed:>8.2f} {len(games):>6} {sum(stand_in.requests.values()):>9} {peak:>10}  "
+                  f"{http_client.summary()}")
+    finally:
+        stand_in.stop()
+
+
+if __name__ == '__main__':
+    main()
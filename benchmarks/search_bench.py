@@ -0,0 +1,96 @@
+"""
+站内搜索基准测试：建索引耗时、未缓存查询和缓存命中的延迟
+
+文档来自 build_search_documents()（当前所有游戏页面），--copies 把它们复制多份
+（slug 加后缀）来模拟更大的站点；查询词从文档标题中随机抽取 1~3 个词组成。
+
+用法：
+    python benchmarks/search_bench.py [--copies 4] [--queries 2000]
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.search import SearchIndex, SiteSearch, tokenize  # noqa: E402
+
+
+class _FixedVersion:
+    """只有一个数据版本的 WatchedFiles 替身，索引只构建一次"""
+
+    def version(self):
+        return 1, 0
+
+
+def load_documents(copies):
+    from app import app, build_search_documents
+    with app.app_context():
+        documents = build_search_documents()
+    return [dict(doc, slug=f"{doc['slug']}-{copy}" if copy else doc['slug'])
+            for copy in range(copies) for doc in documents]
+
+
+def make_queries(documents, count, seed=42):
+    rng = random.Random(seed)
+    words = sorted({token for doc in documents for token in tokenize(doc['title'])})
+    return [' '.join(rng.sample(words, rng.randint(1, 3))) for _ in range(count)]
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {
+        'p50': statistics.median(samples),
+        'p99': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        'max': samples[-1],
+    }
+
+
+def timed(func, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--copies', type=int, default=4, help='replicate the site documents this many times')
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    documents = load_documents(args.copies)
+    queries = make_queries(documents, args.queries)
+
+    builds = []
+    for _ in range(3):
+        started = time.perf_counter()
+        index = SearchIndex(documents)
+        builds.append((time.perf_counter() - started) * 1e3)
+    print(f"{len(index)} documents, {len(index.postings)} terms, build {statistics.median(builds):.1f}ms (median of 3)")
+
+    # 未缓存：直接查询索引（包含分词）
+    uncached = timed(lambda query: index.search(tokenize(query), args.limit), queries)
+    # 缓存命中：先跑一遍填充缓存，再重复同样的查询
+    site_search = SiteSearch(_FixedVersion(), lambda: documents, cache_size=len(queries))
+    for query in queries:
+        site_search.search(query, args.limit)
+    cached = timed(lambda query: site_search.search(query, args.limit), queries)
+
+    print(f"{'':<10} {'p50 us':>9} {'p99 us':>9} {'max us':>9}")
+    for name, stats in (('uncached', uncached), ('cached', cached)):
+        print(f"{name:<10} {stats['p50']:>9.1f} {stats['p99']:>9.1f} {stats['max']:>9.1f}")
+    print(f"cache {site_search.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+源站 sitemap 解析基准测试：整体加载（ET.fromstring）与流式解析的耗时和内存峰值对比
+
+本地服务生成两种形式的同一组 URL（每个 URL 带 lastmod，按时间递增）：
+- /sitemap.xml：单个 urlset，包含全部 --urls 个 URL
+- /sitemap_index.xml：sitemapindex，按 --per-sitemap 拆分为多个子 sitemap（偶数个为 gzip 压缩）
+
+对比：
+- fromstring：改造前的方式，读入整个响应后 ET.fromstring + findall
+- streaming：SitemapScan 流式解析整个 urlset
+- index full：SitemapScan 跟随 sitemapindex 读取全部子 sitemap
+- index incremental：水位线设在最后一个子 sitemap 之前，只读取变化的子 sitemap
+
+内存峰值由 tracemalloc 在单独一次运行中统计（只计 Python 分配，包括响应缓冲）。
+
+用法：
+    python benchmarks/sitemap_bench.py [--urls 200000] [--per-sitemap 20000]
+"""
+import argparse
+import gzip
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+# 测的是解析本身，不使用 HTTP 响应缓存
+os.environ['AUTOMATION_HTTP_CACHE'] = 'off'
+
+from automation.http_client import http_client  # noqa: E402
+from automation.sitemap import SitemapScan  # noqa: E402
+
+NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def lastmod(index):
+    return (START + timedelta(minutes=index)).isoformat()
+
+
+class StandIn:
+    """本地 sitemap 服务，文档在启动前生成好"""
+
+    def __init__(self, urls, per_sitemap):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.docs = {'/sitemap.xml': self._urlset(range(urls))}
+        children = []
+        for number, first in enumerate(range(0, urls, per_sitemap)):
+            indexes = range(first, min(first + per_sitemap, urls))
+            path = f'/sitemap-{number}.xml' + ('.gz' if number % 2 == 0 else '')
+            body = self._urlset(indexes)
+            self.docs[path] = gzip.compress(body) if path.endswith('.gz') else body
+            children.append(f'<sitemap><loc>{self.base}{path}</loc><lastmod>{lastmod(indexes[-1])}</lastmod></sitemap>')
+        self.docs['/sitemap_index.xml'] = (
+            f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{NS}">{"".join(children)}</sitemapindex>'
+        ).encode('utf-8')
+        self.children = len(children)
+
+    def _urlset(self, indexes):
+        entries = ''.join(f'<url><loc>{self.base}/game-{i}</loc><lastmod>{lastmod(i)}</lastmod>'
+                          f'<changefreq>weekly</changefreq><priority>0.8</priority></url>' for i in indexes)
+        return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{NS}">{entries}</urlset>'.encode('utf-8')
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                data = stand_in.docs.get(self.path)
+                if data is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/xml')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+def fromstring_urls(url):
+    """改造前的实现"""
+    response = http_client.get(url, browser=True, timeout=15)
+    root = ET.fromstring(response.content)
+    namespace = root.tag.split('}')[0] + '}' if '}' in root.tag else ''
+    return [loc.text.strip() for loc in (elem.find(f'{namespace}loc') for elem in root.findall(f'{namespace}url'))
+            if loc is not None and loc.text]
+
+
+def measure(label, func):
+    # tracemalloc slows allocation-heavy code down, so time and peak come from separate runs
+    started = time.perf_counter()
+    count, detail = func()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<18} {elapsed:>7.2f}s {peak / 1e6:>9.1f} MB {count:>8}  {detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--urls', type=int, default=200000)
+    parser.add_argument('--per-sitemap', type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    stand_in = StandIn(args.urls, args.per_sitemap)
+    stand_in.start()
+    size = len(stand_in.docs['/sitemap.xml'])
+    print(f"{args.urls} URLs: urlset {size / 1e6:.1f} MB, index of {stand_in.children} sitemaps")
+    print(f"{'':<18} {'seconds':>8} {'peak':>12} {'entries':>8}")
+
+    flat = f'{stand_in.base}/sitemap.xml'
+    index = f'{stand_in.base}/sitemap_index.xml'
+    # 预热连接
+    http_client.get(index, browser=True)
+
+    def scan(url, since=None):
+        def run():
+            sitemap = SitemapScan(url, since=since)
+            return sum(1 for _ in sitemap), sitemap.summary()
+        return run
+
+    measure('fromstring', lambda: (len(fromstring_urls(flat)), ''))
+    measure('streaming', scan(flat))
+    measure('index full', scan(index))
+    since = datetime.fromisoformat(lastmod(args.urls - args.per_sitemap // 2 - 1))
+    measure('index incremental', scan(index, since))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+标题联想基准测试：前缀索引的构建耗时、每秒查找次数和 /api/suggest 的请求延迟
+
+前缀取自 games.json 中的标题和 slug，模拟逐字输入（每个 key 的前 1~12 个字符）。
+
+用法：
+    python benchmarks/suggest_bench.py [--lookups 200000] [--requests 2000]
+"""
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.search import PrefixIndex, normalize_prefix  # noqa: E402
+
+
+def make_prefixes(entries, count, seed=42):
+    rng = random.Random(seed)
+    keys = [normalize_prefix(entry[field]) for entry in entries for field in ('title', 'slug')]
+    prefixes = []
+    for _ in range(count):
+        key = rng.choice(keys)
+        prefixes.append(key[:rng.randint(1, min(12, len(key)))])
+    return prefixes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lookups', type=int, default=200000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--top-k', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    from app import app, build_suggest_entries
+    with app.test_request_context():
+        entries = build_suggest_entries()
+
+    builds = []
+    for _ in range(3):
+        started = time.perf_counter()
+        index = PrefixIndex(entries, args.top_k)
+        builds.append((time.perf_counter() - started) * 1e3)
+    print(f"{len(entries)} games, {len(index)} prefixes, build {statistics.median(builds):.1f}ms (median of 3)")
+
+    prefixes = make_prefixes(entries, args.lookups)
+    lookup = index.lookup
+    started = time.perf_counter()
+    for prefix in prefixes:
+        lookup(prefix)
+    elapsed = time.perf_counter() - started
+    print(f"lookup      {args.lookups / elapsed:>12,.0f} lookups/s ({elapsed / args.lookups * 1e9:.0f}ns each)")
+
+    started = time.perf_counter()
+    for prefix in prefixes:
+        lookup(normalize_prefix(prefix))
+    elapsed = time.perf_counter() - started
+    print(f"normalized  {args.lookups / elapsed:>12,.0f} lookups/s ({elapsed / args.lookups * 1e9:.0f}ns each)")
+
+    client = app.test_client()
+    client.get('/api/suggest?q=a')
+    samples = []
+    for prefix in prefixes[:args.requests]:
+        started = time.perf_counter()
+        client.get('/api/suggest', query_string={'q': prefix})
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    print(f"/api/suggest p50 {statistics.median(samples):.0f}us, "
+          f"p99 {samples[int(len(samples) * 0.99)]:.0f}us ({args.requests} requests, test client)")
+
+
+if __name__ == '__main__':
+    main()
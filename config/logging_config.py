@@ -1,6 +1,255 @@
 import os
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
+import queue
+import random
 import sys
+import threading
+import time
+import zlib
+
+from flask import g, request
+from flask.logging import default_handler
+
+_exception_formatter = logging.Formatter()
+# 当前请求的 id，请求开始时设置、结束时清除；比每条日志都经由 flask.g 的代理查找便宜得多
+_request_id = contextvars.ContextVar('request_id', default=None)
+# 后台线程每批最多写出的记录数
+BATCH_SIZE = 256
+
+
+class RequestContextFilter(logging.Filter):
+    """在请求线程上给日志记录附加 request_id（QueueHandler 的过滤器在调用线程执行）"""
+
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = _request_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    按比例采样 INFO 及以下的日志，WARNING 及以上全部保留
+
+    有 request_id 的记录按 request_id 的哈希采样，同一请求的日志要么全部保留要么全部丢弃。
+    记录带 extra={'sample': False} 时不参与采样。
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+        self.dropped = 0
+
+    def filter(self, record):
+        if self.rate >= 1 or record.levelno >= logging.WARNING or not getattr(record, 'sample', True):
+            return True
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            keep = zlib.crc32(request_id.encode('utf-8')) / 0xFFFFFFFF < self.rate
+        else:
+            keep = random.random() < self.rate
+        if not keep:
+            self.dropped += 1
+        return keep
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    错误通道限流：同一位置（logger + 代码行）每 period 秒最多输出 burst 条
+
+    被丢弃的条数记在下一条放行记录的 suppressed 字段里。
+    """
+
+    def __init__(self, burst=5, period=60.0):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            started, count, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - started >= self.period:
+                started, count = now, 0
+            if count >= self.burst:
+                self._windows[key] = (started, count, suppressed + 1)
+                return False
+            self._windows[key] = (started, count + 1, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class MaxLevelFilter(logging.Filter):
+    def __init__(self, level):
+        super().__init__()
+        self.level = level
+
+    def filter(self, record):
+        return record.levelno < self.level
+
+
+class JsonFormatter(logging.Formatter):
+    """每条日志输出一行 JSON"""
+
+    FIELDS = ('request_id', 'method', 'path', 'status', 'latency_ms', 'suppressed')
+
+    def format(self, record):
+        data = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in self.FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        if record.exc_text:
+            data['exc_info'] = record.exc_text
+        elif record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # 标准实现会复制记录并格式化整条消息；这里请求线程只做必须在本线程完成的事：
+        # 有参数时合并参数（参数对象之后可能被修改），有异常时预先格式化堆栈（避免后台线程持有请求帧），
+        # 其余格式化都留给后台线程的 JsonFormatter
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _StreamWriter(logging.StreamHandler):
+    """只写入不逐条 flush 的 StreamHandler，由 _BatchingQueueListener 在每批结束后 flush"""
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """一次取出队列中已有的全部记录（最多 BATCH_SIZE 条），写完整批后每个输出只 flush 一次"""
+
+    def _monitor(self):
+        while True:
+            batch = [self.dequeue(True)]
+            try:
+                while len(batch) < BATCH_SIZE:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                pass
+            stopping = False
+            for record in batch:
+                if record is self._sentinel:
+                    stopping = True
+                    continue
+                self.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+            if stopping:
+                return
+
+
+def _register_request_hooks(app, access_logger):
+    @app.before_request
+    def _start_request_timer():
+        # 请求 id 只用于关联日志，不需要密码学随机数（os.urandom 在部分环境下很慢）
+        g.request_id = request.headers.get('X-Request-ID') or f"{random.getrandbits(64):016x}"
+        g.request_started = time.perf_counter()
+        _request_id.set(g.request_id)
+
+    @app.teardown_request
+    def _clear_request_id(exc):
+        _request_id.set(None)
+
+    @app.after_request
+    def _log_request(response):
+        started = g.get('request_started')
+        if started is not None:
+            access_logger.info(
+                f"{request.method} {request.path} {response.status_code}",
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'status': response.status_code,
+                    'latency_ms': round((time.perf_counter() - started) * 1e3, 3),
+                },
+            )
+        response.headers['X-Request-ID'] = g.request_id
+        return response
+
+
+def setup_async_logging(app, stream=None, error_stream=None):
+    """
+    异步 JSON 日志
+
+    处理器挂在根 logger 上，应用、werkzeug、访问日志和各模块的 logger 都经由同一个队列输出。
+    请求线程只把记录放进队列，格式化和写 stdout 由后台线程按批完成：
+    - 每条日志一行 JSON，带 request_id；每个请求额外输出一条带耗时的访问日志
+    - INFO 及以下按 LOG_SAMPLE_RATE（默认 1.0）采样
+    - ERROR 及以上走单独的 stderr 通道，同一位置每 LOG_ERROR_PERIOD 秒最多 LOG_ERROR_BURST 条
+
+    Returns:
+        QueueListener: 已启动的监听器，进程退出时自动停止并刷新队列
+    """
+    stream = stream or sys.stdout
+    error_stream = error_stream or sys.stderr
+    formatter = JsonFormatter()
+
+    output_handler = _StreamWriter(stream)
+    output_handler.setFormatter(formatter)
+    output_handler.addFilter(MaxLevelFilter(logging.ERROR))
+
+    error_handler = _StreamWriter(error_stream)
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(formatter)
+    error_handler.addFilter(RateLimitFilter(
+        burst=int(os.getenv('LOG_ERROR_BURST', '5')),
+        period=float(os.getenv('LOG_ERROR_PERIOD', '60')),
+    ))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.addFilter(SamplingFilter(float(os.getenv('LOG_SAMPLE_RATE', '1.0'))))
+
+    listener = _BatchingQueueListener(log_queue, output_handler, error_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # JSON 日志不输出线程名和进程信息，省掉每条记录创建时的这些查询
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Flask 默认的 stderr 处理器是同步的，异步模式下去掉；其余 logger 都传播到根 logger 的队列处理器
+    app.logger.removeHandler(default_handler)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    access_logger = logging.getLogger('bearclicker.access')
+    for logger in (app.logger, logging.getLogger('werkzeug'), access_logger):
+        logger.setLevel(logging.INFO)
+
+    _register_request_hooks(app, access_logger)
+    return listener
+
 
 def setup_logging(app):
     """配置应用的日志系统
@@ -12,7 +261,12 @@ def setup_logging(app):
     - 在开发环境输出到控制台和文件
     - 在生产环境仅输出到控制台
     - 包含时间戳、日志级别和模块信息
+    - LOG_MODE=async 时改用异步 JSON 日志（见 setup_async_logging）
     """
+    if os.getenv('LOG_MODE', 'sync') == 'async':
+        setup_async_logging(app)
+        return app
+
     # 设置日志格式
     formatter = logging.Formatter(
         '[%(asctime)s] %(levelname)s in %(module)s: %(message)s'
@@ -41,8 +295,8 @@ def setup_logging(app):
         file_handler = logging.FileHandler(os.path.join(log_dir, 'sprunkr.log'))
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        
+
         app.logger.addHandler(file_handler)
         werkzeug_logger.addHandler(file_handler)
 
-    return app
\ No newline at end of file
+    return app
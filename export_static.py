@@ -0,0 +1,303 @@
+"""
+静态站点导出
+
+把所有游戏详情页、/、/faq、/about 以及 /game/<id> 播放页预渲染成 HTML 文件，
+同时生成 .gz / .br 预压缩文件和 manifest.json，供 CDN 或 @vercel/static 直接托管。
+static/ 下的 css、js、json、xml 等文本文件也会在原文件旁生成 .gz / .br，由 Flask 按 Accept-Encoding 直接发送。
+
+导出是增量的：每个页面都会记录输入文件（代码、模板、翻译、FAQ 记录、games.json、游戏图片文件名列表）的指纹，
+只有指纹变化或输出文件缺失的页面才会重新渲染。
+
+用法：
+    python export_static.py [--out dist] [--workers 4] [--force]
+    python export_static.py --assets-only   # 只预压缩 static/ 下的文件
+"""
+import argparse
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
+
+from utils.compression import MIN_SIZE, SUFFIXES, compress_variants, is_compressible  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('export_static')
+
+MANIFEST_FILENAME = 'manifest.json'
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+# 卡片链接 .jpg 还是 .png 由该目录中的文件名决定
+GAME_IMAGES_DIR = os.path.join('static', 'images', 'games')
+
+# 改动这些代码会影响所有页面的输出
+CODE_FILES = ['app.py', os.path.join('api', 'game_api.py')]
+CODE_DIRS = ['utils']
+
+_client = None
+
+
+def _init_worker():
+    global _client
+    logging.disable(logging.INFO)
+    from app import app, trending_grid
+    # 静态站点没有 /api/games，热门游戏卡片全部直接输出
+    trending_grid.initial_cards = 0
+    _client = app.test_client()
+
+
+def output_path_for(path):
+    """请求路径 -> 导出文件的相对路径"""
+    if path == '/':
+        return 'index.html'
+    return path.lstrip('/') + '.html'
+
+
+def _render_page(job):
+    path, out_dir, fingerprint = job
+    response = _client.get(path)
+    if response.status_code != 200:
+        return path, None, response.status_code
+
+    body = response.get_data()
+    relative = output_path_for(path)
+    target = os.path.join(out_dir, relative)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'wb') as f:
+        f.write(body)
+
+    entry = {
+        'file': relative,
+        'fingerprint': fingerprint,
+        'etag': hashlib.sha1(body).hexdigest(),
+        'bytes': len(body),
+    }
+    for encoding, compressed in compress_variants(body).items():
+        suffix = '.gz' if encoding == 'gzip' else '.br'
+        with open(target + suffix, 'wb') as f:
+            f.write(compressed)
+        entry[encoding] = len(compressed)
+    return path, entry, 200
+
+
+class Fingerprinter:
+    """计算页面输入文件的指纹，同一个文件只读取一次"""
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self._file_hashes = {}
+
+    def file_hash(self, relative):
+        if relative not in self._file_hashes:
+            try:
+                with open(os.path.join(self.root_dir, relative), 'rb') as f:
+                    self._file_hashes[relative] = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                self._file_hashes[relative] = 'missing'
+        return self._file_hashes[relative]
+
+    def listing(self, relative_dir):
+        """目录中文件名列表的指纹（只看文件名，不读内容）"""
+        try:
+            names = sorted(os.listdir(os.path.join(self.root_dir, relative_dir)))
+        except OSError:
+            names = []
+        return hashlib.sha1('\n'.join(names).encode('utf-8')).hexdigest().encode('ascii')
+
+    def combine(self, files, extra=b''):
+        digest = hashlib.sha1()
+        for relative in files:
+            digest.update(relative.encode('utf-8'))
+            digest.update(self.file_hash(relative).encode('ascii'))
+        digest.update(extra)
+        return digest.hexdigest()
+
+
+def _list_files(root_dir, relative_dir, suffix):
+    directory = os.path.join(root_dir, relative_dir)
+    return sorted(
+        os.path.join(relative_dir, name) for name in os.listdir(directory)
+        if name.endswith(suffix)
+    )
+
+
+def collect_jobs():
+    """
+    列出需要导出的页面及其输入指纹
+
+    Returns:
+        dict: 请求路径 -> 指纹
+    """
+    from app import GAME_PAGES, faq_store
+
+    fp = Fingerprinter(ROOT_DIR)
+    code = list(CODE_FILES)
+    for directory in CODE_DIRS:
+        code += _list_files(ROOT_DIR, directory, '.py')
+    shared = code + [
+        os.path.join('templates', 'base.html'),
+        os.path.join('static', 'data', 'translations.json'),
+        os.path.join('static', 'game-config', 'games.json'),
+    ] + _list_files(ROOT_DIR, os.path.join('templates', 'components'), '.html')
+
+    # 新增或替换（如 .jpg 换成 .png）游戏图片会改变热门卡片中的图片地址
+    images = fp.listing(GAME_IMAGES_DIR)
+
+    def faq_bytes(slug):
+        return json.dumps(faq_store._read(slug), sort_keys=True).encode('utf-8')
+
+    jobs = {}
+    for slug, page in GAME_PAGES.items():
+        jobs[f'/{slug}'] = fp.combine(shared + [os.path.join('templates', page['template'])], images + faq_bytes(slug))
+    jobs['/'] = fp.combine(shared + [os.path.join('templates', 'index.html')], images + faq_bytes('index'))
+    jobs['/faq'] = fp.combine(shared + [os.path.join('templates', 'faq.html')], images + faq_bytes('index'))
+    jobs['/about'] = fp.combine(shared + [os.path.join('templates', 'about.html')], images)
+
+    player = code + [
+        os.path.join('static', 'game-config', 'games.json'),
+        os.path.join('static', 'game-templates', 'game-template.html'),
+    ]
+    with open(os.path.join(ROOT_DIR, 'static', 'game-config', 'games.json'), 'r', encoding='utf-8') as f:
+        game_ids = [game['id'] for game in json.load(f).get('games', [])]
+    for game_id in game_ids:
+        jobs[f'/game/{game_id}'] = fp.combine(player, game_id.encode('utf-8'))
+    return jobs
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f).get('pages', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _remove_outputs(out_dir, relative):
+    for suffix in ('', '.gz', '.br'):
+        target = os.path.join(out_dir, relative + suffix)
+        if os.path.exists(target):
+            os.remove(target)
+
+
+def precompress_assets(static_dir=STATIC_DIR, force=False):
+    """
+    为 static/ 下的文本文件生成 .gz / .br
+
+    压缩文件比原文件新时跳过；压缩后没有明显变小的文件不生成。
+
+    Returns:
+        dict: 统计信息
+    """
+    summary = {'compressed': 0, 'unchanged': 0, 'bytes': 0, 'compressed_bytes': 0}
+    for directory, _, filenames in os.walk(static_dir):
+        for name in filenames:
+            if name.endswith(tuple(SUFFIXES.values())):
+                continue
+            path = os.path.join(directory, name)
+            mimetype = mimetypes.guess_type(name)[0]
+            st = os.stat(path)
+            if not is_compressible(mimetype) or st.st_size < MIN_SIZE:
+                continue
+
+            gz_path = path + SUFFIXES['gzip']
+            if not force and os.path.exists(gz_path) and os.stat(gz_path).st_mtime_ns >= st.st_mtime_ns:
+                summary['unchanged'] += 1
+                continue
+
+            with open(path, 'rb') as f:
+                body = f.read()
+            for encoding, compressed in compress_variants(body).items():
+                target = path + SUFFIXES[encoding]
+                if len(compressed) > len(body) * 0.9:
+                    if os.path.exists(target):
+                        os.remove(target)
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(compressed)
+                if encoding == 'gzip':
+                    summary['compressed_bytes'] += len(compressed)
+            summary['compressed'] += 1
+            summary['bytes'] += len(body)
+    logger.info(f"Precompressed {summary['compressed']} static files "
+                f"({summary['bytes']} -> {summary['compressed_bytes']} bytes gzip), {summary['unchanged']} unchanged")
+    return summary
+
+
+def export_site(out_dir, workers=None, force=False):
+    """
+    导出静态站点
+
+    Returns:
+        dict: 本次导出的统计信息
+    """
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = collect_jobs()
+    previous = load_manifest(out_dir)
+
+    pending = []
+    pages = {}
+    for path, fingerprint in jobs.items():
+        entry = previous.get(path)
+        if (not force and entry and entry.get('fingerprint') == fingerprint
+                and os.path.exists(os.path.join(out_dir, entry['file']))):
+            pages[path] = entry
+        else:
+            pending.append((path, out_dir, fingerprint))
+
+    # 已经从目录中移除的页面
+    for path, entry in previous.items():
+        if path not in jobs:
+            _remove_outputs(out_dir, entry['file'])
+
+    failed = {}
+    if pending:
+        logger.info(f"Rendering {len(pending)} of {len(jobs)} pages with {workers or os.cpu_count()} workers")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            for path, entry, status in executor.map(_render_page, pending, chunksize=8):
+                if entry is None:
+                    failed[path] = status
+                    logger.warning(f"Skipped {path}: HTTP {status}")
+                    if path in previous:
+                        _remove_outputs(out_dir, previous[path]['file'])
+                else:
+                    pages[path] = entry
+
+    manifest = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'pages': dict(sorted(pages.items())),
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    summary = {
+        'total': len(jobs),
+        'rendered': len(pending) - len(failed),
+        'unchanged': len(jobs) - len(pending),
+        'failed': failed,
+    }
+    logger.info(f"Export finished: {summary['rendered']} rendered, {summary['unchanged']} unchanged, "
+                f"{len(failed)} failed -> {out_dir}")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-render the site to static files')
+    parser.add_argument('--out', default=os.path.join(ROOT_DIR, 'dist'), help='output directory')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes')
+    parser.add_argument('--force', action='store_true', help='re-render every page')
+    parser.add_argument('--assets-only', action='store_true', help='only precompress files under static/')
+    args = parser.parse_args()
+    precompress_assets(force=args.force)
+    if not args.assets_only:
+        export_site(args.out, workers=args.workers, force=args.force)
+
+
+if __name__ == '__main__':
+    main()
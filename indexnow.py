@@ -1,6 +1,7 @@
-import requests
 import logging
 
+from automation.http_client import http_client
+
 logger = logging.getLogger(__name__)
 
 def submit_urls(urls):
@@ -21,7 +22,7 @@ def submit_urls(urls):
     }
 
     try:
-        response = requests.post(
+        response = http_client.post(
             "https://api.indexnow.org/IndexNow",
             json=data,
             headers={"Content-Type": "application/json; charset=utf-8"},
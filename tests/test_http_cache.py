@@ -0,0 +1,52 @@
+import json
+import os
+import time
+
+import requests
+
+from automation.http_cache import DAY, ResponseCache
+
+
+def store(cache, url, body=b'x', age=0):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    key = cache.key('GET', url)
+    cache.save(key, 'GET', url, response, body)
+    if age:
+        meta, _ = cache.load(key)
+        meta['stored_at'] = time.time() - age
+        cache._write(cache._path(key, '.json'), json.dumps(meta).encode('utf-8'))
+    return key
+
+
+def test_prune_drops_unused_and_orphaned_entries(tmp_path):
+    cache = ResponseCache(str(tmp_path), grace=7 * DAY)
+    fresh = store(cache, 'https://cdn.example/a.png', age=20 * DAY)
+    unused = store(cache, 'https://embed.example/page', age=9 * DAY)
+    uncached = store(cache, 'https://api.indexnow.org/indexnow')
+    (tmp_path / 'deadbeef.body').write_bytes(b'orphan')
+
+    result = cache.prune()
+
+    assert cache.load(fresh) is not None
+    assert cache.load(unused) is None and cache.load(uncached) is None
+    assert result['expired'] == 2 and result['orphaned'] == 1 and result['kept'] == 1
+    assert sorted(os.listdir(tmp_path)) == sorted([f'{fresh}.json', f'{fresh}.body'])
+
+
+def test_prune_evicts_oldest_above_size_cap(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=3000)
+    old = store(cache, 'https://cdn.example/old.png', body=b'o' * 2000, age=2 * DAY)
+    new = store(cache, 'https://cdn.example/new.png', body=b'n' * 2000, age=DAY)
+
+    result = cache.prune()
+
+    assert cache.load(old) is None and cache.load(new) is not None
+    assert result['evicted'] == 1 and result['bytes'] <= 3000
+
+
+def test_replay_fixtures_are_never_pruned(tmp_path):
+    key = store(ResponseCache(str(tmp_path)), 'https://embed.example/page', age=90 * DAY)
+    assert ResponseCache(str(tmp_path), mode='replay').prune()['expired'] == 0
+    assert ResponseCache(str(tmp_path), mode='replay').load(key) is not None
@@ -0,0 +1,47 @@
+import requests
+
+from automation.iframe_resolver import DAY, IframeResolver
+
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, **kwargs):
+        status, body = self.pages[url]
+        response = requests.Response()
+        response.status_code = status
+        response.url = url
+        response._content = body.encode('utf-8')
+        return response
+
+
+def resolver(tmp_path, pages):
+    return IframeResolver(str(tmp_path / 'cache.json'), client=FakeClient(pages))
+
+
+def test_error_status_is_cached_as_error(tmp_path):
+    url = 'https://wrapper.example/game'
+    iframe = resolver(tmp_path, {url: (503, '<html>Service Unavailable</html>')})
+    assert iframe.resolve(url) == url
+    entry = iframe.cached(url)
+    assert entry['outcome'] == 'error'
+    assert entry['expires_at'] - entry['resolved_at'] == DAY
+
+
+def test_chain_to_known_host(tmp_path):
+    url = 'https://wrapper.example/game'
+    pages = {
+        url: (200, '<iframe src="//embed.example/play"></iframe>'),
+        'https://embed.example/play': (200, '<iframe src="https://html5.gamemonetize.com/abc/"></iframe>'),
+    }
+    iframe = resolver(tmp_path, pages)
+    assert iframe.resolve(url) == 'https://html5.gamemonetize.com/abc/'
+    assert iframe.cached('https://embed.example/play')['outcome'] == 'cdn'
+
+
+def test_page_without_iframe_is_cached_as_page(tmp_path):
+    url = 'https://wrapper.example/game'
+    iframe = resolver(tmp_path, {url: (200, '<html>no frame</html>')})
+    assert iframe.resolve(url) == url
+    assert iframe.cached(url)['outcome'] == 'page'
@@ -0,0 +1,120 @@
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip('aiosmtpd.controller')
+
+from utils.mail_queue import MailQueue, MailWorker, SmtpConnection  # noqa: E402
+
+MESSAGE = b'Subject: hello\r\n\r\nbody\r\n'
+
+
+class Recorder:
+    """aiosmtpd handler that keeps every message and tracks concurrent sessions"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.messages = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.messages.append(envelope.content)
+        return '250 OK'
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(handler):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            port = probe.getsockname()[1]
+        controller = aiosmtpd_controller.Controller(handler, hostname='127.0.0.1', port=port)
+        controller.start()
+        servers.append(controller)
+        return port
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def test_worker_sends_batch_over_one_connection(tmp_path, smtp_server):
+    handler = Recorder()
+    port = smtp_server(handler)
+    queue = MailQueue(str(tmp_path / 'queue.sqlite3'))
+    connection = SmtpConnection('127.0.0.1', port, starttls=False)
+    worker = MailWorker(queue, connection, batch_window=0.01)
+    try:
+        for _ in range(3):
+            worker.submit('a@example.com', ['b@example.com'], MESSAGE)
+        assert wait_for(lambda: len(handler.messages) == 3)
+        assert wait_for(lambda: queue.stats()['queued'] == 0 and queue.stats()['sending'] == 0)
+        assert connection.connects == 1
+    finally:
+        worker.stop()
+
+
+def test_app_resumes_mail_left_by_a_previous_process(tmp_path, smtp_server, monkeypatch):
+    handler = Recorder()
+    port = smtp_server(handler)
+    path = str(tmp_path / 'queue.sqlite3')
+    # Written by a process that exited before sending it
+    MailQueue(path).enqueue('a@example.com', ['b@example.com'], MESSAGE)
+
+    monkeypatch.setenv('MAIL_QUEUE', '1')
+    monkeypatch.setenv('MAIL_QUEUE_PATH', path)
+    monkeypatch.setenv('SMTP_HOST', '127.0.0.1')
+    monkeypatch.setenv('SMTP_PORT', str(port))
+    monkeypatch.setenv('SMTP_STARTTLS', '0')
+    import app as app_module
+    monkeypatch.setattr(app_module, '_mail_worker', None)
+    monkeypatch.setattr(app_module, '_mail_resumed_pid', None)
+
+    app_module.app.test_client().get('/robots.txt').close()
+    try:
+        assert wait_for(lambda: len(handler.messages) == 1)
+    finally:
+        app_module._mail_worker.stop()
+
+
+def test_inline_sends_do_not_serialize(smtp_server, monkeypatch):
+    handler = Recorder(delay=0.3)
+    port = smtp_server(handler)
+    monkeypatch.setenv('MAIL_QUEUE', '0')
+    monkeypatch.setenv('SMTP_HOST', '127.0.0.1')
+    monkeypatch.setenv('SMTP_PORT', str(port))
+    monkeypatch.setenv('SMTP_STARTTLS', '0')
+    import app as app_module
+    monkeypatch.setattr(app_module, '_idle_mail_connections', [])
+
+    threads = [threading.Thread(target=app_module.deliver_mail, args=('a@example.com', ['b@example.com'], MESSAGE))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(handler.messages) == 3
+    assert handler.peak > 1
+    # Connections go back to the pool for the next request
+    assert len(app_module._idle_mail_connections) >= handler.peak
+    for connection in app_module._idle_mail_connections:
+        connection.close()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+from utils.metrics import RETIRED_NAME, Metrics, _write_snapshot
+
+REQUESTS = 'bearclicker_http_requests_total'
+LABELS = (('route', '/cookie-clicker'), ('method', 'GET'), ('status', '200'))
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def test_exited_worker_counts_never_decrease(tmp_path):
+    directory = str(tmp_path)
+    pid = dead_pid()
+    _write_snapshot(f'{directory}/metrics_{pid}_1.json', {(REQUESTS, LABELS): 5}, {})
+
+    metrics = Metrics(multiproc_dir=directory)
+    metrics.inc(REQUESTS, LABELS, 2)
+    counters, _ = metrics.collect()
+    assert counters[(REQUESTS, LABELS)] == 7
+    # The dead worker's snapshot was folded into the retired totals
+    assert not (tmp_path / f'metrics_{pid}_1.json').exists()
+    assert (tmp_path / RETIRED_NAME).exists()
+
+    # A second exited worker adds to the retired totals instead of replacing them
+    other = dead_pid()
+    _write_snapshot(f'{directory}/metrics_{other}_1.json', {(REQUESTS, LABELS): 1}, {})
+    counters, _ = metrics.collect()
+    assert counters[(REQUESTS, LABELS)] == 8
+    counters, _ = metrics.collect()
+    assert counters[(REQUESTS, LABELS)] == 8
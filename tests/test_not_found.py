@@ -0,0 +1,35 @@
+from flask import Flask, render_template_string, request
+
+from utils.not_found import NotFoundPage
+
+TEMPLATE = '<link rel="canonical" href="https://bearclicker.net{{ request.path }}"><p>{{ request.method }}</p>'
+
+
+class FixedVersion:
+    def version(self):
+        return 1, None
+
+
+def test_render_keeps_outer_request_state():
+    app = Flask(__name__)
+    teardowns = []
+    app.teardown_request(lambda exc: teardowns.append(request.path))
+    page = NotFoundPage(FixedVersion(), lambda **context: render_template_string(TEMPLATE, **context))
+
+    @app.route('/missing/<path:rest>')
+    def missing(rest):
+        request.environ['request_id'] = 'abc'
+        before = len(teardowns)
+        response = page.response()
+        # Rendering must not run teardown hooks; the outer request's own run after the view returns
+        assert len(teardowns) == before
+        assert request.environ['request_id'] == 'abc'
+        return response
+
+    client = app.test_client()
+    first = client.get('/missing/a"b')
+    assert first.status_code == 404
+    assert b'href="https://bearclicker.net/missing/a&#34;b"' in first.data
+    assert b'<p>GET</p>' in first.data
+    assert client.get('/missing/other').data.count(b'/missing/other') == 1
+    assert teardowns == ['/missing/a"b', '/missing/other']
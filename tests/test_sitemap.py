@@ -0,0 +1,61 @@
+import io
+
+from automation.sitemap import SitemapScan, SitemapWatermark
+
+NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+SITEMAP_URL = 'https://example.com/sitemap.xml'
+
+
+class FakeResponse:
+    from_cache = True
+
+    def __init__(self, body):
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.docs[url])
+
+
+def urlset(entries):
+    body = ''.join(f'<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>' for loc, lastmod in entries)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{NS}">{body}</urlset>'.encode('utf-8')
+
+
+def run(docs, watermark):
+    scan = SitemapScan(SITEMAP_URL, since=watermark.value, client=FakeClient(docs))
+    locs = [entry.loc for entry in scan]
+    watermark.settle(scan)
+    return locs
+
+
+def test_date_only_lastmod_keeps_pages_added_later_the_same_day(tmp_path):
+    watermark = SitemapWatermark(str(tmp_path / 'state.json'), SITEMAP_URL)
+    first = [('https://example.com/a', '2026-10-17'), ('https://example.com/b', '2026-10-18')]
+    assert run({SITEMAP_URL: urlset(first)}, watermark) == ['https://example.com/a', 'https://example.com/b']
+    assert watermark.value.isoformat() == '2026-10-18T00:00:00+00:00'
+
+    # Reloaded from disk, as the next daily run would
+    watermark = SitemapWatermark(str(tmp_path / 'state.json'), SITEMAP_URL)
+    second = first + [('https://example.com/c', '2026-10-18')]
+    locs = run({SITEMAP_URL: urlset(second)}, watermark)
+    assert 'https://example.com/c' in locs
+    assert 'https://example.com/a' not in locs
+
+
+def test_unsettled_entry_is_returned_again(tmp_path):
+    watermark = SitemapWatermark(str(tmp_path / 'state.json'), SITEMAP_URL)
+    docs = {SITEMAP_URL: urlset([('https://example.com/a', '2026-10-17'), ('https://example.com/b', '2026-10-18')])}
+    scan = SitemapScan(SITEMAP_URL, client=FakeClient(docs))
+    entries = list(scan)
+    watermark.settle(scan, unsettled=entries[0].lastmod)
+
+    scan = SitemapScan(SITEMAP_URL, since=watermark.value, client=FakeClient(docs))
+    assert [entry.loc for entry in scan] == ['https://example.com/a', 'https://example.com/b']
@@ -0,0 +1,50 @@
+import json
+import os
+
+from flask import Flask
+
+from utils.template_cache import MANIFEST_NAME, PrecompiledBytecodeCache, install, precompile
+
+
+def make_app(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir(exist_ok=True)
+    (templates / 'base.html').write_text('<title>{% block title %}{% endblock %}</title>')
+    (templates / 'page.html').write_text('{% extends "base.html" %}{% block title %}{{ name }}{% endblock %}')
+    return Flask(__name__, template_folder=str(templates))
+
+
+def cache_files(directory):
+    return {entry: os.stat(os.path.join(directory, entry)).st_mtime_ns
+            for entry in os.listdir(directory) if entry.endswith('.cache')}
+
+
+def test_precompile_is_incremental(tmp_path):
+    app = make_app(tmp_path)
+    directory = str(tmp_path / 'cache')
+    assert precompile(app, directory)['compiled'] == 2
+    before = cache_files(directory)
+    manifest = (tmp_path / 'cache' / MANIFEST_NAME).read_text()
+
+    # Unchanged templates are not rewritten, so a scheduled rebuild commits nothing
+    summary = precompile(app, directory)
+    assert (summary['compiled'], summary['unchanged']) == (0, 2)
+    assert cache_files(directory) == before
+    assert (tmp_path / 'cache' / MANIFEST_NAME).read_text() == manifest
+    assert set(json.loads(manifest)['templates']) == {'base.html', 'page.html'}
+
+    (tmp_path / 'templates' / 'page.html').write_text('{{ name }}!')
+    os.remove(tmp_path / 'templates' / 'base.html')
+    summary = precompile(app, directory)
+    assert (summary['compiled'], summary['unchanged'], summary['removed']) == (1, 0, 1)
+    assert len(cache_files(directory)) == 1
+
+
+def test_installed_cache_renders(tmp_path):
+    directory = str(tmp_path / 'cache')
+    precompile(make_app(tmp_path), directory)
+    app = make_app(tmp_path)
+    assert install(app, directory)
+    assert isinstance(app.jinja_env.bytecode_cache, PrecompiledBytecodeCache)
+    with app.app_context():
+        assert app.jinja_env.get_template('page.html').render(name='Bear') == '<title>Bear</title>'
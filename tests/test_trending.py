@@ -0,0 +1,27 @@
+import json
+
+from flask import Flask
+
+from utils.data_cache import DataFileCache
+from utils.trending import TrendingGrid
+
+
+def make_grid(tmp_path):
+    games = tmp_path / 'games.json'
+    games.write_text(json.dumps({'games': [{'id': 'a-game', 'title': 'A Game'}]}), encoding='utf-8')
+    (tmp_path / 'templates' / 'components').mkdir(parents=True)
+    (tmp_path / 'templates' / 'components' / 'trending_card.html').write_text('<a>{{ title }}</a>', encoding='utf-8')
+    app = Flask(__name__, root_path=str(tmp_path))
+    return app, TrendingGrid(str(games), str(tmp_path), {'a-game': {}}, cache=DataFileCache())
+
+
+def test_grid_is_reused_for_the_same_translations(tmp_path):
+    app, trending = make_grid(tmp_path)
+    translations = {'trending': {'a_game': 'Translated'}}
+    with app.test_request_context('/'):
+        grid = trending.grid(translations)
+        assert trending.grid(translations) is grid
+        assert 'Translated' in grid.html
+        # A reloaded translations file is a new object and rebuilds the grid
+        rebuilt = trending.grid({'trending': {'a_game': 'Changed'}})
+        assert rebuilt is not grid and 'Changed' in rebuilt.html
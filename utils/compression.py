@@ -0,0 +1,188 @@
+"""
+响应压缩
+
+- compress_variants：生成 gzip / br 预压缩版本，页面缓存和静态导出共用
+- negotiate：按 Accept-Encoding（含 q 值）选择编码
+- encoded_response：从预压缩版本中选出客户端接受的一份返回，ETag 按编码区分
+- send_compressed：send_from_directory 的替代，优先发送构建时生成的 .br / .gz 文件
+- compress_response：after_request 钩子，压缩其余没有 ETag 的动态响应
+"""
+import gzip
+import mimetypes
+import os
+
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+# brotli 是可选依赖，未安装时只生成 gzip
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 按服务端偏好排序，q 值相同时靠前的优先
+ENCODINGS = ('br', 'gzip')
+# 当前进程能生成的编码（预压缩文件不受此限制）
+SUPPORTED_ENCODINGS = ENCODINGS if brotli is not None else ('gzip',)
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+# 小于这个大小的响应压缩收益不明显
+MIN_SIZE = 1024
+
+COMPRESSIBLE_TYPES = {
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+    'text/css',
+    'text/html',
+    'text/javascript',
+    'text/plain',
+    'text/xml',
+}
+
+
+def gzip_bytes(body, level=9):
+    # mtime=0 保证相同输入得到相同输出，便于做增量构建和 ETag
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def brotli_bytes(body, quality=11):
+    if brotli is None:
+        return None
+    return brotli.compress(body, quality=quality)
+
+
+def compress(body, encoding, gzip_level=9, brotli_quality=11):
+    """按编码名压缩，encoding 必须在 SUPPORTED_ENCODINGS 中"""
+    if encoding == 'br':
+        return brotli_bytes(body, brotli_quality)
+    return gzip_bytes(body, gzip_level)
+
+
+def compress_variants(body, gzip_level=9, brotli_quality=11):
+    """
+    生成响应体的预压缩版本
+
+    Args:
+        body (bytes): 原始内容
+        gzip_level (int): gzip 压缩级别
+        brotli_quality (int): brotli 压缩质量
+
+    Returns:
+        dict: 编码名 -> 压缩后的内容，例如 {'gzip': ..., 'br': ...}
+    """
+    variants = {'gzip': gzip_bytes(body, gzip_level)}
+    compressed = brotli_bytes(body, brotli_quality)
+    if compressed is not None:
+        variants['br'] = compressed
+    return variants
+
+
+def is_compressible(mimetype):
+    return mimetype in COMPRESSIBLE_TYPES
+
+
+def negotiate(available, accept_encodings=None):
+    """
+    选择客户端接受的编码
+
+    Args:
+        available (Iterable): 可用的编码名
+        accept_encodings: werkzeug 的 Accept 对象，默认取当前请求的 Accept-Encoding
+
+    Returns:
+        str | None: 选中的编码，不压缩时为 None
+    """
+    if accept_encodings is None:
+        accept_encodings = request.accept_encodings
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_response(body, mimetype, etag, variants, last_modified=None):
+    """
+    按 Accept-Encoding 从预压缩版本中选择响应体，并处理条件请求
+
+    同一资源不同编码的字节不同，强 ETag 需要按编码区分（加上 -br / -gzip 后缀）。
+
+    Args:
+        body (bytes): 原始内容
+        mimetype (str): 响应类型
+        etag (str): 原始内容的 ETag
+        variants (dict): 编码名 -> 压缩后的内容
+        last_modified (datetime): 可选的最后修改时间
+
+    Returns:
+        Response: 可能是 304 的响应
+    """
+    encoding = negotiate(variants)
+    response = current_app.response_class(variants[encoding] if encoding else body, mimetype=mimetype)
+    if encoding:
+        response.content_encoding = encoding
+        etag = f"{etag}-{encoding}"
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response.make_conditional(request)
+
+
+def _fresh_sibling(path, encoding):
+    """返回不比原文件旧的预压缩文件路径，不存在或已过期时返回 None"""
+    sibling = path + SUFFIXES[encoding]
+    try:
+        return sibling if os.stat(sibling).st_mtime_ns >= os.stat(path).st_mtime_ns else None
+    except OSError:
+        return None
+
+
+def send_compressed(directory, filename, **kwargs):
+    """
+    send_from_directory 的替代：客户端接受且存在未过期的 .br / .gz 文件时直接发送压缩文件
+
+    预压缩文件由 `python export_static.py --assets-only` 在构建时生成，缺失时退回原文件。
+    只在自托管部署（gunicorn 等由 Flask 发送静态文件）中生效：Vercel 上 /static 由 @vercel/static
+    直接提供（压缩由边缘网络负责），请求不会进入这里，部署中也没有生成预压缩文件的步骤。
+    """
+    mimetype = kwargs.pop('mimetype', None) or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if not is_compressible(mimetype):
+        return send_from_directory(directory, filename, mimetype=mimetype, **kwargs)
+
+    path = safe_join(os.path.join(current_app.root_path, directory), filename)
+    available = [encoding for encoding in ENCODINGS if path and _fresh_sibling(path, encoding)]
+    encoding = negotiate(available)
+    if encoding is None:
+        response = send_from_directory(directory, filename, mimetype=mimetype, **kwargs)
+    else:
+        response = send_from_directory(directory, filename + SUFFIXES[encoding], mimetype=mimetype, **kwargs)
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def compress_response(response):
+    """
+    after_request 钩子：按需 gzip 压缩其余的动态响应
+
+    已经协商过编码、带 ETag（由视图自己处理编码和条件请求）、文件流和非 200 的响应保持原样。
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or 'ETag' in response.headers
+            or not is_compressible(response.mimetype)):
+        return response
+    response.vary.add('Accept-Encoding')
+    if negotiate(('gzip',)) is None:
+        return response
+    body = response.get_data()
+    if len(body) < MIN_SIZE:
+        return response
+    response.set_data(gzip_bytes(body, level=6))
+    response.content_encoding = 'gzip'
+    return response
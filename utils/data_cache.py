@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+from types import MappingProxyType
+
+
+def freeze(value):
+    """
+    把 json.load 得到的数据递归转换成只读视图
+
+    dict 变成 MappingProxyType，list 变成 tuple，模板里的 .get()、下标访问和遍历都不受影响，
+    但任何请求都无法修改进程内共享的那一份数据。
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return freeze(json.load(f))
+
+
+class DataFileCache:
+    """
+    进程内数据文件缓存
+
+    每个文件只在第一次访问、或者 mtime/size 发生变化时重新解析，其余请求只需要一次 os.stat。
+    hits / misses 计数用于观察缓存效果，同时按文件分别计数。
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._file_counts = {}
+
+    @staticmethod
+    def _signature(path):
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, path, loader=_load_json):
+        """
+        获取文件解析后的内容
+
+        Args:
+            path (str): 文件路径
+            loader (callable): 解析函数，接收路径并返回解析结果，默认按 JSON 解析并冻结
+
+        Returns:
+            解析后的只读数据
+
+        Raises:
+            OSError: 文件不存在或无法读取
+            ValueError: 文件内容无法解析
+        """
+        signature = self._signature(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            self._counts(path)[0] += 1
+            return entry[1]
+
+        with self._lock:
+            # 其他线程可能已经在等锁期间完成了加载
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                self._counts(path)[0] += 1
+                return entry[1]
+            value = loader(path)
+            self._entries[path] = (signature, value)
+            self.misses += 1
+            self._counts(path)[1] += 1
+            return value
+
+    def _counts(self, path):
+        counts = self._file_counts.get(path)
+        if counts is None:
+            counts = self._file_counts.setdefault(path, [0, 0])
+        return counts
+
+    def invalidate(self, path=None):
+        """丢弃某个文件（或全部文件）的缓存"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self, path=None):
+        """
+        返回缓存命中统计
+
+        Args:
+            path (str): 只返回该文件的 hits / misses，默认返回全部文件的合计
+        """
+        if path is not None:
+            hits, misses = self._file_counts.get(path, (0, 0))
+            return {'hits': hits, 'misses': misses}
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'files': len(self._entries),
+        }
+
+
+# 进程内共享的缓存实例
+data_cache = DataFileCache()
@@ -0,0 +1,178 @@
+"""
+按 slug 存取的 FAQ 存储
+
+数据文件 faqs.jsonl 每行一条记录 {"slug": ..., "data": {"faqs": [...], "conclusion": ...}}，
+索引文件 faqs.index.json 保存 slug -> [offset, length]。
+
+- 读取时通过 mmap 只解码目标 slug 的那一行，而不是反序列化全部游戏的 FAQ
+- 写入时把新记录追加到文件末尾，再原子替换索引；被替换的旧记录成为死数据，由 compact() 清理
+- 索引丢失时可以通过 rebuild_index() 顺序扫描数据文件重建（同一 slug 以最后一行为准）
+
+用法：
+    python -m utils.faq_store convert static/data/faqs.json static/data
+    python -m utils.faq_store compact static/data
+"""
+import argparse
+import json
+import mmap
+import os
+import threading
+
+from utils.data_cache import data_cache, freeze
+
+RECORDS_FILENAME = 'faqs.jsonl'
+INDEX_FILENAME = 'faqs.index.json'
+
+
+def _encode_record(slug, entry):
+    record = json.dumps({'slug': slug, 'data': entry}, ensure_ascii=False, separators=(',', ':'))
+    return record.encode('utf-8') + b'\n'
+
+
+def _open_mmap(path):
+    with open(path, 'rb') as f:
+        # 空文件无法 mmap
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _write_json_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class FaqStore:
+    """带 slug 偏移索引的 FAQ 存储"""
+
+    def __init__(self, data_dir, cache=data_cache):
+        self.records_path = os.path.join(data_dir, RECORDS_FILENAME)
+        self.index_path = os.path.join(data_dir, INDEX_FILENAME)
+        self._cache = cache
+        self._write_lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.index_path) and os.path.exists(self.records_path)
+
+    def _index(self):
+        return self._cache.get(self.index_path)
+
+    def slugs(self):
+        """返回所有已存储的 slug"""
+        return list(self._index().keys())
+
+    def get(self, slug):
+        """
+        读取单个 slug 的 FAQ 数据
+
+        Args:
+            slug (str): 页面 slug
+
+        Returns:
+            Mapping | None: 只读的 {'faqs': [...], 'conclusion': ...}，不存在时返回 None
+        """
+        data = self._read(slug)
+        return None if data is None else freeze(data)
+
+    def _read(self, slug):
+        location = self._index().get(slug)
+        if location is None:
+            return None
+        offset, length = location
+        records = self._cache.get(self.records_path, loader=_open_mmap)
+        return json.loads(records[offset:offset + length])['data']
+
+    def put(self, slug, entry):
+        """
+        追加或替换单个 slug 的 FAQ 数据
+
+        只追加一条记录并重写索引，不会重写其他游戏的数据。
+        """
+        payload = _encode_record(slug, entry)
+        with self._write_lock:
+            index = self._read_index_for_write()
+            with open(self.records_path, 'ab') as f:
+                offset = f.tell()
+                f.write(payload)
+            # 索引中的长度不含换行符
+            index[slug] = [offset, len(payload) - 1]
+            _write_json_atomic(self.index_path, index)
+
+    def _read_index_for_write(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def items(self):
+        """按索引顺序遍历 (slug, data)，用于导出或全文检索"""
+        for slug in self.slugs():
+            yield slug, self.get(slug)
+
+    def write_all(self, entries):
+        """用 entries(dict: slug -> data) 整体重写存储"""
+        with self._write_lock:
+            index = {}
+            tmp_path = f"{self.records_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                for slug, entry in entries.items():
+                    payload = _encode_record(slug, entry)
+                    index[slug] = [f.tell(), len(payload) - 1]
+                    f.write(payload)
+            os.replace(tmp_path, self.records_path)
+            _write_json_atomic(self.index_path, index)
+        return len(index)
+
+    def compact(self):
+        """丢弃被替换的旧记录"""
+        entries = {slug: self._read(slug) for slug in self.slugs()}
+        return self.write_all(entries)
+
+    def rebuild_index(self):
+        """顺序扫描数据文件重建索引，同一 slug 以最后一条记录为准"""
+        index = {}
+        with self._write_lock:
+            with open(self.records_path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    stripped = line.rstrip(b'\n')
+                    if stripped:
+                        index[json.loads(stripped)['slug']] = [offset, len(stripped)]
+                    offset += len(line)
+            _write_json_atomic(self.index_path, index)
+        return len(index)
+
+
+def convert_faqs_json(faqs_json_path, data_dir):
+    """把旧版 faqs.json 转换成 faqs.jsonl + faqs.index.json"""
+    with open(faqs_json_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return FaqStore(data_dir).write_all(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='FAQ store maintenance')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert', help='convert a legacy faqs.json')
+    convert_parser.add_argument('faqs_json')
+    convert_parser.add_argument('data_dir')
+
+    for name in ('compact', 'rebuild-index'):
+        sub = subparsers.add_parser(name)
+        sub.add_argument('data_dir')
+
+    args = parser.parse_args()
+    if args.command == 'convert':
+        count = convert_faqs_json(args.faqs_json, args.data_dir)
+    elif args.command == 'compact':
+        count = FaqStore(args.data_dir).compact()
+    else:
+        count = FaqStore(args.data_dir).rebuild_index()
+    print(f"{args.command}: {count} slugs")
+
+
+if __name__ == '__main__':
+    main()
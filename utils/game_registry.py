@@ -0,0 +1,54 @@
+import json
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _default_page_title(slug):
+    """与 TemplateGenerator 生成新游戏时的标题规则保持一致"""
+    return slug.replace('-', ' ').title()
+
+
+def load_game_pages(games_json_path, templates_dir):
+    """
+    根据 games.json 和模板目录构建游戏页面注册表
+
+    只有在 games.json 中登记、并且 templates/ 下存在同名模板的游戏才会被注册，
+    这样 /base、/error 之类的非游戏模板永远不会被通配路由渲染出来。
+
+    Args:
+        games_json_path (str): games.json 文件路径
+        templates_dir (str): 模板目录路径
+
+    Returns:
+        dict: slug -> {'template': 模板文件名, 'page_title': 页面标题}
+    """
+    try:
+        with open(games_json_path, 'r', encoding='utf-8') as f:
+            games = json.load(f).get('games', [])
+    except Exception as e:
+        logger.error(f"Error loading game registry from {games_json_path}: {e}")
+        return {}
+
+    # 一次性列出模板目录，避免对每个游戏都调用 os.path.exists
+    try:
+        template_names = {
+            entry.name for entry in os.scandir(templates_dir)
+            if entry.is_file() and entry.name.endswith('.html')
+        }
+    except OSError as e:
+        logger.error(f"Error scanning templates directory {templates_dir}: {e}")
+        return {}
+
+    pages = {}
+    for game in games:
+        slug = game.get('id')
+        template = f"{slug}.html"
+        if not slug or template not in template_names:
+            continue
+        pages[slug] = {
+            'template': template,
+            'page_title': game.get('pageTitle') or game.get('title') or _default_page_title(slug),
+        }
+    return pages
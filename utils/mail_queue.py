@@ -0,0 +1,401 @@
+"""
+联系表单邮件队列
+
+请求里只把邮件写入本地 SQLite 队列就返回，后台线程负责发送：
+- 队列有容量上限，满了 enqueue 会抛出 QueueFull
+- 多个进程共享同一个队列文件，取件在 IMMEDIATE 事务里完成，同一封邮件不会被重复领取
+- 发送线程保持一个已登录的 SMTP 连接，空闲超过 idle_timeout 才断开
+- 一批邮件同时到达时在 batch_window 内合并，复用同一连接连续发送
+- 临时失败按指数退避重试，5xx 永久错误或超过 max_attempts 的邮件标记为 dead 保留在队列里
+
+本地测试可以用 aiosmtpd 代替 Gmail：
+    python -m aiosmtpd -n -l localhost:8025
+    SMTP_HOST=localhost SMTP_PORT=8025 SMTP_STARTTLS=0 python app.py
+"""
+import json
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sender TEXT NOT NULL,
+    recipients TEXT NOT NULL,
+    message BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    claimed_at REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, next_attempt);
+"""
+
+
+class QueueFull(Exception):
+    """队列中待发送的邮件已达上限"""
+
+
+class MailQueue:
+    """
+    基于 SQLite 的持久化发件队列
+
+    Args:
+        path (str): 队列文件路径
+        max_pending (int): 最多保留的待发送邮件数
+        claim_timeout (float): 领取后超过这个秒数仍未确认的邮件视为发送进程已退出，重新入队
+    """
+
+    def __init__(self, path, max_pending=1000, claim_timeout=600):
+        self.path = path
+        self.max_pending = max_pending
+        self.claim_timeout = claim_timeout
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def enqueue(self, sender, recipients, message):
+        """
+        写入一封邮件
+
+        Args:
+            sender (str): 发件人
+            recipients (list): 收件人列表
+            message (bytes): 完整的邮件内容
+
+        Raises:
+            QueueFull: 待发送邮件已达上限
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            pending = conn.execute("SELECT COUNT(*) FROM outbox WHERE status != 'dead'").fetchone()[0]
+            if pending >= self.max_pending:
+                conn.execute('ROLLBACK')
+                raise QueueFull(f"{pending} messages pending")
+            conn.execute(
+                'INSERT INTO outbox (sender, recipients, message, next_attempt, created_at) VALUES (?, ?, ?, ?, ?)',
+                (sender, json.dumps(recipients), message, now, now),
+            )
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    def claim(self, limit):
+        """
+        领取到期的邮件，领取后状态变为 sending
+
+        Returns:
+            list: [(id, sender, recipients, message, attempts)]
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                "UPDATE outbox SET status = 'queued' WHERE status = 'sending' AND claimed_at < ?",
+                (now - self.claim_timeout,),
+            )
+            rows = conn.execute(
+                "SELECT id, sender, recipients, message, attempts FROM outbox "
+                "WHERE status = 'queued' AND next_attempt <= ? ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE outbox SET status = 'sending', claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+        return [(id_, sender, json.loads(recipients), message, attempts)
+                for id_, sender, recipients, message, attempts in rows]
+
+    def mark_sent(self, ids):
+        if not ids:
+            return
+        with closing(self._connect()) as conn:
+            conn.executemany('DELETE FROM outbox WHERE id = ?', [(id_,) for id_ in ids])
+
+    def release(self, ids, retry_at):
+        """把领取后未尝试发送的邮件放回队列，不计入尝试次数"""
+        with closing(self._connect()) as conn:
+            conn.executemany(
+                "UPDATE outbox SET status = 'queued', next_attempt = ?, claimed_at = NULL WHERE id = ?",
+                [(retry_at, id_) for id_ in ids],
+            )
+
+    def mark_failed(self, id_, error, retry_at=None):
+        """记录一次失败；retry_at 为 None 时标记为 dead，不再重试"""
+        status = 'dead' if retry_at is None else 'queued'
+        with closing(self._connect()) as conn:
+            conn.execute(
+                'UPDATE outbox SET status = ?, attempts = attempts + 1, next_attempt = ?, '
+                'last_error = ?, claimed_at = NULL WHERE id = ?',
+                (status, retry_at or time.time(), str(error)[:500], id_),
+            )
+
+    def next_due(self):
+        """最近一封待发送邮件的计划时间，队列为空时返回 None"""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT MIN(next_attempt) FROM outbox WHERE status = 'queued'").fetchone()[0]
+
+    def has_pending(self):
+        """是否还有等待发送或发送中（可能属于已退出的进程）的邮件"""
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM outbox WHERE status IN ('queued', 'sending'))").fetchone()[0] == 1
+
+    def stats(self):
+        """按状态统计邮件数"""
+        with closing(self._connect()) as conn:
+            counts = dict(conn.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall())
+        return {status: counts.get(status, 0) for status in ('queued', 'sending', 'dead')}
+
+
+class SmtpConnection:
+    """
+    可复用的 SMTP 连接
+
+    服务器未提供 AUTH 扩展时跳过登录（例如本地的 aiosmtpd）。
+    """
+
+    def __init__(self, host, port, user=None, password=None, starttls=True, timeout=30, idle_timeout=60):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._server = None
+        self._last_used = 0.0
+        self.connects = 0
+
+    def _open(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                server.starttls()
+            server.ehlo_or_helo_if_needed()
+            if self.user and self.password and server.has_extn('auth'):
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.connects += 1
+        return server
+
+    def send(self, sender, recipients, message):
+        """
+        发送一封邮件，复用的连接已被服务器断开时自动重连一次
+        """
+        if self._server is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            self.close()
+        for attempt in (1, 2):
+            if self._server is None:
+                self._server = self._open()
+                self._last_used = time.monotonic()
+            try:
+                self._server.sendmail(sender, recipients, message)
+                break
+            except smtplib.SMTPServerDisconnected:
+                self._server = None
+                if attempt == 2:
+                    raise
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self):
+        if self._server is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            self.close()
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+
+# 连接、握手或登录阶段的错误与具体邮件无关
+_CONNECTION_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    smtplib.SMTPHeloError,
+    smtplib.SMTPAuthenticationError,
+    smtplib.SMTPNotSupportedError,
+)
+
+
+def _is_connection_error(error):
+    return isinstance(error, _CONNECTION_ERRORS) or not isinstance(error, smtplib.SMTPException)
+
+
+def _is_permanent(error):
+    # 认证失败通常是配置问题，修正后应能继续发送，不算永久错误
+    if _is_connection_error(error):
+        return False
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+class MailWorker:
+    """
+    后台发送线程
+
+    Args:
+        queue (MailQueue): 发件队列
+        connection (SmtpConnection): SMTP 连接
+        batch_size (int): 每批最多领取的邮件数
+        batch_window (float): 被唤醒后等待多久再领取，用于合并同时到达的邮件
+        max_attempts (int): 最多尝试次数
+        base_delay (float): 第一次重试的等待秒数，之后每次翻倍
+        max_delay (float): 重试等待的上限
+    """
+
+    def __init__(self, queue, connection, batch_size=20, batch_window=0.2,
+                 max_attempts=5, base_delay=5, max_delay=600):
+        self.queue = queue
+        self.connection = connection
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sent = 0
+        self.failed = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, sender, recipients, message):
+        """写入队列并唤醒发送线程，立即返回"""
+        self.queue.enqueue(sender, recipients, message)
+        self.start()
+        self._wakeup.set()
+
+    def start(self):
+        """启动发送线程；fork 出的子进程中会重新启动"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._stopping.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='mail-worker', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _retry_at(self, attempts):
+        """第 attempts 次失败后的重试时间：base_delay * 2^(attempts-1)，带 ±20% 抖动"""
+        delay = min(self.max_delay, self.base_delay * 2 ** max(attempts - 1, 0))
+        return time.time() + delay * random.uniform(0.8, 1.2)
+
+    def _wait_time(self):
+        next_due = self.queue.next_due()
+        if next_due is None:
+            return self.connection.idle_timeout
+        return max(0.0, min(next_due - time.time(), self.connection.idle_timeout))
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self._wait_time())
+            if self._stopping.is_set():
+                break
+            self._wakeup.clear()
+            time.sleep(self.batch_window)
+            try:
+                while self.drain_once():
+                    pass
+            except Exception as e:
+                logger.error(f"Mail worker error: {e}")
+            self.connection.close_if_idle()
+        self.connection.close()
+
+    def drain_once(self):
+        """
+        领取并发送一批到期的邮件
+
+        Returns:
+            int: 本批领取的邮件数
+        """
+        batch = self.queue.claim(self.batch_size)
+        sent = []
+        for index, (id_, sender, recipients, message, attempts) in enumerate(batch):
+            try:
+                self.connection.send(sender, recipients, message)
+                sent.append(id_)
+                self.sent += 1
+            except Exception as e:
+                self.failed += 1
+                attempts += 1
+                permanent = _is_permanent(e) or attempts >= self.max_attempts
+                logger.warning(f"Failed to send mail {id_} (attempt {attempts}): {e}")
+                retry_at = self._retry_at(attempts)
+                self.queue.mark_failed(id_, e, None if permanent else retry_at)
+                if _is_connection_error(e):
+                    # 连接级错误：本批剩下的邮件一起退避，不再逐封尝试
+                    self.connection.close()
+                    self.queue.release([rest[0] for rest in batch[index + 1:]], retry_at)
+                    self.queue.mark_sent(sent)
+                    return 0
+        self.queue.mark_sent(sent)
+        return len(batch)
+
+
+def connection_from_env():
+    """
+    按环境变量创建 SMTP 连接
+
+    环境变量：
+        SMTP_HOST / SMTP_PORT / SMTP_STARTTLS: 默认 smtp.gmail.com / 587 / 1
+        EMAIL_USER / EMAIL_PASSWORD: 登录账号
+    """
+    return SmtpConnection(
+        os.getenv('SMTP_HOST', 'smtp.gmail.com'),
+        int(os.getenv('SMTP_PORT', '587')),
+        user=os.getenv('EMAIL_USER'),
+        password=os.getenv('EMAIL_PASSWORD'),
+        starttls=os.getenv('SMTP_STARTTLS', '1') != '0',
+    )
+
+
+def worker_from_env(path):
+    """
+    按环境变量创建发送线程（未启动）
+
+    Args:
+        path (str): 队列文件（app.py 中由 MAIL_QUEUE_PATH 决定，默认 instance/mail_queue.sqlite3）
+
+    环境变量：
+        MAIL_QUEUE_MAX_PENDING: 队列容量，默认 1000
+    """
+    queue = MailQueue(path, max_pending=int(os.getenv('MAIL_QUEUE_MAX_PENDING', '1000')))
+    return MailWorker(queue, connection_from_env())
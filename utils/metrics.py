@@ -0,0 +1,482 @@
+"""
+请求指标与 Prometheus 文本格式导出
+
+- MetricsMiddleware 包在 app.wsgi_app 外层，按路由统计请求数、状态码和耗时直方图（固定分桶）
+- 请求内的数据加载（timed 装饰器）和模板渲染（Flask 模板信号）耗时单独记录，
+  同时写入响应头 Server-Timing，浏览器开发者工具中可以直接看到每个阶段的耗时
+- 计数写在每个线程自己的分片里，请求路径上不加锁，导出时再合并
+- 缓存命中等已有统计通过 add_collector 注册，导出时读取
+- 设置 multiproc_dir 后每个进程定期把快照写入该目录，/metrics 汇总目录中所有进程的数据（gunicorn 多 worker）；
+  已退出进程的计数并入 retired 快照，合计值不会因 worker 重启而下降
+- 路由标签默认取 URL 规则（/game/<game_id> 等）；/<slug> 命中登记的游戏页时由视图细分为具体 slug，其余路径记为 <unmatched>
+"""
+import atexit
+import errno
+import glob
+import json
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from flask import before_render_template, request, template_rendered
+from werkzeug.wsgi import ClosingIterator
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 直方图分桶上限（秒），最后隐含一个 +Inf
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 路由标签保存在 WSGI environ 中，由 before_request 或视图（set_route）写入
+ROUTE_KEY = 'bearclicker.route'
+# 多进程快照文件名：metrics_<pid>_<进程首次写快照的时间>.json，PID 被复用时不会与旧文件重名
+SNAPSHOT_PATTERN = 'metrics_*.json'
+# 已退出进程的计数合计
+RETIRED_NAME = 'metrics_retired.json'
+LOCK_NAME = 'metrics.lock'
+UNMATCHED = '<unmatched>'
+METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
+METRIC_INFO = {
+    'bearclicker_http_requests_total': ('counter', 'HTTP requests by route, method and status'),
+    'bearclicker_http_request_duration_seconds': ('histogram', 'Request latency by route'),
+    'bearclicker_phase_duration_seconds': ('histogram', 'Time spent loading data and rendering templates per request'),
+    'bearclicker_cache_hits_total': ('counter', 'Cache hits by cache'),
+    'bearclicker_cache_misses_total': ('counter', 'Cache misses by cache'),
+    'bearclicker_cache_hit_ratio': ('gauge', 'hits / (hits + misses) by cache'),
+    'bearclicker_lookups_total': ('counter', 'Slug and game id lookups by kind'),
+    'bearclicker_lookup_misses_total': ('counter', 'Slug and game id lookups that returned 404'),
+}
+
+
+def set_route(label):
+    """覆盖当前请求的路由标签，例如把通配路由 /<slug> 细分成具体页面；标签值必须来自固定集合，不能直接使用请求参数"""
+    request.environ[ROUTE_KEY] = label
+
+
+class _Shard:
+    """单个线程的计数，只由所属线程写入"""
+
+    __slots__ = ('thread', 'counters', 'histograms')
+
+    def __init__(self, thread=None):
+        self.thread = thread
+        self.counters = {}
+        self.histograms = {}
+
+    def alive(self):
+        thread = self.thread and self.thread()
+        return thread is not None and thread.is_alive()
+
+
+def _merge(counters, histograms, shard_counters, shard_histograms):
+    for key, value in shard_counters.items():
+        counters[key] = counters.get(key, 0) + value
+    for key, buckets in shard_histograms.items():
+        total = histograms.get(key)
+        if total is None:
+            histograms[key] = list(buckets)
+        else:
+            for i, value in enumerate(buckets):
+                total[i] += value
+
+
+class Metrics:
+    """
+    进程内指标注册表
+
+    Args:
+        multiproc_dir (str): 多进程模式下保存各进程快照的目录，为空时只导出本进程的数据
+        flush_interval (float): 多进程模式下每个进程最多每隔多少秒写一次快照
+        server_timing (bool): 是否在响应中输出 Server-Timing 头
+    """
+
+    def __init__(self, multiproc_dir=None, flush_interval=5.0, server_timing=True):
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self.server_timing = server_timing
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        self._flush_lock = threading.Lock()
+        self._pid = None
+        self._snapshot_path = None
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _Shard(weakref.ref(threading.current_thread()))
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, name, labels=(), value=1):
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, labels, seconds):
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = histograms.get(key)
+        if buckets is None:
+            # 各分桶的计数（最后一个是 +Inf），末尾再放总和
+            buckets = histograms[key] = [0] * (len(BUCKETS) + 1) + [0.0]
+        buckets[bisect_left(BUCKETS, seconds)] += 1
+        buckets[-1] += seconds
+
+    def add_collector(self, collector):
+        """
+        注册导出时调用的统计函数
+
+        Args:
+            collector (callable): 返回 [(指标名, 标签元组, 累计值), ...]，值按计数器处理
+        """
+        self._collectors.append(collector)
+
+    @contextmanager
+    def phase(self, name):
+        """记录当前请求中某个阶段（data_load、render 等）的耗时，不在请求中时不做任何事"""
+        phases = getattr(self._local, 'phases', None)
+        if phases is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - started
+
+    def timed(self, name):
+        """phase 的装饰器形式"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.phase(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _render_started(self, sender, **extra):
+        phases = getattr(self._local, 'phases', None)
+        if phases is not None:
+            self._local.render_started = time.perf_counter()
+
+    def _render_finished(self, sender, **extra):
+        phases = getattr(self._local, 'phases', None)
+        started = getattr(self._local, 'render_started', None)
+        if phases is not None and started is not None:
+            phases['render'] = phases.get('render', 0.0) + time.perf_counter() - started
+            self._local.render_started = None
+
+    def begin_request(self):
+        phases = self._local.phases = {}
+        return phases
+
+    def end_request(self, environ, status, started, phases):
+        route = environ.get(ROUTE_KEY, UNMATCHED)
+        method = environ.get('REQUEST_METHOD', 'GET')
+        if method not in METHODS:
+            method = 'OTHER'
+        self.inc('bearclicker_http_requests_total', (('route', route), ('method', method), ('status', status)))
+        self.observe('bearclicker_http_request_duration_seconds', (('route', route),),
+                     time.perf_counter() - started)
+        for name, seconds in phases.items():
+            self.observe('bearclicker_phase_duration_seconds', (('route', route), ('phase', name)), seconds)
+        if getattr(self._local, 'phases', None) is phases:
+            self._local.phases = None
+        if self.multiproc_dir and time.monotonic() - self._flushed_at >= self.flush_interval:
+            self.flush()
+
+    def snapshot(self):
+        """
+        合并本进程所有线程的计数和 collector 的统计
+
+        Returns:
+            tuple: (counters, histograms)，key 都是 (指标名, 标签元组)
+        """
+        counters = {}
+        histograms = {}
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                if shard.alive():
+                    live.append(shard)
+                else:
+                    # 线程已退出，不会再写入，把计数并进 retired 后丢弃分片
+                    _merge(self._retired.counters, self._retired.histograms, shard.counters, shard.histograms)
+            self._shards = live
+            _merge(counters, histograms, self._retired.counters, self._retired.histograms)
+            for shard in live:
+                # dict.copy() 在 CPython 中不会被其他线程的写入打断
+                _merge(counters, histograms, shard.counters.copy(), shard.histograms.copy())
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                counters[(name, labels)] = counters.get((name, labels), 0) + value
+        return counters, histograms
+
+    def _own_snapshot_path(self):
+        # 按当前 PID 决定文件名：preload 模式下 Metrics 在 master 中创建，fork 出的每个 worker 各用各的文件
+        pid = os.getpid()
+        if self._pid != pid:
+            self._pid = pid
+            self._snapshot_path = os.path.join(self.multiproc_dir, f'metrics_{pid}_{time.time_ns()}.json')
+        return self._snapshot_path
+
+    def flush(self):
+        """多进程模式下把本进程的快照原子地写入 multiproc_dir"""
+        if not self.multiproc_dir or not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            self._flushed_at = time.monotonic()
+            counters, histograms = self.snapshot()
+            os.makedirs(self.multiproc_dir, exist_ok=True)
+            _write_snapshot(self._own_snapshot_path(), counters, histograms)
+        finally:
+            self._flush_lock.release()
+
+    def _retire(self, path, retired):
+        """把已退出进程的快照并入 retired 并写回 RETIRED_NAME 后删除该快照（调用方持有目录锁）"""
+        data = _read_snapshot(path)
+        if data is not None:
+            _merge(retired[0], retired[1], *data)
+            _write_snapshot(os.path.join(self.multiproc_dir, RETIRED_NAME), *retired)
+        _remove(path)
+
+    def collect(self):
+        """
+        返回要导出的数据：单进程模式下是本进程快照，多进程模式下是目录中所有进程快照的合计
+
+        进程已不存在的快照（以及本进程 PID 上残留的旧进程快照）在目录锁内并入 RETIRED_NAME 后删除，
+        读取也在同一把锁内完成，所以 worker 退出或被回收后合计值不会下降。
+        """
+        if not self.multiproc_dir:
+            return self.snapshot()
+        self.flush()
+        counters = {}
+        histograms = {}
+        with _directory_lock(self.multiproc_dir):
+            retired = _read_snapshot(os.path.join(self.multiproc_dir, RETIRED_NAME)) or ({}, {})
+            for path in glob.glob(os.path.join(self.multiproc_dir, SNAPSHOT_PATTERN)):
+                pid = _snapshot_pid(path)
+                if pid is None:
+                    continue
+                if not _pid_alive(pid) or (pid == os.getpid() and path != self._snapshot_path):
+                    self._retire(path, retired)
+                    continue
+                data = _read_snapshot(path)
+                if data is not None:
+                    _merge(counters, histograms, *data)
+            _merge(counters, histograms, *retired)
+        return counters, histograms
+
+    def exposition(self):
+        """Prometheus 文本格式（0.0.4）"""
+        counters, histograms = self.collect()
+        hits = {labels: value for (name, labels), value in counters.items() if name == 'bearclicker_cache_hits_total'}
+        for (name, labels), value in list(counters.items()):
+            if name == 'bearclicker_cache_misses_total':
+                total = hits.get(labels, 0) + value
+                if total:
+                    counters[('bearclicker_cache_hit_ratio', labels)] = hits.get(labels, 0) / total
+
+        series = defaultdict(list)
+        for (name, labels), value in counters.items():
+            series[name].append((labels, value))
+        for (name, labels), buckets in histograms.items():
+            series[name].append((labels, buckets))
+
+        lines = []
+        for name in sorted(series):
+            metric_type, help_text = METRIC_INFO.get(name, ('untyped', name))
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for labels, value in sorted(series[name], key=lambda item: item[0]):
+                pairs = _format_pairs(labels)
+                if metric_type != 'histogram':
+                    lines.append(f'{name}{{{pairs}}} {_format_value(value)}' if pairs
+                                 else f'{name} {_format_value(value)}')
+                    continue
+                prefix = f'{name}_bucket{{{pairs},le="' if pairs else f'{name}_bucket{{le="'
+                cumulative = 0
+                for bound, count in zip(_BUCKET_BOUNDS, value):
+                    cumulative += count
+                    lines.append(f'{prefix}{bound}"}} {cumulative}')
+                suffix = f'{{{pairs}}}' if pairs else ''
+                lines.append(f'{name}_sum{suffix} {_format_value(value[-1])}')
+                lines.append(f'{name}_count{suffix} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+    def init_app(self, app):
+        """包装 app.wsgi_app，并注册路由标签和模板渲染计时"""
+        @app.before_request
+        def _set_route_label():
+            rule = request.url_rule
+            request.environ.setdefault(ROUTE_KEY, rule.rule if rule is not None else UNMATCHED)
+
+        before_render_template.connect(self._render_started, app, weak=False)
+        template_rendered.connect(self._render_finished, app, weak=False)
+        app.wsgi_app = MetricsMiddleware(app.wsgi_app, self)
+        if self.multiproc_dir:
+            # 退出前写出最终计数，之后由存活的 worker 并入 retired 快照
+            atexit.register(self.flush)
+
+
+def server_timing_header(phases, elapsed):
+    """
+    Server-Timing 头：各阶段耗时和发送响应头之前的总耗时（app），单位毫秒
+
+    阶段之间可以嵌套（例如 trending 包含在 render 中），不能简单相加。
+    """
+    parts = [f'{name};dur={seconds * 1e3:.2f}' for name, seconds in phases.items()]
+    parts.append(f'app;dur={elapsed * 1e3:.2f}')
+    return ', '.join(parts)
+
+
+def _snapshot_pid(path):
+    """快照文件名中的 PID，文件名不符合 metrics_<pid>_<时间>.json 时返回 None"""
+    parts = os.path.basename(path)[:-len('.json')].split('_')
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    return int(parts[1])
+
+
+def _pid_alive(pid):
+    """本机上是否存在该 PID 的进程（multiproc_dir 只在同一台机器的 worker 之间共享）"""
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        # EPERM：进程存在但属于其他用户
+        return e.errno == errno.EPERM
+    return True
+
+
+def _read_snapshot(path):
+    """读取快照文件，返回 (counters, histograms)，文件不存在或损坏时返回 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return (
+        {(name, tuple(map(tuple, labels))): value for name, labels, value in data['counters']},
+        {(name, tuple(map(tuple, labels))): buckets for name, labels, buckets in data['histograms']},
+    )
+
+
+def _write_snapshot(path, counters, histograms):
+    data = {
+        'counters': [[name, labels, value] for (name, labels), value in counters.items()],
+        'histograms': [[name, labels, buckets] for (name, labels), buckets in histograms.items()],
+    }
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _directory_lock(directory):
+    """multiproc_dir 上的进程间互斥锁；没有 fcntl 的平台上不加锁"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, LOCK_NAME), 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+_BUCKET_BOUNDS = tuple(repr(bound) for bound in BUCKETS) + ('+Inf',)
+
+
+@lru_cache(maxsize=4096)
+def _format_pairs(labels):
+    return ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"'))
+        for key, value in labels
+    )
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class MetricsMiddleware:
+    """记录每个请求的路由、状态码和耗时（到响应体迭代结束为止）"""
+
+    def __init__(self, wsgi_app, metrics):
+        self.wsgi_app = wsgi_app
+        self.metrics = metrics
+
+    def __call__(self, environ, start_response):
+        started = time.perf_counter()
+        phases = self.metrics.begin_request()
+        status = []
+
+        def _start_response(status_line, headers, exc_info=None):
+            status.append(status_line.split(' ', 1)[0])
+            if self.metrics.server_timing:
+                headers = list(headers)
+                headers.append(('Server-Timing', server_timing_header(phases, time.perf_counter() - started)))
+            return start_response(status_line, headers, exc_info)
+
+        try:
+            app_iter = self.wsgi_app(environ, _start_response)
+        except Exception:
+            self.metrics.end_request(environ, '500', started, phases)
+            raise
+        return ClosingIterator(app_iter, lambda: self.metrics.end_request(
+            environ, status[-1] if status else '500', started, phases))
+
+
+def cache_collector(sources):
+    """
+    把若干 stats() 函数转换成 collector
+
+    Args:
+        sources (dict): 缓存名 -> 返回 {'hits', 'misses', ...} 的函数
+    """
+    def collect():
+        for cache, stats in sources.items():
+            data = stats()
+            labels = (('cache', cache),)
+            yield 'bearclicker_cache_hits_total', labels, data['hits']
+            yield 'bearclicker_cache_misses_total', labels, data['misses']
+    return collect
+
+
+def lookup_collector(miss_counter):
+    """把 MissCounter 的统计转换成 collector"""
+    def collect():
+        for kind, data in miss_counter.stats().items():
+            labels = (('kind', kind),)
+            yield 'bearclicker_lookups_total', labels, data['lookups']
+            yield 'bearclicker_lookup_misses_total', labels, data['misses']
+    return collect
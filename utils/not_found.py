@@ -0,0 +1,95 @@
+"""
+未知 id / slug 的快速 404
+
+- 合法的游戏 id 和页面 slug 预先放进 frozenset，未命中时不再进入页面缓存或渲染流程
+- 404 页面按数据版本只渲染一次，之后只把请求路径（base.html 中的 canonical / og:url）拼进预渲染的片段
+- MissCounter 按类型统计查找次数和未命中次数，用于观察扫描器和失效链接的比例
+"""
+import threading
+from collections import Counter
+
+from flask import current_app, request
+from markupsafe import escape
+
+# 预渲染时使用的占位路径，响应时替换成转义后的真实路径
+PATH_MARKER = '/__not_found_path__'
+
+
+class _PathOverride:
+    """
+    预渲染时模板中的 request：path 换成占位路径，其余属性取自当前请求
+
+    不另开 test_request_context：嵌套的请求上下文出栈时会执行全部 teardown_request，
+    把外层请求的状态（例如日志的 request_id）一并清掉。
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __getattr__(self, name):
+        return getattr(request, name)
+
+
+class MissCounter:
+    """按类型（slug、game、other 等）统计查找和未命中次数"""
+
+    def __init__(self):
+        self._lookups = Counter()
+        self._misses = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind, hit):
+        with self._lock:
+            self._lookups[kind] += 1
+            if not hit:
+                self._misses[kind] += 1
+
+    def stats(self):
+        """
+        Returns:
+            dict: 类型 -> {'lookups', 'misses', 'miss_rate'}
+        """
+        with self._lock:
+            return {
+                kind: {
+                    'lookups': lookups,
+                    'misses': self._misses[kind],
+                    'miss_rate': self._misses[kind] / lookups,
+                }
+                for kind, lookups in self._lookups.items()
+            }
+
+
+miss_counter = MissCounter()
+
+
+class NotFoundPage:
+    """
+    按数据版本缓存的 404 页面
+
+    Args:
+        watched (WatchedFiles): 模板和数据文件的版本
+        render (callable): render(**context) 渲染 404 页面并返回 HTML 字符串，context 需要传给模板
+    """
+
+    def __init__(self, watched, render):
+        self.watched = watched
+        self.render = render
+        self._version = None
+        self._segments = None
+        self._lock = threading.Lock()
+
+    def segments(self):
+        """当前数据版本的 404 页面，按请求路径切分成字节片段"""
+        version, _ = self.watched.version()
+        if self._version != version:
+            with self._lock:
+                if self._version != version:
+                    html = self.render(request=_PathOverride(PATH_MARKER))
+                    self._segments = html.encode('utf-8').split(PATH_MARKER.encode('utf-8'))
+                    self._version = version
+        return self._segments
+
+    def response(self):
+        path = str(escape(request.path)).encode('utf-8')
+        return current_app.response_class(path.join(self.segments()), status=404, mimetype='text/html')
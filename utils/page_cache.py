@@ -0,0 +1,176 @@
+"""
+渲染结果缓存
+
+游戏页面对同一份模板、FAQ 和翻译数据总是渲染出相同的 HTML，所以：
+- WatchedFiles 定期对模板目录和数据文件做一次 stat，得到当前的“数据版本”
+- PageCache 以 (请求路径, 数据版本) 为 key 缓存渲染好的响应体，按条数和字节数做 LRU 淘汰
+- 响应带强 ETag 和 Last-Modified，命中 If-None-Match / If-Modified-Since 时直接返回 304
+- gzip / br 版本在放入缓存时生成，每个数据版本只压缩一次，之后按 Accept-Encoding 直接返回
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import make_response, request
+
+from utils.compression import MIN_SIZE, compress_variants, encoded_response, is_compressible
+
+
+class WatchedFiles:
+    """
+    一组输入文件的版本号
+
+    为了让缓存命中只需要一次字典查找，最多每 check_interval 秒才重新 stat 一次文件。
+    """
+
+    def __init__(self, directories=(), files=(), check_interval=1.0):
+        self.directories = list(directories)
+        self.files = list(files)
+        self.check_interval = check_interval
+        self._checked_at = 0.0
+        self._version = None
+        self._last_modified = None
+        self._lock = threading.Lock()
+
+    def _scan(self):
+        signatures = []
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    signatures.append((entry.path, st.st_mtime_ns, st.st_size))
+        for path in self.files:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            signatures.append((path, st.st_mtime_ns, st.st_size))
+        signatures.sort()
+        version = hashlib.sha1(repr(signatures).encode('utf-8')).hexdigest()[:16]
+        newest = max((mtime for _, mtime, _ in signatures), default=0)
+        return version, datetime.fromtimestamp(newest / 1e9, tz=timezone.utc)
+
+    def version(self):
+        """
+        Returns:
+            tuple: (版本号, 最新修改时间)
+        """
+        now = time.monotonic()
+        if self._version is None or now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if self._version is None or now - self._checked_at >= self.check_interval:
+                    self._version, self._last_modified = self._scan()
+                    self._checked_at = now
+        return self._version, self._last_modified
+
+
+class CachedPage:
+    __slots__ = ('body', 'mimetype', 'etag', 'last_modified', 'variants')
+
+    def __init__(self, body, mimetype, etag, last_modified, variants=None):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = etag
+        self.last_modified = last_modified
+        self.variants = variants or {}
+
+    @property
+    def size(self):
+        return len(self.body) + sum(len(data) for data in self.variants.values())
+
+
+class PageCache:
+    """按 (路径, 数据版本) 缓存渲染结果的 LRU 缓存"""
+
+    # 运行时首次渲染要等压缩完成，brotli 用较低的质量换取速度
+    gzip_level = 9
+    brotli_quality = 6
+
+    def __init__(self, watched, max_entries=1000, max_bytes=100 * 1024 * 1024):
+        self.watched = watched
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            page = self._entries.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key, page):
+        size = page.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old.size
+            self._entries[key] = page
+            self._size += size
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """返回缓存统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._size,
+        }
+
+    def _respond(self, page):
+        return encoded_response(page.body, page.mimetype, page.etag, page.variants, page.last_modified)
+
+    def _compress(self, body, mimetype):
+        if len(body) < MIN_SIZE or not is_compressible(mimetype):
+            return None
+        return compress_variants(body, self.gzip_level, self.brotli_quality)
+
+    def cached(self, view):
+        """
+        视图装饰器：缓存 200 响应，其余状态码（404、重定向等）照常返回
+
+        视图输出只能依赖请求路径，不能依赖查询参数、cookie 或 session。
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version, last_modified = self.watched.version()
+            key = (request.path, version)
+            page = self.get(key)
+            if page is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                body = response.get_data()
+                page = CachedPage(body, response.mimetype, hashlib.sha1(body).hexdigest(),
+                                  last_modified, self._compress(body, response.mimetype))
+                self.put(key, page)
+            return self._respond(page)
+        return wrapper
@@ -0,0 +1,231 @@
+"""
+按请求开启的性能剖析
+
+只有带合法签名的请求才会被剖析，未设置 PROFILE_SECRET 时完全不安装：
+- 签名为 "<过期时间戳>.<HMAC-SHA256(secret, '<过期时间戳>:<路径>')>"，只对指定路径、在过期前有效
+- 通过请求头 X-Profile 或查询参数 __profile 传入；X-Profile-Mode / __profile_mode 选择
+  cprofile（默认，pstats 格式）或 sampling（每毫秒采样一次调用栈，输出 collapsed stack，可直接生成火焰图）
+- 剖析覆盖整个 WSGI 调用（包括响应体生成），结果保存在本地目录，
+  响应头 X-Profile-Url 给出带签名的下载地址（/__profiles/<文件名>?__profile=...）
+- 同一时间只剖析一个请求，其他带签名的请求照常处理并返回 X-Profile: busy
+
+用法：
+    python -m utils.profiling sign /cookie-clicker [--ttl 300]
+"""
+import argparse
+import cProfile
+import hashlib
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import parse_qs, quote
+
+MODES = ('cprofile', 'sampling')
+DOWNLOAD_PREFIX = '/__profiles/'
+SUFFIXES = {'cprofile': '.prof', 'sampling': '.collapsed'}
+PROFILE_NAME_PATTERN = re.compile(r'^[\w.-]+\.(prof|collapsed)$')
+
+
+def sign(secret, path, expires):
+    """生成 path 在 expires（Unix 时间戳）之前有效的签名"""
+    message = f'{expires}:{path}'.encode('utf-8')
+    signature = hmac.new(secret.encode('utf-8'), message, hashlib.sha256).hexdigest()
+    return f'{expires}.{signature}'
+
+
+def verify(secret, path, token, now=None):
+    """签名与路径匹配且未过期时返回 True"""
+    if not token or '.' not in token:
+        return False
+    expires, _ = token.split('.', 1)
+    if not expires.isdigit() or int(expires) < (now or time.time()):
+        return False
+    return hmac.compare_digest(sign(secret, path, int(expires)), token)
+
+
+class _Sampler:
+    """在后台线程中定期采样目标线程的调用栈"""
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='request-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f'{stack} {count}\n')
+
+
+class RequestProfiler:
+    """
+    WSGI 中间件：剖析带签名的单个请求
+
+    Args:
+        wsgi_app: 被包装的 WSGI 应用
+        secret (str): 签名密钥
+        directory (str): 剖析结果保存目录
+        keep (int): 最多保留的剖析文件数，超过时删除最旧的
+        download_ttl (int): 下载地址的有效期（秒）
+    """
+
+    def __init__(self, wsgi_app, secret, directory, keep=50, download_ttl=3600):
+        self.wsgi_app = wsgi_app
+        self.secret = secret
+        self.directory = directory
+        self.keep = keep
+        self.download_ttl = download_ttl
+        self._lock = threading.Lock()
+
+    def _param(self, environ, header, name):
+        value = environ.get(f"HTTP_{header.upper().replace('-', '_')}")
+        if value:
+            return value
+        values = parse_qs(environ.get('QUERY_STRING', '')).get(name)
+        return values[0] if values else None
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        token = self._param(environ, 'X-Profile', '__profile')
+        if path.startswith(DOWNLOAD_PREFIX):
+            return self._download(path, token, start_response)
+        if token is None or not verify(self.secret, path, token):
+            return self.wsgi_app(environ, start_response)
+
+        mode = self._param(environ, 'X-Profile-Mode', '__profile_mode') or 'cprofile'
+        if mode not in MODES:
+            mode = 'cprofile'
+        if not self._lock.acquire(blocking=False):
+            return self.wsgi_app(environ, self._with_headers(start_response, [('X-Profile', 'busy')]))
+        try:
+            return self._profile(environ, start_response, path, mode)
+        finally:
+            self._lock.release()
+
+    def _with_headers(self, start_response, extra):
+        def _start_response(status, headers, exc_info=None):
+            return start_response(status, list(headers) + extra, exc_info)
+        return _start_response
+
+    def _profile(self, environ, start_response, path, mode):
+        slug = re.sub(r'[^\w-]+', '-', path).strip('-') or 'index'
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{slug[:60]}-{os.urandom(3).hex()}{SUFFIXES[mode]}"
+        download = f'{DOWNLOAD_PREFIX}{name}'
+        token = sign(self.secret, download, int(time.time()) + self.download_ttl)
+        start_response = self._with_headers(start_response, [
+            ('X-Profile', mode),
+            ('X-Profile-Url', f'{download}?__profile={quote(token)}'),
+        ])
+
+        if mode == 'sampling':
+            profiler = _Sampler(threading.get_ident())
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            # 在剖析范围内生成完整的响应体
+            app_iter = self.wsgi_app(environ, start_response)
+            try:
+                body = b''.join(app_iter)
+            finally:
+                if hasattr(app_iter, 'close'):
+                    app_iter.close()
+        finally:
+            if mode == 'sampling':
+                profiler.stop()
+            else:
+                profiler.disable()
+
+        os.makedirs(self.directory, exist_ok=True)
+        profile_path = os.path.join(self.directory, name)
+        if mode == 'sampling':
+            profiler.dump(profile_path)
+        else:
+            profiler.dump_stats(profile_path)
+        self._prune()
+        return [body]
+
+    def _prune(self):
+        names = sorted(name for name in os.listdir(self.directory) if PROFILE_NAME_PATTERN.match(name))
+        for name in names[:-self.keep]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def _download(self, path, token, start_response):
+        name = path[len(DOWNLOAD_PREFIX):]
+        profile_path = os.path.join(self.directory, name)
+        if (not PROFILE_NAME_PATTERN.match(name) or not verify(self.secret, path, token)
+                or not os.path.isfile(profile_path)):
+            start_response('404 NOT FOUND', [('Content-Type', 'text/plain'), ('Cache-Control', 'no-store')])
+            return [b'Not Found']
+        with open(profile_path, 'rb') as f:
+            data = f.read()
+        start_response('200 OK', [
+            ('Content-Type', 'application/octet-stream'),
+            ('Content-Length', str(len(data))),
+            ('Content-Disposition', f'attachment; filename="{name}"'),
+            ('Cache-Control', 'no-store'),
+        ])
+        return [data]
+
+
+def profiler_from_env(wsgi_app, instance_path):
+    """
+    设置了 PROFILE_SECRET 时返回包装后的应用，否则原样返回
+
+    环境变量：PROFILE_SECRET、PROFILE_DIR（默认 instance/profiles）、PROFILE_KEEP（默认 50）
+    """
+    secret = os.getenv('PROFILE_SECRET')
+    if not secret:
+        return wsgi_app
+    directory = os.getenv('PROFILE_DIR') or os.path.join(instance_path, 'profiles')
+    return RequestProfiler(wsgi_app, secret, directory, keep=int(os.getenv('PROFILE_KEEP', '50')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sign a path for one-off request profiling')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    sign_parser = subparsers.add_parser('sign', help='print a profiling token for a path')
+    sign_parser.add_argument('path', help='request path, e.g. /cookie-clicker')
+    sign_parser.add_argument('--ttl', type=int, default=300, help='seconds until the token expires')
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    secret = os.getenv('PROFILE_SECRET')
+    if not secret:
+        parser.error('PROFILE_SECRET is not set')
+    token = sign(secret, args.path, int(time.time()) + args.ttl)
+    print(f'X-Profile: {token}')
+    print(f'{args.path}?__profile={quote(token)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+"""
+站内搜索
+
+索引覆盖每个已注册的游戏页面：
+- 标题：games.json 中的 pageTitle / title
+- 描述：页面模板中的 meta description（TDK）
+- FAQ：FAQ 存储中该页面的问题和回答
+
+BM25 评分（k1=1.2, b=0.75），各字段按权重计入词频（标题 3、描述 1.5、FAQ 1）。
+每个 (词, 页面) 的分值在建索引时算好，查询时只需对每个查询词遍历一次倒排表并累加。
+
+SiteSearch 按数据版本惰性建索引（版本变化后的第一个查询重建），
+查询结果按归一化后的查询做 LRU 缓存，索引重建时一并清空。
+
+Autocomplete 是标题 / slug 的前缀联想：建索引时为每个可能的前缀算好前 k 个结果，
+每次按键只需一次字典查找。
+"""
+import heapq
+import html
+import math
+import re
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'for', 'from', 'how', 'i', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'what', 'with', 'you', 'your',
+))
+
+FIELD_WEIGHTS = {'title': 3.0, 'description': 1.5, 'faq': 1.0}
+SNIPPET_LENGTH = 160
+
+DESCRIPTION_PATTERNS = (
+    re.compile(r'<meta\s+name="description"\s+content="([^"]*)"', re.IGNORECASE),
+    re.compile(r'{%\s*block\s+og_description\s*%}(.*?){%\s*endblock\s*%}', re.DOTALL),
+)
+JINJA_EXPRESSION = re.compile(r'{{.*?}}|{%.*?%}', re.DOTALL)
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=65536)
+def _stem(token):
+    # 只去掉常见的复数 s，让 clickers / clicker、games / game 命中同一个词
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """小写、按字母数字切分、去停用词"""
+    return [_stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def normalize_query(query):
+    """查询缓存的 key：去重、排序后的词（BM25 的结果与词序无关）"""
+    return ' '.join(sorted(set(tokenize(query))))
+
+
+def template_description(path):
+    """
+    读取页面模板中的 meta description
+
+    Returns:
+        str: 描述文本，没有找到时返回空字符串
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except OSError:
+        return ''
+    for pattern in DESCRIPTION_PATTERNS:
+        match = pattern.search(source)
+        if match:
+            text = JINJA_EXPRESSION.sub('', match.group(1))
+            return ' '.join(html.unescape(text).split())
+    return ''
+
+
+def _snippet(text):
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '…'
+
+
+class SearchIndex:
+    """
+    内存倒排索引
+
+    Args:
+        documents (list): [{'slug', 'title', 'description', 'image', 'faqs': [{'question', 'answer'}]}]
+    """
+
+    def __init__(self, documents, k1=1.2, b=0.75):
+        self.documents = [
+            {
+                'slug': doc['slug'],
+                'title': doc['title'],
+                'description': _snippet(doc.get('description') or ''),
+                'image': doc.get('image'),
+            }
+            for doc in documents
+        ]
+        frequencies = []
+        lengths = []
+        document_frequency = Counter()
+        for doc in documents:
+            fields = {
+                'title': doc['title'],
+                'description': doc.get('description') or '',
+                'faq': ' '.join(f"{faq.get('question', '')} {faq.get('answer', '')}" for faq in doc.get('faqs') or ()),
+            }
+            tf = defaultdict(float)
+            for field, text in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for token, count in Counter(tokenize(text)).items():
+                    tf[token] += weight * count
+            frequencies.append(tf)
+            lengths.append(sum(tf.values()))
+            document_frequency.update(tf.keys())
+
+        count = len(documents)
+        average_length = (sum(lengths) / count) if count else 0.0
+        idf = {term: math.log(1 + (count - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+        postings = defaultdict(list)
+        for index, (tf, length) in enumerate(zip(frequencies, lengths)):
+            norm = k1 * (1 - b + b * length / average_length) if average_length else k1
+            for term, freq in tf.items():
+                postings[term].append((index, idf[term] * freq * (k1 + 1) / (freq + norm)))
+        self.postings = {term: tuple(entries) for term, entries in postings.items()}
+
+    def __len__(self):
+        return len(self.documents)
+
+    def search(self, terms, limit=10):
+        """
+        Args:
+            terms (iterable): 已经分好的查询词
+            limit (int): 返回条数
+
+        Returns:
+            list: [{'slug', 'title', 'description', 'image', 'score'}]，按分数从高到低
+        """
+        scores = defaultdict(float)
+        for term in terms:
+            for index, score in self.postings.get(term, ()):
+                scores[index] += score
+        top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [dict(self.documents[index], score=round(score, 4)) for index, score in top]
+
+
+class SiteSearch:
+    """
+    按数据版本重建的搜索索引和查询缓存
+
+    Args:
+        watched (WatchedFiles): 模板和数据文件的版本
+        build_documents (callable): 返回 SearchIndex 所需的文档列表
+        cache_size (int): 缓存的查询数
+    """
+
+    def __init__(self, watched, build_documents, cache_size=1024):
+        self.watched = watched
+        self.build_documents = build_documents
+        self.cache_size = cache_size
+        self._index = None
+        self._version = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+    def index(self):
+        """当前数据版本的索引"""
+        version, _ = self.watched.version()
+        if self._version != version:
+            with self._build_lock:
+                if self._version != version:
+                    index = SearchIndex(self.build_documents())
+                    with self._lock:
+                        self._index = index
+                        self._version = version
+                        self._cache.clear()
+                    self.builds += 1
+        return self._index
+
+    def search(self, query, limit=10):
+        """
+        Returns:
+            list: 见 SearchIndex.search；查询中没有有效词时返回空列表
+        """
+        key = (normalize_query(query), limit)
+        if not key[0]:
+            return []
+        index = self.index()
+        with self._lock:
+            results = self._cache.get(key)
+            if results is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return results
+        results = index.search(key[0].split(), limit)
+        with self._lock:
+            self.misses += 1
+            if self._index is index:
+                self._cache[key] = results
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def stats(self):
+        """返回查询缓存统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'queries': len(self._cache),
+            'builds': self.builds,
+            'documents': len(self._index) if self._index is not None else 0,
+        }
+
+
+def normalize_prefix(text):
+    """
+    联想用的前缀：小写，连续的非字母数字字符合并成一个空格
+
+    保留结尾的空格（"cookie " 只匹配以 cookie 这个词开头的标题），因此
+    "Cookie Clicker"、"cookie-clicker" 和 "cookie clicker" 得到同一个 key。
+    """
+    return NON_ALPHANUMERIC.sub(' ', text.lower()).lstrip()
+
+
+class PrefixIndex:
+    """
+    预先算好每个前缀前 k 个结果的联想索引
+
+    每个游戏的 key 为标题、slug（- 换成空格）以及标题中每个词开始的后缀。
+    同一前缀下，标题或 slug 以它开头的游戏排在只有中间某个词匹配的游戏之前，
+    同一档内按热门程度（entries 的顺序）排序。
+
+    Args:
+        entries (list): [{'slug', 'title', 'image'}]，按热门程度从高到低
+        top_k (int): 每个前缀保留的结果数
+    """
+
+    def __init__(self, entries, top_k=8):
+        self.entries = tuple(entries)
+        self.top_k = top_k
+        candidates = defaultdict(dict)
+        for rank, entry in enumerate(self.entries):
+            title = normalize_prefix(entry['title']).rstrip()
+            words = title.split(' ')
+            keys = {title: 0, normalize_prefix(entry['slug']).rstrip(): 0}
+            for start in range(1, len(words)):
+                keys.setdefault(' '.join(words[start:]), 1)
+            for key, tier in keys.items():
+                for end in range(1, len(key) + 1):
+                    matches = candidates[key[:end]]
+                    if matches.get(rank, 2) > tier:
+                        matches[rank] = tier
+        self._top = {
+            prefix: tuple(self.entries[rank] for tier, rank in sorted((tier, rank) for rank, tier in matches.items())[:top_k])
+            for prefix, matches in candidates.items()
+        }
+
+    def __len__(self):
+        return len(self._top)
+
+    def lookup(self, prefix):
+        """
+        Args:
+            prefix (str): 已经用 normalize_prefix 处理过的前缀
+
+        Returns:
+            tuple: 最多 top_k 个 entry，没有匹配时为空
+        """
+        return self._top.get(prefix, ())
+
+
+class Autocomplete:
+    """
+    按数据版本重建的前缀联想
+
+    Args:
+        watched (WatchedFiles): 模板和数据文件的版本
+        build_entries (callable): 返回 PrefixIndex 所需的 entries
+        top_k (int): 每个前缀返回的结果数
+    """
+
+    def __init__(self, watched, build_entries, top_k=8):
+        self.watched = watched
+        self.build_entries = build_entries
+        self.top_k = top_k
+        self._index = None
+        self._version = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def index(self):
+        """当前数据版本的前缀索引"""
+        version, _ = self.watched.version()
+        if self._version != version:
+            with self._lock:
+                if self._version != version:
+                    self._index = PrefixIndex(self.build_entries(), self.top_k)
+                    self._version = version
+                    self.builds += 1
+        return self._index
+
+    def suggest(self, query):
+        """返回以 query 为前缀的前 top_k 个游戏"""
+        prefix = normalize_prefix(query)
+        if not prefix:
+            return ()
+        return self.index().lookup(prefix)
@@ -0,0 +1,172 @@
+"""
+Jinja 模板字节码缓存
+
+冷启动时每个 lambda 都要重新编译 base.html、components/* 和被访问的页面模板。
+precompile() 在构建时把 templates/ 下的所有模板编译成字节码写入缓存目录，
+install() 在运行时让 app.jinja_env 从该目录加载，命中时跳过解析和编译。
+
+- 缓存 key 只取模板名，编译时的文件名取相对仓库根目录的路径，字节码中不含构建机的绝对路径
+- 每个缓存文件记录模板源码的校验值，模板改动后旧字节码自动失效
+- 预编译是增量的：源码未变的模板保留原文件不重写，已删除模板的缓存文件被清除，
+  重复运行不会产生无意义的二进制改动
+- 字节码与 Python 小版本绑定：预编译时在 manifest.json 中记录 Python 和 Jinja 版本以及
+  各模板（按相对模板目录的名字）的源码校验值，运行时版本不一致就不启用缓存
+  （仓库中的 jinja_cache/ 用 vercel.json 中的 python3.9 生成）
+- 缓存目录只读（如 Vercel）时不写回，只读取
+
+用法：
+    python3.9 -m utils.template_cache [--dir jinja_cache] [--force]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from hashlib import sha1
+
+import jinja2
+from jinja2 import FileSystemBytecodeCache, TemplateSyntaxError
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, 'jinja_cache')
+MANIFEST_NAME = 'manifest.json'
+
+
+def runtime_versions():
+    """决定字节码能否复用的版本：Python 小版本和 Jinja 版本"""
+    return {'python': '%d.%d' % sys.version_info[:2], 'jinja2': jinja2.__version__}
+
+
+class PrecompiledBytecodeCache(FileSystemBytecodeCache):
+    """以模板名为 key 的文件字节码缓存"""
+
+    def __init__(self, directory):
+        super().__init__(directory, '%s.cache')
+
+    def get_cache_key(self, name, filename=None):
+        return sha1(name.encode('utf-8')).hexdigest()
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            # 只读文件系统上只读取预编译结果
+            pass
+
+
+def cache_dir():
+    return os.getenv('JINJA_BYTECODE_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+
+def install(app, directory=None):
+    """
+    让应用从预编译目录加载模板字节码
+
+    目录不存在、设置了 JINJA_BYTECODE_CACHE=0，或 manifest.json 记录的版本与当前运行环境不一致时不启用。
+
+    Returns:
+        bool: 是否启用
+    """
+    directory = directory or cache_dir()
+    if os.getenv('JINJA_BYTECODE_CACHE', '1') == '0' or not os.path.isdir(directory):
+        return False
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            built = json.load(f)
+    except (OSError, ValueError):
+        built = {}
+    current = runtime_versions()
+    if any(built.get(key) != value for key, value in current.items()):
+        logger.info(f"Template bytecode in {directory} was built for {built or 'an unknown version'}, "
+                    f"running {current}; compiling templates on demand")
+        return False
+    app.jinja_env.bytecode_cache = PrecompiledBytecodeCache(directory)
+    return True
+
+
+def _relative_filename(filename):
+    # 写进字节码（回溯信息）的文件名：仓库内的模板取相对路径
+    if filename and os.path.isabs(filename) and filename.startswith(ROOT_DIR + os.sep):
+        return os.path.relpath(filename, ROOT_DIR).replace(os.sep, '/')
+    return filename
+
+
+def precompile(app, directory=None, force=False):
+    """
+    编译 templates/ 下的模板并写入字节码缓存目录
+
+    源码和运行版本都没变的模板保留已有的缓存文件；已不存在的模板的缓存文件被删除。
+
+    Args:
+        app: Flask 应用
+        directory (str): 缓存目录，默认 JINJA_BYTECODE_CACHE_DIR 或仓库下的 jinja_cache/
+        force (bool): 清空目录后全部重新编译
+
+    Returns:
+        dict: {'compiled': 数量, 'unchanged': 数量, 'removed': 数量, 'failed': {模板名: 错误信息}}
+    """
+    directory = directory or cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    cache = PrecompiledBytecodeCache(directory)
+    if force:
+        cache.clear()
+
+    env = app.jinja_env
+    summary = {'compiled': 0, 'unchanged': 0, 'removed': 0, 'failed': {}}
+    checksums = {}
+    for name in env.list_templates(extensions=['html', 'xml', 'txt']):
+        try:
+            source, filename, _ = env.loader.get_source(env, name)
+            # 已有缓存的校验值和版本标记都匹配时 get_bucket 会载入字节码
+            bucket = cache.get_bucket(env, name, filename, source)
+            if bucket.code is not None:
+                summary['unchanged'] += 1
+            else:
+                bucket.code = env.compile(source, name, _relative_filename(filename))
+                cache.set_bucket(bucket)
+                summary['compiled'] += 1
+        except TemplateSyntaxError as e:
+            summary['failed'][name] = str(e)
+            logger.warning(f"Failed to compile {name}: {e}")
+            continue
+        checksums[name] = bucket.checksum
+
+    keep = {os.path.join(directory, cache.pattern % cache.get_cache_key(name)) for name in checksums}
+    for entry in os.listdir(directory):
+        path = os.path.join(directory, entry)
+        if entry.endswith('.cache') and path not in keep:
+            os.remove(path)
+            summary['removed'] += 1
+
+    manifest = json.dumps(dict(runtime_versions(), templates=checksums), indent=2, sort_keys=True) + '\n'
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current != manifest:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(manifest)
+    logger.info(f"Precompiled {summary['compiled']} templates into {directory} "
+                f"({summary['unchanged']} unchanged, {summary['removed']} removed)")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile Jinja templates into a bytecode cache')
+    parser.add_argument('--dir', default=None, help='cache directory (default: JINJA_BYTECODE_CACHE_DIR or jinja_cache/)')
+    parser.add_argument('--force', action='store_true', help='recompile every template')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    from app import app
+    summary = precompile(app, args.dir, force=args.force)
+    if summary['failed']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
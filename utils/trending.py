@@ -0,0 +1,205 @@
+"""
+热门游戏卡片区
+
+卡片数据来自 games.json，整块 HTML 只在数据版本（games.json、卡片模板、封面图目录等）或翻译变化时渲染一次；
+每个页面排除自己的卡片时只做两次字符串切片，不需要重新渲染整个网格。
+
+页面只输出前 initial_cards 张卡片，其余卡片由前端滚动到底部时通过 /api/games 分页加载。
+"""
+import os
+import threading
+from contextlib import nullcontext
+from types import MappingProxyType
+
+from flask import current_app, url_for
+from jinja2 import pass_context
+from markupsafe import Markup
+
+from utils.data_cache import data_cache
+
+_NO_TRANSLATIONS = MappingProxyType({})
+
+
+CATALOG_FIELDS = ('id', 'title', 'thumbnail')
+
+
+class _Grid:
+    __slots__ = ('version', 'catalog', 'trending', 'html', 'spans', 'cards', 'index')
+
+    def __init__(self, version, catalog, trending, html, spans, cards):
+        self.version = version
+        self.catalog = catalog
+        self.trending = trending
+        self.html = html
+        self.spans = spans
+        self.cards = cards
+        self.index = {card['slug']: i for i, card in enumerate(cards)}
+
+
+class TrendingGrid:
+    """
+    由游戏目录生成的热门游戏卡片
+
+    Args:
+        games_json_path (str): games.json 路径
+        images_dir (str): 游戏封面图目录，用于判断封面是 .jpg 还是 .png
+        pages (Mapping): 已注册的游戏页面（slug -> 页面信息），没有详情页的游戏不会出现在网格里
+        initial_cards (int): 页面首屏直接输出的卡片数，0 表示全部输出（静态导出时使用）
+        watched (WatchedFiles): 可选，模板和封面图目录等输入文件的版本，变化时重新渲染网格
+    """
+
+    card_template = 'components/trending_card.html'
+
+    def __init__(self, games_json_path, images_dir, pages, initial_cards=0, watched=None, cache=data_cache):
+        self.games_json_path = games_json_path
+        self.images_dir = images_dir
+        self.pages = pages
+        self.initial_cards = initial_cards
+        self.watched = watched
+        self._cache = cache
+        self._grid = None
+        self._lock = threading.Lock()
+
+    def _image_filename(self, slug, image_files):
+        for ext in ('.jpg', '.png'):
+            if f"{slug}{ext}" in image_files:
+                return f"{slug}{ext}"
+        return f"{slug}.jpg"
+
+    def catalog_cards(self, catalog, trending=_NO_TRANSLATIONS):
+        """
+        按 games.json 顺序生成卡片数据
+
+        Returns:
+            list: [{'slug', 'title', 'image'}]，image 为 static 目录下的相对路径
+        """
+        try:
+            image_files = set(os.listdir(self.images_dir))
+        except OSError:
+            image_files = set()
+
+        cards = []
+        for game in catalog.get('games', ()):
+            slug = game.get('id')
+            if slug not in self.pages:
+                continue
+            title = game.get('pageTitle') or game.get('title') or slug
+            cards.append({
+                'slug': slug,
+                'title': trending.get(slug.replace('-', '_'), title),
+                'image': f"images/games/{self._image_filename(slug, image_files)}",
+            })
+        return cards
+
+    def _build(self, version, catalog, trending):
+        template = current_app.jinja_env.get_template(self.card_template)
+        cards = self.catalog_cards(catalog, trending)
+        parts = []
+        spans = {}
+        offset = 0
+        for card in cards:
+            html = template.render(
+                slug=card['slug'],
+                title=card['title'],
+                image_url=url_for('static', filename=card['image']),
+            ) + '\n'
+            spans[card['slug']] = (offset, offset + len(html))
+            parts.append(html)
+            offset += len(html)
+        return _Grid(version, catalog, trending, ''.join(parts), spans, cards)
+
+    def _stale(self, grid, version, catalog, trending):
+        return grid is None or grid.version != version or grid.catalog is not catalog or grid.trending is not trending
+
+    def grid(self, translations=None):
+        """返回当前数据版本的网格，输入文件、games.json 或翻译变化时重新构建"""
+        version = self.watched.version()[0] if self.watched is not None else None
+        catalog = self._cache.get(self.games_json_path)
+        trending = (translations or {}).get('trending') or _NO_TRANSLATIONS
+        grid = self._grid
+        if self._stale(grid, version, catalog, trending):
+            with self._lock:
+                grid = self._grid
+                if self._stale(grid, version, catalog, trending):
+                    grid = self._grid = self._build(version, catalog, trending)
+        return grid
+
+    def _window(self, grid, current_page):
+        """首屏输出的卡片数量（包含会被排除的当前页面卡片）"""
+        count = len(grid.cards)
+        limit = self.initial_cards
+        if not limit or limit >= count:
+            return count
+        # 当前页面的卡片在首屏范围内时多取一张，保证首屏仍有 limit 张
+        index = grid.index.get(current_page)
+        if index is not None and index < limit:
+            return min(limit + 1, count)
+        return limit
+
+    def render(self, current_page=None, translations=None):
+        """
+        返回首屏卡片区 HTML，排除 current_page 对应的卡片
+
+        Returns:
+            Markup: 可直接输出到模板的 HTML
+        """
+        grid = self.grid(translations)
+        if not grid.cards:
+            return Markup('')
+        window = self._window(grid, current_page)
+        html = grid.html[:grid.spans[grid.cards[window - 1]['slug']][1]]
+        span = grid.spans.get(current_page) if isinstance(current_page, str) else None
+        if span is None or span[1] > len(html):
+            return Markup(html)
+        start, end = span
+        return Markup(html[:start] + html[end:])
+
+    def cursor(self, current_page=None, translations=None):
+        """
+        首屏之后继续加载的游标
+
+        Returns:
+            str | None: 首屏最后一张卡片的 slug，全部卡片都已输出时为 None
+        """
+        grid = self.grid(translations)
+        window = self._window(grid, current_page)
+        if window >= len(grid.cards):
+            return None
+        return grid.cards[window - 1]['slug']
+
+    def page(self, cursor=None, limit=48, translations=None):
+        """
+        按游标分页读取卡片
+
+        Args:
+            cursor (str): 上一页最后一张卡片的 slug，为空时从头开始
+            limit (int): 每页卡片数
+
+        Returns:
+            tuple: (卡片列表, 下一页游标)，没有下一页时游标为 None
+
+        Raises:
+            KeyError: 游标不是目录里的游戏
+        """
+        grid = self.grid(translations)
+        start = grid.index[cursor] + 1 if cursor else 0
+        cards = grid.cards[start:start + limit]
+        next_cursor = cards[-1]['slug'] if cards and start + limit < len(grid.cards) else None
+        return cards, next_cursor
+
+    def template_global(self, timer=None):
+        """
+        注册为 Jinja 全局函数：{{ trending_cards(current_page) }} 和 {{ trending_cursor(current_page) }}
+
+        Args:
+            timer (callable): 可选，timer('trending') 返回计时用的上下文管理器
+        """
+        @pass_context
+        def trending_cards(context, current_page=None):
+            with timer('trending') if timer else nullcontext():
+                return self.render(current_page, context.get('translations'))
+
+        @pass_context
+        def trending_cursor(context, current_page=None):
+            return self.cursor(current_page, context.get('translations'))
+        return {'trending_cards': trending_cards, 'trending_cursor': trending_cursor}